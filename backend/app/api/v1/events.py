@@ -0,0 +1,89 @@
+import asyncio
+import logging
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.core.auth import get_current_user, AuthenticatedUser
+from app.core.config import settings
+from app.core.events import Subscription, event_bus
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+# Client reconnect delay (milliseconds) announced at the start of a stream
+RETRY_MS = 3000
+
+
+async def _event_stream(subscription: Subscription, keepalive: float) -> AsyncIterator[str]:
+    """Format a subscription as Server-Sent Events until it is closed.
+
+    A comment line is sent when nothing happened for `keepalive` seconds,
+    so proxies keep the connection open.
+    """
+    yield f"retry: {RETRY_MS}\n\n"
+    while True:
+        try:
+            payload = await subscription.next(keepalive)
+        except asyncio.TimeoutError:
+            yield ": keepalive\n\n"
+            continue
+        if payload is None:
+            return
+        yield f"data: {payload}\n\n"
+
+
+class EventStreamResponse(StreamingResponse):
+    """SSE response that owns its subscription.
+
+    The subscription is released when the response finishes for any
+    reason, including a client that disconnects before the first event
+    (a generator that never started would not run its own cleanup).
+    """
+
+    def __init__(self, subscription: Subscription, keepalive: float):
+        super().__init__(
+            _event_stream(subscription, keepalive),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                # Disable proxy buffering (nginx) so events are not held back
+                "X-Accel-Buffering": "no",
+            },
+        )
+        self.subscription = subscription
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            event_bus.unsubscribe(self.subscription)
+
+
+@router.get("")
+async def stream_events(user: AuthenticatedUser = Depends(get_current_user)):
+    """
+    Stream the current user's progress and note changes as Server-Sent Events.
+    Each event's data is JSON: {"type": "progress" | "note", "data": row},
+    with the row as returned by the write that caused it. Delivery is best
+    effort; after reconnecting, clients catch up with GET /progress?since=
+    and GET /notes?since=.
+
+    Authenticated like every other route (Authorization: Bearer). Browsers
+    read the stream with fetch (api.subscribeEvents in the frontend), since
+    EventSource cannot send request headers.
+
+    Returns:
+        A text/event-stream response that stays open
+    """
+    subscription = event_bus.subscribe(user.id)
+    if subscription is None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many open event streams",
+        )
+
+    return EventStreamResponse(subscription, settings.events_keepalive_interval)
@@ -1,20 +1,64 @@
 import logging
 from typing import List
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
 
-from app.core.supabase import get_supabase
-from app.models.schemas import NodeResponse
+from app.core.cache import catalog_cache
+from app.core.catalog import CatalogEntry, conditional_response
+from app.core.snapshot import snapshot_response
+from app.core.supabase import execute, get_supabase
+from app.models.schemas import NodeResponse, NodeSummary
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Nodes"])
 
+# Columns selected for the graph projection; must match NodeSummary
+_SUMMARY_COLUMNS = "id, title, order_index, svg_x, svg_y"
+
+# Response models applied once per cache fill (see CatalogEntry)
+_NODE_LIST = TypeAdapter(List[NodeResponse])
+_NODE_SUMMARY_LIST = TypeAdapter(List[NodeSummary])
+_NODE = TypeAdapter(NodeResponse)
+
+
+async def _fetch_nodes(roadmap_id: str):
+    """Load all nodes of a roadmap from Supabase (cache loader)."""
+    supabase = get_supabase()
+    response = await execute(
+        supabase.table("nodes")
+        .select("*")
+        .eq("roadmap_id", roadmap_id)
+        .order("order_index")
+    )
+    return CatalogEntry(response.data, _NODE_LIST)
+
+
+async def _fetch_node_summaries(roadmap_id: str):
+    """Load the graph projection of a roadmap's nodes (cache loader)."""
+    supabase = get_supabase()
+    response = await execute(
+        supabase.table("nodes")
+        .select(_SUMMARY_COLUMNS)
+        .eq("roadmap_id", roadmap_id)
+        .order("order_index")
+    )
+    return CatalogEntry(response.data, _NODE_SUMMARY_LIST)
+
+
+async def _fetch_node(node_id: str):
+    """Load a single node from Supabase (cache loader)."""
+    supabase = get_supabase()
+    response = await execute(supabase.table("nodes").select("*").eq("id", node_id).single())
+    return CatalogEntry(response.data, _NODE)
+
 
 @router.get("/roadmaps/{roadmap_id}/nodes", response_model=List[NodeResponse])
-async def get_nodes_by_roadmap(roadmap_id: str):
+async def get_nodes_by_roadmap(roadmap_id: str, request: Request, response: Response):
     """
     Get all nodes for a specific roadmap.
+    Supports conditional requests via ETag / If-None-Match.
 
     Args:
         roadmap_id: UUID of the roadmap
@@ -22,16 +66,16 @@ async def get_nodes_by_roadmap(roadmap_id: str):
     Returns:
         List of nodes ordered by order_index
     """
+    snapshot = snapshot_response(request, ("nodes", roadmap_id))
+    if snapshot is not None:
+        return snapshot
+
     try:
-        supabase = get_supabase()
-        response = (
-            supabase.table("nodes")
-            .select("*")
-            .eq("roadmap_id", roadmap_id)
-            .order("order_index")
-            .execute()
+        entry = await catalog_cache.get_or_load(
+            ("nodes", roadmap_id),
+            lambda: _fetch_nodes(roadmap_id),
         )
-        return response.data
+        return conditional_response(request, response, entry)
     except Exception as e:
         logger.exception("Failed to fetch nodes for roadmap %s", roadmap_id)
         raise HTTPException(
@@ -40,10 +84,42 @@ async def get_nodes_by_roadmap(roadmap_id: str):
         )
 
 
+@router.get("/roadmaps/{roadmap_id}/nodes/summary", response_model=List[NodeSummary])
+async def get_node_summaries_by_roadmap(roadmap_id: str, request: Request, response: Response):
+    """
+    Get the lightweight graph projection of a roadmap's nodes.
+    Only id, title, order_index and SVG coordinates are returned; full
+    node detail is fetched lazily through GET /nodes/{node_id}.
+
+    Args:
+        roadmap_id: UUID of the roadmap
+
+    Returns:
+        List of node summaries ordered by order_index
+    """
+    snapshot = snapshot_response(request, ("node_summaries", roadmap_id))
+    if snapshot is not None:
+        return snapshot
+
+    try:
+        entry = await catalog_cache.get_or_load(
+            ("node_summaries", roadmap_id),
+            lambda: _fetch_node_summaries(roadmap_id),
+        )
+        return conditional_response(request, response, entry)
+    except Exception as e:
+        logger.exception("Failed to fetch node summaries for roadmap %s", roadmap_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch nodes",
+        )
+
+
 @router.get("/nodes/{node_id}", response_model=NodeResponse)
-async def get_node(node_id: str):
+async def get_node(node_id: str, request: Request, response: Response):
     """
     Get a specific node by ID.
+    Supports conditional requests via ETag / If-None-Match.
 
     Args:
         node_id: UUID of the node
@@ -51,17 +127,23 @@ async def get_node(node_id: str):
     Returns:
         Node details
     """
+    snapshot = snapshot_response(request, ("node", node_id))
+    if snapshot is not None:
+        return snapshot
+
     try:
-        supabase = get_supabase()
-        response = supabase.table("nodes").select("*").eq("id", node_id).single().execute()
+        entry = await catalog_cache.get_or_load(
+            ("node", node_id),
+            lambda: _fetch_node(node_id),
+        )
 
-        if not response.data:
+        if not entry.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Node not found",
             )
 
-        return response.data
+        return conditional_response(request, response, entry)
     except HTTPException:
         raise
     except Exception as e:
@@ -1,44 +1,97 @@
 import logging
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.core.auth import get_current_user, AuthenticatedUser
-from app.core.supabase import get_supabase
-from app.models.schemas import NoteResponse, NoteUpdate
+from app.core.changes import read_feed
+from app.core.config import settings
+from app.core.events import event_bus
+from app.core.pagination import apply_keyset, paginate
+from app.core.search import prefix_tsquery, split_highlights
+from app.core.supabase import execute, get_supabase
+from app.core.write_behind import WriteConflict, note_buffer
+from app.models.schemas import (
+    NOTE_MAX_LENGTH,
+    NoteEdit,
+    NoteListResponse,
+    NotePatch,
+    NoteResponse,
+    NoteSearchHit,
+    NoteUpdate,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/notes", tags=["Notes"])
 
 
-@router.get("", response_model=List[NoteResponse])
-async def get_all_notes(user: AuthenticatedUser = Depends(get_current_user)):
+def _apply_edits(content: str, edits: List[NoteEdit]) -> str:
+    """Apply non-overlapping range replacements to `content` in one pass.
+
+    Raises:
+        ValueError: if an edit is out of range or overlaps another
+    """
+    parts = []
+    position = 0
+    for edit in sorted(edits, key=lambda edit: (edit.start, edit.end)):
+        if edit.end < edit.start or edit.end > len(content):
+            raise ValueError("Edit range out of bounds")
+        if edit.start < position:
+            raise ValueError("Edits overlap")
+        parts.append(content[position:edit.start])
+        parts.append(edit.text)
+        position = edit.end
+    parts.append(content[position:])
+    return "".join(parts)
+
+
+@router.get("", response_model=NoteListResponse)
+async def get_all_notes(
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    since: Optional[str] = Query(None, description="next_since from a previous change feed read; empty to start"),
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    user: AuthenticatedUser = Depends(get_current_user),
+):
     """
-    Get all notes for the current user.
+    Get notes for the current user, most recently updated first.
+    Paginated by keyset on (updated_at, id).
+
+    With `since`, returns only notes changed after that watermark,
+    oldest first, plus tombstones for deleted notes, so a client can keep
+    a local replica up to date; `cursor` is then ignored.
+
+    Args:
+        cursor: next_cursor from the previous page, if any
+        since: next_since from the previous change feed read, if any
+        limit: Page size
 
     Returns:
-        List of notes
+        A page of notes and the cursor for the next page
     """
     try:
         supabase = get_supabase()
+        query = supabase.table("notes").select("*, nodes(title)").eq("user_id", user.id)
 
-        response = (
-            supabase.table("notes")
-            .select("*, nodes(title)")
-            .eq("user_id", user.id)
-            .order("updated_at", desc=True)
-            .execute()
-        )
+        if since is not None:
+            result = await read_feed(supabase, "notes", query, user.id, since, limit)
+            page = result["items"]
+        else:
+            response = await execute(apply_keyset(query, "updated_at", "id", cursor, limit))
+            page, next_cursor = paginate(response.data, limit, "updated_at", "id")
+            result = {"next_cursor": next_cursor}
 
         notes = []
-        for note in response.data:
+        for note in page:
             node_data = note.pop("nodes", {})
             note["node_title"] = node_data.get("title") if node_data else None
             notes.append(note)
 
-        return notes
+        # Saves still in the write-behind buffer are newer than the database
+        return {**result, "items": note_buffer.overlay(notes)}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("Failed to fetch notes for user %s", user.id)
         raise HTTPException(
@@ -47,6 +100,63 @@ async def get_all_notes(user: AuthenticatedUser = Depends(get_current_user)):
         )
 
 
+@router.get("/search", response_model=List[NoteSearchHit])
+async def search_notes(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=50),
+    user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    Full-text search over the current user's notes.
+    Ranked in Postgres (search_notes(), see
+    migrations/20261017_add_note_search.sql); every word also matches as
+    a prefix. Hits carry a snippet and node title, never the full note.
+
+    Args:
+        q: Search query
+        limit: Maximum number of hits
+
+    Returns:
+        Hits with a snippet and the character ranges to highlight in it
+    """
+    query = prefix_tsquery(q)
+    if not query:
+        return []
+
+    try:
+        # Buffered autosaves are searchable once written
+        if not await note_buffer.flush(note_buffer.pending_keys(user.id)):
+            logger.warning("Searching notes of user %s with unflushed autosaves", user.id)
+
+        supabase = get_supabase()
+        response = await execute(
+            supabase.rpc(
+                "search_notes",
+                {"p_user_id": user.id, "p_query": query, "p_limit": limit},
+                get=True,
+            )
+        )
+
+        hits = []
+        for row in response.data or []:
+            snippet, highlights = split_highlights(row.get("snippet") or "")
+            hits.append({
+                "node_id": row["node_id"],
+                "node_title": row.get("node_title"),
+                "score": row.get("rank") or 0.0,
+                "snippet": snippet,
+                "highlights": highlights,
+                "updated_at": row.get("updated_at"),
+            })
+        return hits
+    except Exception as e:
+        logger.exception("Failed to search notes for user %s", user.id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to search notes",
+        )
+
+
 @router.get("/{node_id}", response_model=NoteResponse)
 async def get_note(
     node_id: str,
@@ -61,15 +171,18 @@ async def get_note(
     Returns:
         Note content
     """
+    buffered = note_buffer.get(user.id, node_id)
+    if buffered is not None:
+        return buffered
+
     try:
         supabase = get_supabase()
-        response = (
+        response = await execute(
             supabase.table("notes")
             .select("*")
             .eq("user_id", user.id)
             .eq("node_id", node_id)
             .single()
-            .execute()
         )
 
         if not response.data:
@@ -98,6 +211,8 @@ async def update_note(
     """
     Create or update a note for a node (upsert).
     Content length is validated at the schema level (max 50,000 chars).
+    Rapid successive saves are coalesced by the write-behind buffer and
+    only the latest version is written (see app/core/write_behind.py).
 
     Args:
         node_id: UUID of the node
@@ -107,33 +222,118 @@ async def update_note(
         Updated note
     """
     try:
-        supabase = get_supabase()
+        now = datetime.utcnow().isoformat()
+        saved = await note_buffer.write({
+            "user_id": user.id,
+            "node_id": node_id,
+            "content": note.content,
+            "updated_at": now,
+            "edited_at": now,
+        })
 
-        response = (
-            supabase.table("notes")
-            .upsert(
-                {
-                    "user_id": user.id,
-                    "node_id": node_id,
-                    "content": note.content,
-                    "updated_at": datetime.utcnow().isoformat(),
-                },
-                on_conflict="user_id,node_id",
-            )
-            .execute()
+        if saved:
+            await event_bus.publish(user.id, "note", saved)
+            return saved
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to save note",
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Failed to update note for node %s", node_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to update note",
         )
 
-        if response.data:
-            return response.data[0]
+
+@router.patch("/{node_id}", response_model=NoteResponse)
+async def patch_note(
+    node_id: str,
+    patch: NotePatch,
+    user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    Apply a delta to a note instead of resending its full content.
+    Edits replace ranges of the note as of `base_version`; if the note has
+    changed since, the patch is rejected with 409 and the client should
+    refetch and rebase.
+
+    Args:
+        node_id: UUID of the node
+        patch: Base version and range edits
+
+    Returns:
+        Updated note, with its new version
+    """
+    try:
+        current = note_buffer.get(user.id, node_id)
+        if current is None:
+            supabase = get_supabase()
+            response = await execute(
+                supabase.table("notes")
+                .select("*")
+                .eq("user_id", user.id)
+                .eq("node_id", node_id)
+                .maybe_single()
+            )
+            current = response.data if response else None
+        if not current:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Note not found",
+            )
+
+        if note_buffer.version_of(current) != patch.base_version:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Note has changed since base_version",
+            )
+
+        try:
+            content = _apply_edits(current.get("content") or "", patch.edits)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Edits do not apply to base_version",
+            )
+        if len(content) > NOTE_MAX_LENGTH:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Note too long",
+            )
+
+        now = datetime.utcnow().isoformat()
+        saved = await note_buffer.write(
+            {
+                "user_id": user.id,
+                "node_id": node_id,
+                "content": content,
+                "version": patch.base_version + 1,
+                "updated_at": now,
+                "edited_at": now,
+            },
+            expected_version=patch.base_version,
+        )
+        if saved:
+            await event_bus.publish(user.id, "note", saved)
+            return saved
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to save note",
         )
+    except WriteConflict:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Note has changed since base_version",
+        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception("Failed to update note for node %s", node_id)
+        logger.exception("Failed to patch note for node %s", node_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update note",
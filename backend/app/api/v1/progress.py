@@ -1,35 +1,75 @@
+import asyncio
 import logging
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.core.auth import get_current_user, AuthenticatedUser
-from app.core.supabase import get_supabase
-from app.models.schemas import ProgressResponse, ProgressUpdate
+from app.core.cache import read_flights
+from app.core.changes import read_feed
+from app.core.config import settings
+from app.core.events import event_bus
+from app.core.pagination import apply_keyset, paginate
+from app.core.supabase import execute, get_supabase
+from app.models.schemas import (
+    ProgressBatchResponse,
+    ProgressBatchUpdate,
+    ProgressListResponse,
+    ProgressResponse,
+    ProgressUpdate,
+    RoadmapProgressSummary,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/progress", tags=["Progress"])
 
 
-@router.get("", response_model=List[ProgressResponse])
-async def get_all_progress(user: AuthenticatedUser = Depends(get_current_user)):
+@router.get("", response_model=ProgressListResponse)
+async def get_all_progress(
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    since: Optional[str] = Query(None, description="next_since from a previous change feed read; empty to start"),
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    user: AuthenticatedUser = Depends(get_current_user),
+):
     """
-    Get progress for all nodes for the current user.
+    Get progress records for the current user, most recently updated first.
+    Paginated by keyset on (updated_at, node_id).
+
+    With `since`, returns only records changed after that watermark,
+    oldest first, plus tombstones for deleted records, so a client can
+    keep a local replica up to date; `cursor` is then ignored.
+
+    Args:
+        cursor: next_cursor from the previous page, if any
+        since: next_since from the previous change feed read, if any
+        limit: Page size
 
     Returns:
-        List of progress records
+        A page of progress records and the cursor for the next page
     """
     try:
         supabase = get_supabase()
-        response = (
-            supabase.table("user_progress")
-            .select("*")
-            .eq("user_id", user.id)
-            .execute()
+        if since is not None:
+            return await read_feed(
+                supabase, "user_progress",
+                supabase.table("user_progress").select("*").eq("user_id", user.id),
+                user.id, since, limit,
+            )
+
+        response = await execute(
+            apply_keyset(
+                supabase.table("user_progress")
+                .select("*")
+                .eq("user_id", user.id),
+                "updated_at", "node_id", cursor, limit,
+            )
         )
-        return response.data
+        items, next_cursor = paginate(response.data, limit, "updated_at", "node_id")
+        return {"items": items, "next_cursor": next_cursor}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("Failed to fetch progress for user %s", user.id)
         raise HTTPException(
@@ -38,6 +78,107 @@ async def get_all_progress(user: AuthenticatedUser = Depends(get_current_user)):
         )
 
 
+# Declared before /{node_id} so "batch" is not captured as a node id
+@router.put("/batch", response_model=ProgressBatchResponse)
+async def update_progress_batch(
+    batch: ProgressBatchUpdate,
+    user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    Update progress status for many nodes in one multi-row upsert.
+    If a node appears more than once, the last entry wins.
+
+    Args:
+        batch: List of (node_id, status) items
+
+    Returns:
+        Per-item results in request order
+    """
+    try:
+        supabase = get_supabase()
+        now = datetime.utcnow().isoformat()
+
+        # Postgres rejects an upsert that touches the same row twice
+        latest = {item.node_id: item.status for item in batch.items}
+        rows = [
+            {
+                "user_id": user.id,
+                "node_id": node_id,
+                "status": node_status,
+                "updated_at": now,
+                "edited_at": now,
+            }
+            for node_id, node_status in latest.items()
+        ]
+
+        response = await execute(
+            supabase.table("user_progress")
+            .upsert(rows, on_conflict="user_id,node_id")
+        )
+
+        saved = {row["node_id"]: row for row in response.data or []}
+        for row in saved.values():
+            await event_bus.publish(user.id, "progress", row)
+        return {
+            "results": [
+                {
+                    "node_id": item.node_id,
+                    "status": item.status,
+                    "saved": item.node_id in saved and latest[item.node_id] == item.status,
+                    "updated_at": saved.get(item.node_id, {}).get("updated_at"),
+                }
+                for item in batch.items
+            ]
+        }
+    except Exception as e:
+        logger.exception("Failed to batch update progress for user %s", user.id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to update progress",
+        )
+
+
+# Declared before /{node_id} so "summary" is not captured as a node id
+@router.get("/summary", response_model=List[RoadmapProgressSummary])
+async def get_progress_summary(user: AuthenticatedUser = Depends(get_current_user)):
+    """
+    Get per-roadmap status counts for the current user.
+    Reads the incrementally maintained user_roadmap_progress rows, so the
+    cost is one row per started roadmap regardless of progress history.
+
+    Returns:
+        One summary per roadmap the user has started
+    """
+    try:
+        supabase = get_supabase()
+        summary_response, counts_response = await asyncio.gather(
+            execute(
+                supabase.table("user_roadmap_progress")
+                .select("roadmap_id, completed_count, in_progress_count")
+                .eq("user_id", user.id)
+            ),
+            read_flights.do("roadmap_node_counts", lambda: execute(
+                supabase.table("roadmap_node_counts")
+                .select("roadmap_id, total_count")
+            )),
+        )
+
+        total_counts = {
+            row["roadmap_id"]: row["total_count"]
+            for row in counts_response.data or []
+        }
+        return [
+            {**row, "total_count": total_counts.get(row["roadmap_id"], 0)}
+            for row in summary_response.data or []
+        ]
+    except Exception as e:
+        logger.exception("Failed to fetch progress summary for user %s", user.id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch progress summary",
+        )
+
+
 @router.get("/{node_id}", response_model=ProgressResponse)
 async def get_node_progress(
     node_id: str,
@@ -54,13 +195,12 @@ async def get_node_progress(
     """
     try:
         supabase = get_supabase()
-        response = (
+        response = await execute(
             supabase.table("user_progress")
             .select("*")
             .eq("user_id", user.id)
             .eq("node_id", node_id)
             .single()
-            .execute()
         )
 
         if not response.data:
@@ -101,22 +241,24 @@ async def update_progress(
     """
     try:
         supabase = get_supabase()
+        now = datetime.utcnow().isoformat()
 
-        response = (
+        response = await execute(
             supabase.table("user_progress")
             .upsert(
                 {
                     "user_id": user.id,
                     "node_id": node_id,
                     "status": progress.status,
-                    "updated_at": datetime.utcnow().isoformat(),
+                    "updated_at": now,
+                    "edited_at": now,
                 },
                 on_conflict="user_id,node_id",
             )
-            .execute()
         )
 
         if response.data:
+            await event_bus.publish(user.id, "progress", response.data[0])
             return response.data[0]
 
         return {
@@ -1,30 +1,63 @@
 import logging
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from datetime import datetime
+from pydantic import TypeAdapter
 
 from app.core.auth import get_current_user, AuthenticatedUser
-from app.core.supabase import get_supabase
-from app.models.schemas import RoadmapResponse, RoadmapRequestCreate, RoadmapRequestResponse
+from app.core.cache import catalog_cache
+from app.core.catalog import CatalogEntry, conditional_response
+from app.core.config import settings
+from app.core.pagination import apply_keyset, paginate
+from app.core.snapshot import snapshot_response
+from app.core.supabase import execute, get_supabase
+from app.models.schemas import (
+    RoadmapResponse,
+    RoadmapRequestCreate,
+    RoadmapRequestListResponse,
+    RoadmapRequestResponse,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/roadmaps", tags=["Roadmaps"])
 
+# Response models applied once per cache fill (see CatalogEntry)
+_ROADMAP_LIST = TypeAdapter(List[RoadmapResponse])
+_ROADMAP = TypeAdapter(RoadmapResponse)
+
+
+async def _fetch_roadmaps():
+    """Load all roadmaps from Supabase (cache loader)."""
+    supabase = get_supabase()
+    response = await execute(supabase.table("roadmaps").select("*"))
+    return CatalogEntry(response.data, _ROADMAP_LIST)
+
+
+async def _fetch_roadmap(roadmap_id: str):
+    """Load a single roadmap from Supabase (cache loader)."""
+    supabase = get_supabase()
+    response = await execute(supabase.table("roadmaps").select("*").eq("id", roadmap_id).single())
+    return CatalogEntry(response.data, _ROADMAP)
+
 
 @router.get("", response_model=List[RoadmapResponse])
-async def get_roadmaps():
+async def get_roadmaps(request: Request, response: Response):
     """
     Get all available roadmaps.
+    Supports conditional requests via ETag / If-None-Match.
 
     Returns:
         List of roadmaps
     """
+    snapshot = snapshot_response(request, "roadmaps")
+    if snapshot is not None:
+        return snapshot
+
     try:
-        supabase = get_supabase()
-        response = supabase.table("roadmaps").select("*").execute()
-        return response.data
+        entry = await catalog_cache.get_or_load("roadmaps", _fetch_roadmaps)
+        return conditional_response(request, response, entry)
     except Exception as e:
         logger.exception("Failed to fetch roadmaps")
         raise HTTPException(
@@ -34,9 +67,10 @@ async def get_roadmaps():
 
 
 @router.get("/{roadmap_id}", response_model=RoadmapResponse)
-async def get_roadmap(roadmap_id: str):
+async def get_roadmap(roadmap_id: str, request: Request, response: Response):
     """
     Get a specific roadmap by ID.
+    Supports conditional requests via ETag / If-None-Match.
 
     Args:
         roadmap_id: UUID of the roadmap
@@ -44,17 +78,23 @@ async def get_roadmap(roadmap_id: str):
     Returns:
         Roadmap details
     """
+    snapshot = snapshot_response(request, ("roadmap", roadmap_id))
+    if snapshot is not None:
+        return snapshot
+
     try:
-        supabase = get_supabase()
-        response = supabase.table("roadmaps").select("*").eq("id", roadmap_id).single().execute()
+        entry = await catalog_cache.get_or_load(
+            ("roadmap", roadmap_id),
+            lambda: _fetch_roadmap(roadmap_id),
+        )
 
-        if not response.data:
+        if not entry.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Roadmap not found",
             )
 
-        return response.data
+        return conditional_response(request, response, entry)
     except HTTPException:
         raise
     except Exception as e:
@@ -88,7 +128,7 @@ async def create_roadmap_request(request: RoadmapRequestCreate):
             "created_at": datetime.utcnow().isoformat(),
         }
 
-        response = supabase.table("roadmap_requests").insert(request_data).execute()
+        response = await execute(supabase.table("roadmap_requests").insert(request_data))
 
         if response.data and len(response.data) > 0:
             return response.data[0]
@@ -108,21 +148,36 @@ async def create_roadmap_request(request: RoadmapRequestCreate):
         )
 
 
-@router.get("/requests/all", response_model=List[RoadmapRequestResponse])
+@router.get("/requests/all", response_model=RoadmapRequestListResponse)
 async def get_roadmap_requests(
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
     user: AuthenticatedUser = Depends(get_current_user),
 ):
     """
-    Get all roadmap requests.
+    Get roadmap requests, newest first.
     Requires authentication — prevents anonymous enumeration of user emails.
+    Paginated by keyset on (created_at, id).
+
+    Args:
+        cursor: next_cursor from the previous page, if any
+        limit: Page size
 
     Returns:
-        List of roadmap requests
+        A page of roadmap requests and the cursor for the next page
     """
     try:
         supabase = get_supabase()
-        response = supabase.table("roadmap_requests").select("*").order("created_at", desc=True).execute()
-        return response.data
+        response = await execute(
+            apply_keyset(
+                supabase.table("roadmap_requests").select("*"),
+                "created_at", "id", cursor, limit,
+            )
+        )
+        items, next_cursor = paginate(response.data, limit, "created_at", "id")
+        return {"items": items, "next_cursor": next_cursor}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("Failed to fetch roadmap requests")
         raise HTTPException(
@@ -0,0 +1,56 @@
+import logging
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.core.cache import catalog_cache
+from app.core.search import node_search
+from app.core.supabase import get_supabase
+from app.models.schemas import SearchHit
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+async def _refresh_index():
+    """Re-index nodes changed since the last refresh (cache loader)."""
+    await node_search.refresh(get_supabase())
+    return node_search
+
+
+@router.get("", response_model=List[SearchHit])
+async def search_nodes(
+    q: str = Query(..., min_length=1, max_length=200),
+    roadmap_id: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=50),
+):
+    """
+    Full-text search over node titles, summaries, TL;DRs and content.
+    Results are ranked with BM25 and every word also matches as a prefix
+    ("reba" matches "rebase"). The index is refreshed from the nodes
+    table at most once per catalog cache TTL.
+
+    Args:
+        q: Search query
+        roadmap_id: Only return nodes of this roadmap
+        limit: Maximum number of hits
+
+    Returns:
+        Hits with a snippet and the character ranges to highlight in it
+    """
+    try:
+        # Cached like catalog reads: one refresh per TTL, shared by
+        # concurrent requests
+        await catalog_cache.get_or_load("search_index", _refresh_index)
+    except Exception:
+        # The index from the last successful refresh keeps serving
+        if not len(node_search):
+            logger.exception("Failed to build the search index")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to search nodes",
+            )
+        logger.warning("Searching a stale index after a failed refresh", exc_info=True)
+
+    return node_search.search(q, limit, roadmap_id)
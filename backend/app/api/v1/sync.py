@@ -0,0 +1,202 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.core.auth import get_current_user, AuthenticatedUser
+from app.core.changes import (
+    changes_since,
+    check_retention,
+    deletions_since,
+    horizon,
+    join_token,
+    next_watermark,
+    parse_time,
+    split_token,
+)
+from app.core.config import settings
+from app.core.events import event_bus
+from app.core.supabase import execute, get_supabase
+from app.core.write_behind import note_buffer
+from app.models.schemas import SyncRequest, SyncResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+def _edit_time(row: Dict[str, Any]) -> Optional[datetime]:
+    """When a stored row was last edited; rows from before sync lack edited_at."""
+    return parse_time(row.get("edited_at") or row.get("updated_at"))
+
+
+def _last_writer_wins(
+    user_id: str,
+    client_items: Dict[str, Any],
+    stored: Dict[str, Dict[str, Any]],
+    fields: Tuple[str, ...],
+    now: datetime,
+    written_at: str,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Split client items into rows to write and stored rows that win.
+
+    A client item wins if it was edited strictly after the stored row.
+    Client clocks are clamped to `now` so a fast clock cannot win forever.
+
+    Returns:
+        (rows to upsert, stored rows that beat the client's copy by node_id)
+    """
+    rows = []
+    conflicts = {}
+    for node_id, item in client_items.items():
+        edited_at = min(parse_time(item.updated_at), now)
+        current = stored.get(node_id)
+        if current is not None:
+            current_edit = _edit_time(current)
+            if current_edit is not None and current_edit >= edited_at:
+                conflicts[node_id] = current
+                continue
+        rows.append({
+            "user_id": user_id,
+            "node_id": node_id,
+            **{field: getattr(item, field) for field in fields},
+            "updated_at": written_at,
+            "edited_at": edited_at.isoformat(),
+        })
+    return rows, conflicts
+
+
+@router.post("", response_model=SyncResponse)
+async def sync(
+    changes: SyncRequest,
+    user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    Reconcile an offline client's progress and notes in one request.
+    Client items are merged last-writer-wins on their edit time (clamped
+    to the server clock) in one bulk upsert per table; items older than
+    the stored row are ignored and the stored row is returned instead.
+    The response then carries every server change since `sync_token`,
+    including rows this request wrote, as stored, and deletions.
+
+    Args:
+        changes: Client change-set and the previous sync token
+
+    Returns:
+        Server-side changes, counts of applied items and the next token
+    """
+    progress_watermark, notes_watermark, deleted_progress_watermark, deleted_notes_watermark = split_token(
+        changes.sync_token, 4,
+    )
+    check_retention(deleted_progress_watermark)
+    check_retention(deleted_notes_watermark)
+
+    try:
+        supabase = get_supabase()
+        now = datetime.now(timezone.utc)
+        written_at = datetime.utcnow().isoformat()
+
+        # Last entry wins when the client sends a node twice
+        client_progress = {item.node_id: item for item in changes.progress}
+        client_notes = {item.node_id: item for item in changes.notes}
+
+        # Buffered autosaves are the current server state for their notes
+        if client_notes and not await note_buffer.flush((user.id, node_id) for node_id in client_notes):
+            raise RuntimeError("Buffered notes could not be flushed")
+
+        async def current_rows(table: str, node_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+            if not node_ids:
+                return {}
+            response = await execute(
+                supabase.table(table)
+                .select("*")
+                .eq("user_id", user.id)
+                .in_("node_id", node_ids)
+            )
+            return {row["node_id"]: row for row in response.data or []}
+
+        stored_progress, stored_notes = await asyncio.gather(
+            current_rows("user_progress", list(client_progress)),
+            current_rows("notes", list(client_notes)),
+        )
+
+        progress_rows, progress_conflicts = _last_writer_wins(
+            user.id, client_progress, stored_progress, ("status",), now, written_at,
+        )
+        note_rows, note_conflicts = _last_writer_wins(
+            user.id, client_notes, stored_notes, ("content",), now, written_at,
+        )
+
+        async def upsert(table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            if not rows:
+                return []
+            response = await execute(supabase.table(table).upsert(rows, on_conflict="user_id,node_id"))
+            return response.data or []
+
+        saved_progress, saved_notes = await asyncio.gather(
+            upsert("user_progress", progress_rows),
+            upsert("notes", note_rows),
+        )
+        # Other devices with an open event stream see the merged rows now
+        for row in saved_progress:
+            await event_bus.publish(user.id, "progress", row)
+        for row in saved_notes:
+            await event_bus.publish(user.id, "note", row)
+
+        page_size = settings.sync_page_size
+        (
+            (progress_changes, progress_more),
+            (note_changes, notes_more),
+            (progress_deleted, deleted_progress_more),
+            (notes_deleted, deleted_notes_more),
+        ) = await asyncio.gather(
+            changes_since(
+                supabase.table("user_progress").select("*").eq("user_id", user.id),
+                progress_watermark, page_size,
+            ),
+            changes_since(
+                supabase.table("notes").select("*").eq("user_id", user.id),
+                notes_watermark, page_size,
+            ),
+            deletions_since(supabase, "user_progress", user.id, deleted_progress_watermark, page_size),
+            deletions_since(supabase, "notes", user.id, deleted_notes_watermark, page_size),
+        )
+
+        limit_time = horizon()
+        token = join_token([
+            next_watermark(progress_changes, progress_more, progress_watermark, limit_time),
+            next_watermark(note_changes, notes_more, notes_watermark, limit_time),
+            next_watermark(progress_deleted, deleted_progress_more, deleted_progress_watermark,
+                           limit_time, "deleted_at", advance_idle=True),
+            next_watermark(notes_deleted, deleted_notes_more, deleted_notes_watermark,
+                           limit_time, "deleted_at", advance_idle=True),
+        ])
+
+        # Stored rows that beat the client's copy may predate the watermark
+        progress_out = {row["node_id"]: row for row in progress_changes}
+        notes_out = {row["node_id"]: row for row in note_changes}
+        for node_id, row in progress_conflicts.items():
+            progress_out.setdefault(node_id, row)
+        for node_id, row in note_conflicts.items():
+            notes_out.setdefault(node_id, row)
+
+        return {
+            "progress": list(progress_out.values()),
+            "notes": note_buffer.overlay(notes_out.values()),
+            "deleted_progress": progress_deleted,
+            "deleted_notes": notes_deleted,
+            "applied_progress": len(progress_rows),
+            "applied_notes": len(note_rows),
+            "sync_token": token,
+            "has_more": progress_more or notes_more or deleted_progress_more or deleted_notes_more,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Failed to sync for user %s", user.id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to sync",
+        )
@@ -1,9 +1,12 @@
+import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.core.auth import get_current_user, AuthenticatedUser
-from app.core.supabase import get_supabase
+from app.core.cache import read_flights
+from app.core.supabase import execute, get_supabase
+from app.core.write_behind import note_buffer
 from app.models.schemas import JourneyResponse
 
 logger = logging.getLogger(__name__)
@@ -25,46 +28,63 @@ async def get_user_journey(user: AuthenticatedUser = Depends(get_current_user)):
     try:
         supabase = get_supabase()
 
-        # Get all progress for user
-        progress_response = (
-            supabase.table("user_progress")
-            .select("*, nodes(id, title, roadmap_id, roadmaps(id, title, description))")
-            .eq("user_id", user.id)
-            .order("updated_at", desc=True)
-            .execute()
+        # Per-roadmap summaries, node counts, recent progress and recent
+        # notes are independent, so fetch them concurrently: one round trip
+        # of wall time. Summaries are maintained incrementally by a trigger,
+        # so this reads one row per started roadmap, not every progress row.
+        summary_response, counts_response, progress_response, notes_response = await asyncio.gather(
+            execute(
+                supabase.table("user_roadmap_progress")
+                .select("roadmap_id, completed_count, in_progress_count, roadmaps(id, title, description)")
+                .eq("user_id", user.id)
+                # Most recently touched roadmap first
+                .order("updated_at", desc=True)
+            ),
+            read_flights.do("roadmap_node_counts", lambda: execute(
+                supabase.table("roadmap_node_counts")
+                .select("roadmap_id, total_count")
+            )),
+            execute(
+                supabase.table("user_progress")
+                # Inner joins: rows without a node or roadmap are dropped
+                # before the limit, so up to 10 topics are still returned
+                .select("*, nodes!inner(id, title, roadmap_id, roadmaps!inner(id, title, description))")
+                .eq("user_id", user.id)
+                .order("updated_at", desc=True)
+                .limit(10)
+            ),
+            execute(
+                supabase.table("notes")
+                .select("*, nodes(title)")
+                .eq("user_id", user.id)
+                .order("updated_at", desc=True)
+                .limit(10)
+            ),
         )
 
-        progress_data = progress_response.data or []
+        total_counts = {
+            row["roadmap_id"]: row["total_count"]
+            for row in counts_response.data or []
+        }
 
-        # Process roadmaps with progress
-        roadmap_stats = {}
-        recent_topics = []
-
-        for item in progress_data:
-            node = item.get("nodes", {})
-            if not node:
-                continue
-
-            roadmap = node.get("roadmaps", {})
+        roadmaps = []
+        for item in summary_response.data or []:
+            roadmap = item.get("roadmaps")
             if not roadmap:
                 continue
+            roadmaps.append({
+                "id": roadmap.get("id"),
+                "title": roadmap.get("title"),
+                "description": roadmap.get("description"),
+                "total_count": total_counts.get(item["roadmap_id"], 0),
+                "completed_count": item.get("completed_count", 0),
+                "in_progress_count": item.get("in_progress_count", 0),
+            })
 
-            roadmap_id = roadmap.get("id")
-
-            # Track roadmap stats
-            if roadmap_id not in roadmap_stats:
-                roadmap_stats[roadmap_id] = {
-                    "id": roadmap_id,
-                    "title": roadmap.get("title"),
-                    "description": roadmap.get("description"),
-                    "total_count": 0,
-                    "completed_count": 0,
-                }
-
-            if item.get("status") == "completed":
-                roadmap_stats[roadmap_id]["completed_count"] += 1
-
-            # Add to recent topics
+        recent_topics = []
+        for item in progress_response.data or []:
+            node = item["nodes"]
+            roadmap = node["roadmaps"]
             recent_topics.append({
                 "id": node.get("id"),
                 "title": node.get("title"),
@@ -73,30 +93,8 @@ async def get_user_journey(user: AuthenticatedUser = Depends(get_current_user)):
                 "updated_at": item.get("updated_at"),
             })
 
-        # Get total node counts for each roadmap
-        roadmap_ids = list(roadmap_stats.keys())
-        if roadmap_ids:
-            for rid in roadmap_ids:
-                count_response = (
-                    supabase.table("nodes")
-                    .select("id", count="exact")
-                    .eq("roadmap_id", rid)
-                    .execute()
-                )
-                roadmap_stats[rid]["total_count"] = count_response.count or 0
-
-        # Get recent notes
-        notes_response = (
-            supabase.table("notes")
-            .select("*, nodes(title)")
-            .eq("user_id", user.id)
-            .order("updated_at", desc=True)
-            .limit(10)
-            .execute()
-        )
-
         notes = []
-        for note in notes_response.data or []:
+        for note in note_buffer.overlay(notes_response.data or []):
             node_data = note.pop("nodes", {})
             notes.append({
                 "id": note.get("id"),
@@ -107,8 +105,8 @@ async def get_user_journey(user: AuthenticatedUser = Depends(get_current_user)):
             })
 
         return JourneyResponse(
-            roadmaps=list(roadmap_stats.values()),
-            recent_topics=recent_topics[:10],
+            roadmaps=roadmaps,
+            recent_topics=recent_topics,
             notes=notes,
         )
 
@@ -1,10 +1,14 @@
+import hashlib
 import logging
 import re
-from typing import Optional
+import time
+from typing import Dict, Optional
 
+import jwt as pyjwt  # PyJWT — lightweight, no extra deps
 from fastapi import Header, HTTPException, status
 from pydantic import BaseModel
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -42,6 +46,70 @@ def _validate_user_id(user_id: str) -> str:
     return user_id
 
 
+# Verified tokens, keyed by SHA-256 of the raw token. Each entry expires at
+# the token's own `exp` (capped by auth_claims_cache_max_ttl), so a hit is
+# always a token that would still pass verification.
+_claims_cache = TTLCache(
+    maxsize=settings.auth_claims_cache_maxsize,
+    ttl=settings.auth_claims_cache_max_ttl,
+)
+
+# Signature verification timing, for monitoring
+_verify_count = 0
+_verify_seconds = 0.0
+
+
+def auth_stats() -> Dict[str, float]:
+    """Claims cache counters and JWT verification timings."""
+    lookups = _claims_cache.hits + _claims_cache.misses
+    return {
+        **_claims_cache.stats(),
+        "hit_rate": _claims_cache.hits / lookups if lookups else 0.0,
+        "verify_count": _verify_count,
+        "verify_seconds_total": _verify_seconds,
+    }
+
+
+def _verify_token(token: str) -> AuthenticatedUser:
+    """Verify a Supabase JWT, using the claims cache when possible."""
+    global _verify_count, _verify_seconds
+
+    cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = _claims_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    start = time.perf_counter()
+    try:
+        payload = pyjwt.decode(
+            token,
+            settings.supabase_jwt_secret,
+            algorithms=["HS256"],
+            audience="authenticated",
+        )
+    finally:
+        _verify_count += 1
+        _verify_seconds += time.perf_counter() - start
+
+    user_id = payload.get("sub")
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token: missing subject",
+        )
+    user = AuthenticatedUser(
+        id=_validate_user_id(user_id),
+        email=payload.get("email"),
+    )
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        remaining = exp - time.time()
+        if remaining > 0:
+            _claims_cache.set(cache_key, user, ttl=min(remaining, settings.auth_claims_cache_max_ttl))
+    return user
+
+
 async def get_current_user(
     x_user_id: Optional[str] = Header(None, alias="X-User-Id"),
     authorization: Optional[str] = Header(None),
@@ -82,24 +150,7 @@ async def get_current_user(
             )
 
         try:
-            import jwt as pyjwt  # PyJWT — lightweight, no extra deps
-
-            payload = pyjwt.decode(
-                token,
-                settings.supabase_jwt_secret,
-                algorithms=["HS256"],
-                audience="authenticated",
-            )
-            user_id = payload.get("sub")
-            if not user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid token: missing subject",
-                )
-            return AuthenticatedUser(
-                id=_validate_user_id(user_id),
-                email=payload.get("email"),
-            )
+            return _verify_token(token)
         except HTTPException:
             raise
         except Exception:
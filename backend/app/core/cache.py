@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class SingleFlight:
+    """Coalesce concurrent identical async reads into one upstream call.
+
+    The first caller for a key starts `loader` as a task; callers arriving
+    while it is in flight await the same task and get the same result or
+    exception. The key is released once the task finishes, so later calls
+    fetch again. The task is shielded from the callers: a client that
+    disconnects does not cancel the fetch the other waiters depend on.
+    Intended for use from the event loop only — no locking.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _release(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter went away
+            task.exception()
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result of `loader()`, sharing any in-flight call for `key`."""
+        task = self._calls.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(loader())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def forget(self, key: Hashable) -> None:
+        """Stop sharing the in-flight call for `key`; the next caller refetches."""
+        self._calls.pop(key, None)
+
+    def forget_all(self) -> None:
+        self._calls.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring."""
+        return {
+            "in_flight": len(self._calls),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
+
+
+class TTLCache:
+    """Bounded in-memory cache with TTL expiry and LRU eviction.
+
+    Entries are fresh for `ttl` seconds (or a per-entry ttl passed to set()).
+    Expired entries are kept (until evicted or `stale_ttl` has passed) so
+    they can be served if the upstream fetch fails. Concurrent misses for
+    the same key share one loader call (see SingleFlight). Intended for use
+    from the event loop only — no locking.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, stale_ttl: float = 0.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._flights = SingleFlight()
+        # Bumped by invalidate()/clear() so a fetch that started before an
+        # invalidation does not store its possibly outdated result
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: Hashable, grace: float) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if time.monotonic() > expires_at + grace:
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the fresh value for `key`, or `default` if absent/expired."""
+        value = self._lookup(key, 0.0)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key`, evicting least recently used entries.
+
+        `ttl` overrides the cache-wide TTL for this entry.
+        """
+        expires_in = self.ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + expires_in, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop a single key. Returns True if it was present."""
+        self._generation += 1
+        self._flights.forget(key)
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        self._generation += 1
+        self._flights.forget_all()
+        self._entries.clear()
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for `key`, calling `loader` on a miss.
+
+        Concurrent misses for `key` wait on a single `loader` call. If
+        `loader` raises and a stale entry younger than `stale_ttl` exists,
+        the stale value is served and the error is logged instead of raised.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        generation = self._generation
+
+        async def load_and_store() -> Any:
+            loaded = await loader()
+            if generation == self._generation:
+                self.set(key, loaded)
+            return loaded
+
+        try:
+            return await self._flights.do(key, load_and_store)
+        except Exception:
+            stale = self._lookup(key, self.stale_ttl)
+            if stale is _MISSING:
+                raise
+            self.stale_hits += 1
+            logger.warning("Serving stale cache entry for %r after upstream error", key, exc_info=True)
+            return stale
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "evictions": self.evictions,
+            "coalesced": self._flights.coalesced,
+        }
+
+
+# Shared cache for public roadmap/node reads. Catalog data only changes when
+# the seed scripts run, so a short TTL keeps it fresh enough.
+catalog_cache = TTLCache(
+    maxsize=settings.catalog_cache_maxsize,
+    ttl=settings.catalog_cache_ttl,
+    stale_ttl=settings.catalog_cache_stale_ttl,
+)
+
+
+# Shared single-flight group for uncached keyed reads in the routers, e.g.
+# catalog-wide rows fetched on every journey request. Keys must include
+# everything the result depends on (user id for user-scoped reads).
+read_flights = SingleFlight()
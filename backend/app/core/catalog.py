@@ -0,0 +1,106 @@
+import hashlib
+import json
+from typing import Any, Dict, Mapping, Optional
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from app.core.compression import compress_variants, negotiate
+from app.core.config import settings
+
+
+def compute_etag(data: Any) -> str:
+    """Strong ETag from a hash of the canonical JSON form of `data`."""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return '"' + hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+class CatalogEntry:
+    """A cached catalog payload with its precomputed ETag and JSON body.
+
+    Built once when the cache is filled so conditional requests can be
+    answered by comparing strings, without touching the payload. With an
+    `adapter` (the route's response model), the payload is validated and
+    serialized here once; requests then send `body` as-is instead of
+    re-validating and re-encoding it every time. `body` is None when
+    there is no payload (e.g. a missing row). Compressed `variants` of the
+    body are also built here, so they are not recompressed per request.
+    """
+
+    __slots__ = ("data", "etag", "body", "variants")
+
+    def __init__(self, data: Any, adapter: Optional[TypeAdapter] = None):
+        self.data = data
+        self.etag = compute_etag(data)
+        self.body: Optional[bytes] = None
+        self.variants: Dict[str, bytes] = {}
+        if adapter is not None and data is not None:
+            self.body = adapter.dump_json(adapter.validate_python(data))
+            self.variants = compress_variants(self.body)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against a strong ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        # If-None-Match uses weak comparison, so W/"x" matches "x"
+        if candidate.strip().removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _cache_headers(etag: str) -> dict:
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.catalog_http_max_age}",
+    }
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    if_none_match: Optional[str] = request.headers.get("if-none-match")
+    return bool(if_none_match) and _etag_matches(if_none_match, etag)
+
+
+def conditional_response(request: Request, response: Response, entry: CatalogEntry) -> Any:
+    """Answer a catalog read, honouring If-None-Match.
+
+    Returns a bare 304 when the client already has this version. Otherwise
+    sends the pre-serialized body, or, for entries built without an
+    adapter, sets ETag/Cache-Control on `response` and returns the payload
+    for the route to serialize.
+    """
+    if entry.body is not None:
+        return conditional_body_response(request, entry.body, entry.etag, entry.variants)
+
+    headers = _cache_headers(entry.etag)
+    if _not_modified(request, entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return entry.data
+
+
+def conditional_body_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    variants: Optional[Mapping[str, bytes]] = None,
+) -> Response:
+    """Like conditional_response(), for an already-serialized JSON body.
+
+    The body is sent as-is, skipping response_model validation. If the
+    client accepts one of the precompressed `variants`, that is sent
+    instead, with a weak ETag since its bytes differ from the identity body.
+    """
+    encoding = negotiate(request.headers.get("accept-encoding"), list(variants)) if variants else None
+    headers = _cache_headers(etag if encoding is None else "W/" + etag)
+    if variants:
+        headers["Vary"] = "Accept-Encoding"
+
+    if _not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if encoding is None:
+        return Response(content=body, media_type="application/json", headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(content=variants[encoding], media_type="application/json", headers=headers)
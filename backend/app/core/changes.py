@@ -0,0 +1,166 @@
+"""
+"Changes since" reads over per-user tables.
+
+A watermark is an opaque cursor over (updated_at, node_id), read oldest
+first with apply_since(). Watermarks trail the clock by
+`sync_watermark_lag` seconds: rows written that recently are returned but
+not passed, so a write committed after a later-timestamped one is still
+picked up by the next read. Deletions are read the same way from the
+deleted_user_rows tombstones (see migrations/20261017_add_change_feed.sql).
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.pagination import apply_since, decode_cursor, encode_cursor
+from app.core.supabase import execute
+
+
+def parse_time(value: Any) -> Optional[datetime]:
+    """Timestamp from a row or request as an aware UTC datetime."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def split_token(token: Optional[str], parts: int) -> List[Optional[str]]:
+    """Split a token joined by join_token() into `parts` watermarks.
+
+    Raises a 400 for anything malformed.
+    """
+    if not token:
+        return [None] * parts
+    watermarks = token.split(".")
+    if len(watermarks) != parts:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync token",
+        )
+    for watermark in watermarks:
+        if watermark:
+            decode_cursor(watermark)
+    return [watermark or None for watermark in watermarks]
+
+
+def join_token(watermarks: List[Optional[str]]) -> str:
+    """Combine per-table watermarks into one token."""
+    return ".".join(watermark or "" for watermark in watermarks)
+
+
+def check_retention(watermark: Optional[str]) -> None:
+    """Reject tombstone watermarks older than the retention window.
+
+    Deletions after that point may have been pruned, so the client must
+    rebuild its replica from scratch (an empty `since`).
+    """
+    if not watermark:
+        return
+    sort_value, _ = decode_cursor(watermark)
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.change_feed_retention_days)
+    if parse_time(sort_value) < cutoff:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Sync token expired; resync from the beginning",
+        )
+
+
+def horizon() -> datetime:
+    """Latest row time a watermark may pass."""
+    return datetime.now(timezone.utc) - timedelta(seconds=settings.sync_watermark_lag)
+
+
+def next_watermark(
+    rows: List[Dict[str, Any]],
+    has_more: bool,
+    previous: Optional[str],
+    limit_time: datetime,
+    sort_column: str = "updated_at",
+    tiebreak_column: str = "node_id",
+    advance_idle: bool = False,
+) -> Optional[str]:
+    """Watermark to resume from after sending `rows` (oldest first).
+
+    Rows newer than `limit_time` are sent but not passed. When more
+    changes remain the watermark always advances, so a burst of recent
+    writes cannot stall a client on the same page. With `advance_idle`,
+    a watermark no row moves past is moved up to `limit_time` itself, so
+    it records when the client last read the feed (see check_retention()).
+    Such a watermark has no tiebreak value and is read by time alone.
+    """
+    for row in reversed(rows):
+        if has_more or parse_time(row[sort_column]) <= limit_time:
+            return encode_cursor(row[sort_column], row[tiebreak_column])
+    if advance_idle:
+        return encode_cursor(limit_time.isoformat(), "")
+    return previous
+
+
+async def changes_since(
+    query: Any,
+    watermark: Optional[str],
+    limit: int,
+    sort_column: str = "updated_at",
+    tiebreak_column: str = "node_id",
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Rows of `query` after `watermark`, oldest first.
+
+    Returns:
+        (up to `limit` rows, whether more remain)
+    """
+    response = await execute(apply_since(query, sort_column, tiebreak_column, watermark, limit))
+    rows = response.data or []
+    return rows[:limit], len(rows) > limit
+
+
+async def deletions_since(
+    supabase,
+    table: str,
+    user_id: str,
+    watermark: Optional[str],
+    limit: int,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Tombstones of `user_id`'s rows deleted from `table` after `watermark`."""
+    return await changes_since(
+        supabase.table("deleted_user_rows")
+        .select("node_id, deleted_at")
+        .eq("user_id", user_id)
+        .eq("table_name", table),
+        watermark, limit, "deleted_at", "node_id",
+    )
+
+
+async def read_feed(supabase, table: str, query: Any, user_id: str, since: str, limit: int) -> Dict[str, Any]:
+    """One page of a table's change feed: changed rows and tombstones.
+
+    `query` selects the user's rows of `table`; `since` is the token
+    from the previous page, or empty to start from the beginning.
+
+    Returns:
+        items, deleted, next_since and has_more for a list response
+    """
+    rows_watermark, deleted_watermark = split_token(since, 2)
+    check_retention(deleted_watermark)
+
+    (rows, rows_more), (deleted, deleted_more) = await asyncio.gather(
+        changes_since(query, rows_watermark, limit),
+        deletions_since(supabase, table, user_id, deleted_watermark, limit),
+    )
+
+    limit_time = horizon()
+    return {
+        "items": rows,
+        "deleted": deleted,
+        "next_since": join_token([
+            next_watermark(rows, rows_more, rows_watermark, limit_time),
+            next_watermark(deleted, deleted_more, deleted_watermark, limit_time, "deleted_at", advance_idle=True),
+        ]),
+        "has_more": rows_more or deleted_more,
+    }
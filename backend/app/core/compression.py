@@ -0,0 +1,199 @@
+"""
+Negotiated response compression.
+
+gzip is always available; brotli (`brotli` package) and zstd (`zstandard`
+package) are used when installed. CompressionMiddleware compresses dynamic
+responses per request. Catalog responses are compressed once per cache
+fill, or once at build time for the snapshot (see compress_variants()), and
+sent with Content-Encoding already set, which the middleware passes through.
+"""
+
+import gzip
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Content types worth compressing; everything else (images, already
+# compressed archives) is passed through
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+# Server preference when the client accepts several encodings equally
+_PREFERENCE = ("br", "zstd", "gzip")
+
+
+def _gzip(body: bytes, best: bool) -> bytes:
+    return gzip.compress(body, compresslevel=9 if best else 6, mtime=0)
+
+
+def _brotli(body: bytes, best: bool) -> bytes:
+    # Text mode suits JSON with long markdown strings
+    return brotli.compress(body, mode=brotli.MODE_TEXT, quality=11 if best else 4)
+
+
+def _zstd(body: bytes, best: bool) -> bytes:
+    return zstandard.ZstdCompressor(level=19 if best else 3).compress(body)
+
+
+_ENCODERS = {"gzip": _gzip}
+if brotli is not None:
+    _ENCODERS["br"] = _brotli
+if zstandard is not None:
+    _ENCODERS["zstd"] = _zstd
+
+
+def available_encodings() -> List[str]:
+    """Encodings this process can produce, in server preference order."""
+    return [encoding for encoding in _PREFERENCE if encoding in _ENCODERS]
+
+
+def compress(body: bytes, encoding: str, best: bool = False) -> bytes:
+    """Compress `body`. `best` trades CPU for size, for bodies compressed once."""
+    return _ENCODERS[encoding](body, best)
+
+
+def negotiate(accept_encoding: Optional[str], offered: Sequence[str]) -> Optional[str]:
+    """Pick the encoding to use from an Accept-Encoding header, or None.
+
+    Honours q-values (q=0 refuses an encoding, `*` covers unlisted ones);
+    ties go to the order of `offered`.
+    """
+    if not accept_encoding or not offered:
+        return None
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name] = quality
+
+    best: Optional[str] = None
+    best_quality = 0.0
+    for encoding in offered:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress_variants(body: bytes, best: bool = False) -> Dict[str, bytes]:
+    """Compressed copies of `body` for every available encoding.
+
+    Bodies under the size threshold, or that do not shrink, get none.
+    `best` is meant for offline builds: brotli at its top level costs tens
+    of milliseconds per body, too slow for a cache fill on a request path.
+    """
+    if len(body) < settings.compression_minimum_size:
+        return {}
+    variants = {}
+    for encoding in available_encodings():
+        compressed = compress(body, encoding, best=best)
+        if len(compressed) < len(body):
+            variants[encoding] = compressed
+    return variants
+
+
+def _is_compressible(headers: List[Tuple[bytes, bytes]]) -> bool:
+    content_type = ""
+    for name, value in headers:
+        lowered = name.lower()
+        if lowered == b"content-encoding":
+            return False
+        if lowered == b"content-type":
+            content_type = value.decode("latin-1").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing buffered responses above a size threshold.
+
+    Responses that already carry Content-Encoding (precomputed catalog
+    variants) or have a non-text content type are passed through, as are
+    streaming responses. A strong ETag on a compressed response is made
+    weak, since it no longer names the identity bytes.
+    """
+
+    def __init__(self, app, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size = settings.compression_minimum_size if minimum_size is None else minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = None
+        for name, value in scope.get("headers", []):
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = negotiate(accept_encoding, available_encodings())
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                if _is_compressible(message.get("headers", [])):
+                    start_message = message
+                else:
+                    passthrough = True
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            headers = []
+            for name, value in start_message.get("headers", []):
+                lowered = name.lower()
+                if lowered == b"content-length":
+                    continue
+                if lowered == b"etag" and not value.startswith(b"W/"):
+                    # The compressed bytes are a different representation
+                    value = b"W/" + value
+                headers.append((name, value))
+            headers += [
+                (b"content-encoding", encoding.encode("latin-1")),
+                (b"content-length", str(len(compressed)).encode("latin-1")),
+                (b"vary", b"Accept-Encoding"),
+            ]
+            await send({**start_message, "headers": headers})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
@@ -10,6 +10,75 @@ class Settings(BaseSettings):
     supabase_service_role_key: str = ""
     supabase_jwt_secret: str = ""
 
+    # Maximum number of Supabase calls running concurrently on worker threads
+    supabase_max_workers: int = 16
+
+    # Supabase HTTP transport: connection pool, keep-alive, timeouts (seconds)
+    # and HTTP/2 multiplexing (needs the h2 package, installed via httpx[http2])
+    supabase_http2: bool = True
+    supabase_pool_max_connections: int = 32
+    supabase_pool_max_keepalive: int = 16
+    supabase_keepalive_expiry: float = 30.0
+    supabase_connect_timeout: float = 5.0
+    supabase_read_timeout: float = 15.0
+    supabase_write_timeout: float = 15.0
+    supabase_pool_timeout: float = 5.0
+
+    # Retries for idempotent reads on transient errors, with full-jitter
+    # exponential backoff starting at `retry_backoff` and capped at `_max`
+    supabase_read_retries: int = 2
+    supabase_retry_backoff: float = 0.1
+    supabase_retry_backoff_max: float = 2.0
+
+    # Catalog cache (roadmaps and nodes). Entries are fresh for `ttl` seconds
+    # and may be served up to `stale_ttl` seconds longer if Supabase errors.
+    catalog_cache_ttl: float = 300.0
+    catalog_cache_stale_ttl: float = 3600.0
+    catalog_cache_maxsize: int = 512
+
+    # Precompiled catalog snapshot served instead of Supabase when set
+    # (build it with `python -m scripts.compile_catalog --snapshot PATH`).
+    # Checked for changes at most every `check_interval` seconds.
+    catalog_snapshot_path: str = ""
+    catalog_snapshot_check_interval: float = 2.0
+
+    # Cache-Control max-age (seconds) sent with catalog responses
+    catalog_http_max_age: int = 60
+
+    # Responses smaller than this (bytes) are sent uncompressed
+    compression_minimum_size: int = 1024
+
+    # Cursor pagination for per-user and admin listings
+    page_size_default: int = 50
+    page_size_max: int = 200
+
+    # Offline sync: server changes returned per table per request, and how
+    # far (seconds) the sync watermark trails the clock, so rows committed
+    # slightly out of timestamp order are not skipped
+    sync_page_size: int = 500
+    sync_watermark_lag: float = 2.0
+    # Deletion tombstones are kept this long; older sync tokens get 410
+    change_feed_retention_days: int = 90
+
+    # Live event streams (GET /api/v1/events). EVENT_BUS_URL=redis://...
+    # fans events out across workers (needs the redis package); empty
+    # delivers within each worker only.
+    event_bus_url: str = ""
+    events_queue_size: int = 100
+    events_max_streams_per_user: int = 5
+    events_keepalive_interval: float = 15.0
+
+    # Note autosave write-behind (seconds). Saves to a note are held until it
+    # has been quiet for `delay`, and never longer than `max_delay`, then only
+    # the latest version is written. A delay of 0 writes every save through.
+    note_write_behind_delay: float = 2.0
+    note_write_behind_max_delay: float = 10.0
+    note_write_behind_max_pending: int = 10_000
+
+    # Verified JWT claims cache. Entries never outlive the token's own exp.
+    auth_claims_cache_maxsize: int = 10_000
+    auth_claims_cache_max_ttl: float = 3600.0
+
     # CORS
     frontend_url: str = "http://localhost:5173"
 
@@ -0,0 +1,204 @@
+"""
+Roadmap content format and compiled catalog artifact.
+
+Source layout, one directory per roadmap under backend/content/:
+
+    <roadmap-id>/roadmap.json     roadmap fields plus a "nodes" list
+    <roadmap-id>/nodes/<id>.md    optional markdown body for node <id>
+
+compile_catalog() validates every roadmap and node, adds derived fields
+(word_count, read_minutes) and returns a single catalog dict. It is written
+once as compact JSON (data/catalog.json) so the API and seed scripts can
+load it without re-parsing or re-validating the sources.
+"""
+
+import hashlib
+import json
+import math
+import re
+from pathlib import Path
+from typing import Any, Dict, List
+
+from pydantic import ValidationError
+
+from app.models.schemas import NodeBase, RoadmapBase
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+CONTENT_DIR = BACKEND_DIR / "content"
+CATALOG_PATH = BACKEND_DIR / "data" / "catalog.json"
+
+CATALOG_VERSION = 1
+
+# Reading speed used for read_minutes
+WORDS_PER_MINUTE = 200
+
+# Node keys allowed besides NodeBase fields. youtube_resources is stored in
+# its own JSONB column (see migrations/20251230_add_youtube_resources.sql).
+_EXTRA_NODE_KEYS = {"id", "youtube_resources"}
+_ROADMAP_KEYS = {"id", "title", "description", "nodes"}
+
+# Fields computed by the compiler; not stored in the nodes table
+DERIVED_NODE_FIELDS = ("word_count", "read_minutes")
+
+_LINK_TARGET = re.compile(r"\]\([^)]*\)")
+_WORD = re.compile(r"\w[\w'’-]*")
+
+
+class ContentError(ValueError):
+    """Roadmap sources failed validation. `errors` lists every problem found."""
+
+    def __init__(self, errors: List[str]):
+        super().__init__("Invalid roadmap content:\n  " + "\n  ".join(errors))
+        self.errors = errors
+
+
+def word_count(markdown: str) -> int:
+    """Count words in a markdown body, ignoring link targets."""
+    return len(_WORD.findall(_LINK_TARGET.sub("]", markdown)))
+
+
+def read_minutes(words: int) -> int:
+    """Estimated reading time in whole minutes (at least 1)."""
+    return max(1, math.ceil(words / WORDS_PER_MINUTE))
+
+
+def _format_validation_error(where: str, exc: ValidationError) -> List[str]:
+    return [
+        f"{where}: {'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+        for err in exc.errors()
+    ]
+
+
+def _compile_node(where: str, raw: Dict[str, Any], markdown_path: Path, errors: List[str]) -> Dict[str, Any]:
+    unknown = set(raw) - set(NodeBase.model_fields) - _EXTRA_NODE_KEYS
+    if unknown:
+        errors.append(f"{where}: unknown keys {sorted(unknown)}")
+
+    node = dict(raw)
+    if markdown_path.exists():
+        if "content" in raw:
+            errors.append(f"{where}: content set inline and in {markdown_path.name}")
+        node["content"] = markdown_path.read_text(encoding="utf-8").strip()
+
+    try:
+        validated = NodeBase.model_validate(node)
+    except ValidationError as exc:
+        errors.extend(_format_validation_error(where, exc))
+        return node
+
+    # Only keys present in the source, so seeding never nulls out columns
+    # a roadmap does not manage
+    compiled = {"id": node["id"], **validated.model_dump(exclude_unset=True)}
+    if "youtube_resources" in node:
+        compiled["youtube_resources"] = node["youtube_resources"]
+    compiled["word_count"] = word_count(compiled.get("content") or "")
+    compiled["read_minutes"] = read_minutes(compiled["word_count"])
+    return compiled
+
+
+def _compile_roadmap(roadmap_dir: Path, errors: List[str]) -> Dict[str, Any]:
+    manifest_path = roadmap_dir / "roadmap.json"
+    where = f"{roadmap_dir.name}/roadmap.json"
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        errors.append(f"{where}: {exc}")
+        return {}
+
+    unknown = set(manifest) - _ROADMAP_KEYS
+    if unknown:
+        errors.append(f"{where}: unknown keys {sorted(unknown)}")
+    if manifest.get("id") != roadmap_dir.name:
+        errors.append(f"{where}: id {manifest.get('id')!r} does not match directory name")
+    try:
+        roadmap = RoadmapBase.model_validate(manifest)
+    except ValidationError as exc:
+        errors.extend(_format_validation_error(where, exc))
+        return {}
+
+    nodes_dir = roadmap_dir / "nodes"
+    nodes: List[Dict[str, Any]] = []
+    seen_order: Dict[int, str] = {}
+    for index, raw in enumerate(manifest.get("nodes") or []):
+        node_id = raw.get("id") if isinstance(raw, dict) else None
+        if not node_id or not isinstance(node_id, str):
+            errors.append(f"{where}: nodes[{index}]: missing id")
+            continue
+        node = _compile_node(f"{where}: {node_id}", raw, nodes_dir / f"{node_id}.md", errors)
+        order = node.get("order_index")
+        if order in seen_order:
+            errors.append(f"{where}: {node_id}: order_index {order} already used by {seen_order[order]}")
+        seen_order[order] = node_id
+        nodes.append(node)
+
+    known = {node["id"] for node in nodes}
+    if nodes_dir.is_dir():
+        for path in sorted(nodes_dir.glob("*.md")):
+            if path.stem not in known:
+                errors.append(f"{roadmap_dir.name}/nodes/{path.name}: no node with id {path.stem!r}")
+
+    nodes.sort(key=lambda node: node.get("order_index", 0))
+    return {"id": manifest.get("id"), **roadmap.model_dump(), "nodes": nodes}
+
+
+def compile_catalog(content_dir: Path = CONTENT_DIR) -> Dict[str, Any]:
+    """Validate every roadmap under `content_dir` and build the catalog.
+
+    Raises:
+        ContentError: listing every validation problem found
+    """
+    errors: List[str] = []
+    roadmaps = [
+        _compile_roadmap(path, errors)
+        for path in sorted(content_dir.iterdir())
+        if path.is_dir()
+    ]
+
+    owners: Dict[str, str] = {}
+    for roadmap in roadmaps:
+        for node in roadmap.get("nodes", []):
+            if node["id"] in owners:
+                errors.append(f"{roadmap['id']}: node id {node['id']!r} also used in {owners[node['id']]}")
+            owners[node["id"]] = roadmap["id"]
+
+    if errors:
+        raise ContentError(errors)
+
+    body = json.dumps(roadmaps, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return {
+        "version": CATALOG_VERSION,
+        "source_hash": hashlib.sha256(body.encode("utf-8")).hexdigest(),
+        "roadmaps": roadmaps,
+    }
+
+
+def dump_catalog(catalog: Dict[str, Any]) -> str:
+    """Serialize a catalog in its compact on-disk form."""
+    return json.dumps(catalog, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def write_catalog(catalog: Dict[str, Any], path: Path = CATALOG_PATH) -> None:
+    """Write the catalog artifact atomically."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(dump_catalog(catalog), encoding="utf-8")
+    tmp.replace(path)
+
+
+def load_catalog(path: Path = CATALOG_PATH) -> Dict[str, Any]:
+    """Load a compiled catalog artifact. No validation is repeated."""
+    with open(path, "r", encoding="utf-8") as f:
+        catalog = json.load(f)
+    if catalog.get("version") != CATALOG_VERSION:
+        raise ValueError(
+            f"{path} is catalog version {catalog.get('version')}, expected {CATALOG_VERSION}; "
+            "rebuild it with: python -m scripts.compile_catalog"
+        )
+    return catalog
+
+
+def find_roadmap(catalog: Dict[str, Any], roadmap_id: str) -> Dict[str, Any]:
+    """Return one roadmap (with its nodes) from a loaded catalog."""
+    for roadmap in catalog["roadmaps"]:
+        if roadmap["id"] == roadmap_id:
+            return roadmap
+    raise KeyError(roadmap_id)
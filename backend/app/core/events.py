@@ -0,0 +1,221 @@
+"""
+Per-user change events for live updates across devices.
+
+Writes to user_progress and notes publish an event on the EventBus; each
+open event stream (GET /api/v1/events) holds a subscription that receives
+the events of its user. Events are handed to this worker's subscribers
+directly; the backend fans them out to other workers:
+
+- InProcessBackend (default) does nothing: single-worker deployments.
+- RedisBackend (EVENT_BUS_URL=redis://..., needs the `redis` package)
+  relays events through Redis pub/sub to every other worker.
+
+Delivery is best effort: a subscriber that falls `queue_size` events
+behind is closed, and clients catch up through the change feed
+(GET /progress?since=, GET /notes?since=) after reconnecting.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Callable, Dict, Optional, Set
+
+from app.core.config import settings
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - optional dependency
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+# Redis channel prefix; the user id follows
+CHANNEL_PREFIX = "skilltrail:events:"
+
+Deliver = Callable[[str, str], None]
+
+
+class InProcessBackend:
+    """No fan-out: events reach subscribers in the publishing worker only."""
+
+    async def start(self, deliver: Deliver) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def publish(self, user_id: str, payload: str) -> None:
+        pass
+
+
+class RedisBackend:
+    """Fan events out across workers through Redis pub/sub.
+
+    One pattern subscription per process feeds every local subscriber,
+    so the number of Redis connections does not grow with open streams.
+    Messages carry the publishing process's id so it skips its own,
+    which the bus has already delivered locally.
+    """
+
+    def __init__(self, url: str):
+        if aioredis is None:
+            raise RuntimeError("EVENT_BUS_URL is set but the redis package is not installed")
+        self._client = aioredis.from_url(url)
+        self._origin = uuid.uuid4().hex
+        self._listener: Optional["asyncio.Task[None]"] = None
+
+    async def start(self, deliver: Deliver) -> None:
+        pubsub = self._client.pubsub()
+        await pubsub.psubscribe(CHANNEL_PREFIX + "*")
+        self._listener = asyncio.ensure_future(self._listen(pubsub, deliver))
+
+    async def _listen(self, pubsub, deliver: Deliver) -> None:
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                channel = message["channel"]
+                data = message["data"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode("utf-8")
+                if isinstance(data, bytes):
+                    data = data.decode("utf-8")
+                origin, _, payload = data.partition(" ")
+                if origin != self._origin:
+                    deliver(channel[len(CHANNEL_PREFIX):], payload)
+        finally:
+            await pubsub.aclose()
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        await self._client.aclose()
+
+    async def publish(self, user_id: str, payload: str) -> None:
+        await self._client.publish(CHANNEL_PREFIX + user_id, f"{self._origin} {payload}")
+
+
+class Subscription:
+    """One open event stream's queue of serialized events."""
+
+    def __init__(self, user_id: str, queue_size: int):
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=queue_size)
+        self.closed = False
+
+    def _offer(self, payload: str) -> bool:
+        """Queue `payload`; False if the subscriber has fallen too far behind."""
+        try:
+            self.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def close(self) -> None:
+        """End the stream; the consumer sees None after queued events."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # Make room for the end marker; the client resyncs anyway
+            self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    async def next(self, timeout: float) -> Optional[str]:
+        """The next event, or None once the subscription is closed.
+
+        Raises:
+            asyncio.TimeoutError: if nothing arrives within `timeout` seconds
+        """
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+
+class EventBus:
+    """Publish per-user events and hand them to local subscribers."""
+
+    def __init__(self, backend=None, queue_size: int = 100, max_streams_per_user: int = 5):
+        self.backend = backend if backend is not None else InProcessBackend()
+        self.queue_size = queue_size
+        self.max_streams_per_user = max_streams_per_user
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.publish_errors = 0
+
+    async def start(self) -> None:
+        await self.backend.start(self._deliver)
+
+    async def stop(self) -> None:
+        for subscriptions in list(self._subscribers.values()):
+            for subscription in list(subscriptions):
+                subscription.close()
+        await self.backend.stop()
+
+    def _deliver(self, user_id: str, payload: str) -> None:
+        for subscription in list(self._subscribers.get(user_id, ())):
+            if subscription._offer(payload):
+                self.delivered += 1
+            else:
+                self.dropped += 1
+                logger.warning("Closing slow event stream for user %s", user_id)
+                self.unsubscribe(subscription)
+                subscription.close()
+
+    async def publish(self, user_id: str, event_type: str, data: Any) -> None:
+        """Deliver an event to `user_id`'s streams here and on other workers.
+
+        Never raises: a write must not fail because its event could not be sent.
+        """
+        payload = json.dumps({"type": event_type, "data": data}, separators=(",", ":"), default=str)
+        self._deliver(user_id, payload)
+        try:
+            await self.backend.publish(user_id, payload)
+            self.published += 1
+        except Exception:
+            self.publish_errors += 1
+            logger.exception("Failed to publish %s event for user %s", event_type, user_id)
+
+    def subscribe(self, user_id: str) -> Optional[Subscription]:
+        """Open a subscription, or None if the user has too many streams open."""
+        subscriptions = self._subscribers.setdefault(user_id, set())
+        if len(subscriptions) >= self.max_streams_per_user:
+            return None
+        subscription = Subscription(user_id, self.queue_size)
+        subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscribers.get(subscription.user_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscribers[subscription.user_id]
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring."""
+        return {
+            "streams": sum(len(subscriptions) for subscriptions in self._subscribers.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "publish_errors": self.publish_errors,
+        }
+
+
+def _create_backend():
+    if settings.event_bus_url:
+        return RedisBackend(settings.event_bus_url)
+    return InProcessBackend()
+
+
+event_bus = EventBus(
+    _create_backend(),
+    queue_size=settings.events_queue_size,
+    max_streams_per_user=settings.events_max_streams_per_user,
+)
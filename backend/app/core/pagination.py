@@ -0,0 +1,93 @@
+import base64
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(sort_value: Any, tiebreak_value: Any) -> str:
+    """Encode the last row's sort key into an opaque, URL-safe cursor."""
+    raw = json.dumps([sort_value, tiebreak_value], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor produced by encode_cursor().
+
+    Raises a 400 for anything malformed so callers cannot smuggle
+    arbitrary filter syntax through the cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, tiebreak_value = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(sort_value, str) or not isinstance(tiebreak_value, str):
+            raise ValueError("cursor values must be strings")
+        if any(c in value for value in (sort_value, tiebreak_value) for c in '"\\'):
+            raise ValueError("cursor values contain reserved characters")
+        return sort_value, tiebreak_value
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def apply_keyset(query: Any, sort_column: str, tiebreak_column: str, cursor: Optional[str], limit: int) -> Any:
+    """Order a PostgREST query newest-first and seek past `cursor`.
+
+    Fetches `limit + 1` rows so paginate() can tell whether another page
+    exists without a separate count query. `sort_column` must be non-null
+    (timestamps defaulting to NOW()) and `tiebreak_column` unique per row.
+    """
+    if cursor:
+        sort_value, tiebreak_value = decode_cursor(cursor)
+        query = query.or_(
+            f'{sort_column}.lt."{sort_value}",'
+            f'and({sort_column}.eq."{sort_value}",{tiebreak_column}.lt."{tiebreak_value}")'
+        )
+    return (
+        query
+        .order(sort_column, desc=True)
+        .order(tiebreak_column, desc=True)
+        .limit(limit + 1)
+    )
+
+
+def apply_since(query: Any, sort_column: str, tiebreak_column: str, cursor: Optional[str], limit: int) -> Any:
+    """Order a PostgREST query oldest-first and seek past a `cursor` watermark.
+
+    The ascending counterpart of apply_keyset(), for "changes since"
+    reads: rows after the watermark in (sort_column, tiebreak_column)
+    order, `limit + 1` of them so callers can tell whether more remain.
+    A watermark with an empty tiebreak value (not taken from a row, see
+    changes.next_watermark()) seeks on `sort_column` alone, as "" is not
+    a valid value for typed columns such as uuids.
+    """
+    if cursor:
+        sort_value, tiebreak_value = decode_cursor(cursor)
+        if tiebreak_value:
+            query = query.or_(
+                f'{sort_column}.gt."{sort_value}",'
+                f'and({sort_column}.eq."{sort_value}",{tiebreak_column}.gt."{tiebreak_value}")'
+            )
+        else:
+            query = query.gt(sort_column, sort_value)
+    return (
+        query
+        .order(sort_column)
+        .order(tiebreak_column)
+        .limit(limit + 1)
+    )
+
+
+def paginate(rows: List[Dict[str, Any]], limit: int, sort_column: str, tiebreak_column: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Trim the look-ahead row and build the next cursor.
+
+    Returns:
+        (rows for this page, cursor for the next page or None)
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor(last.get(sort_column), last.get(tiebreak_column))
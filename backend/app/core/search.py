@@ -0,0 +1,362 @@
+"""
+In-process full-text search over roadmap node content.
+
+NodeSearchIndex is an inverted index over each node's title,
+short_summary, tldr and markdown content. Hits are ranked with BM25,
+with per-field weights folded into the term frequencies (BM25F style),
+so a title match outranks the same word deep in the content. A query
+term also matches index terms it is a prefix of ("rebas" finds "rebase"
+and "rebasing"); the term list is kept sorted so each prefix is one
+bisect. Every query term must match. Hits carry a plain-text snippet
+and the character ranges to highlight in it; clients render the
+highlights, so no markup is injected into node text.
+
+refresh() keeps the index in line with the nodes table incrementally:
+it lists node ids with their content_hash (see scripts/seeding.py) and
+re-fetches and re-indexes only nodes whose hash changed, dropping
+removed ones.
+
+Notes are searched in Postgres instead (search_notes(), see
+migrations/20261017_add_note_search.sql); prefix_tsquery() and
+split_highlights() adapt its input and output to the same hit shape.
+"""
+
+import asyncio
+import bisect
+import hashlib
+import heapq
+import json
+import math
+import re
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from app.core.supabase import execute
+
+# Weight of a term occurrence in each indexed field
+FIELD_WEIGHTS = {"title": 3.0, "short_summary": 1.5, "tldr": 1.5, "content": 1.0}
+
+# Fields a snippet is taken from, in order of preference
+SNIPPET_FIELDS = ("content", "tldr", "short_summary")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Score factor for a prefix expansion relative to an exact term match
+PREFIX_WEIGHT = 0.8
+# Shortest query term that is expanded as a prefix
+MIN_PREFIX = 2
+# Upper bound on index terms a single prefix expands to
+MAX_EXPANSIONS = 64
+
+SNIPPET_CHARS = 160
+# Context kept before the first highlighted match
+SNIPPET_LEAD = 40
+
+# Columns needed to index a node
+_COLUMNS = "id, roadmap_id, title, short_summary, tldr, content, content_hash"
+# Node ids per fetch, keeping the in.() filter well under URL limits
+_FETCH_CHUNK = 100
+
+_TOKEN = re.compile(r"[^\W_]+")
+_LINK_TARGET = re.compile(r"\]\([^)]*\)")
+_MARKUP = re.compile(r"[`*#>|~]+|!?\[|\]")
+_SPACE = re.compile(r"\s+")
+
+Span = Tuple[int, int, str]
+
+# Match delimiters in snippets returned by search_notes()
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens of `text`."""
+    return [match.group().lower() for match in _TOKEN.finditer(text)]
+
+
+def plain_text(markdown: Optional[str]) -> str:
+    """Markdown reduced to the text a reader sees, on one line."""
+    if not markdown:
+        return ""
+    text = _MARKUP.sub("", _LINK_TARGET.sub("]", markdown))
+    return _SPACE.sub(" ", text).strip()
+
+
+def _spans(text: str) -> List[Span]:
+    return [(match.start(), match.end(), match.group().lower()) for match in _TOKEN.finditer(text)]
+
+
+def prefix_tsquery(query: str) -> str:
+    """to_tsquery() input matching every word of `query` as a prefix.
+
+    Built from word tokens only, so user input cannot inject tsquery
+    operators. Empty if `query` has no words.
+    """
+    return " & ".join(f"{term}:*" for term in dict.fromkeys(tokenize(query)))
+
+
+def split_highlights(marked: str) -> Tuple[str, List[List[int]]]:
+    """Strip HIGHLIGHT_START/STOP marks from a snippet.
+
+    Returns:
+        The plain snippet and the [start, end) ranges that were marked
+    """
+    text: List[str] = []
+    highlights: List[List[int]] = []
+    length = 0
+    start: Optional[int] = None
+    for part in re.split(f"([{HIGHLIGHT_START}{HIGHLIGHT_STOP}])", marked):
+        if part == HIGHLIGHT_START:
+            start = length
+        elif part == HIGHLIGHT_STOP:
+            if start is not None and length > start:
+                highlights.append([start, length])
+            start = None
+        else:
+            text.append(part)
+            length += len(part)
+    return "".join(text), highlights
+
+
+def fingerprint(row: Dict[str, Any]) -> str:
+    """Identity of a node's indexed content: its content_hash when seeded."""
+    if row.get("content_hash"):
+        return row["content_hash"]
+    fields = {field: row.get(field) for field in ("roadmap_id", *FIELD_WEIGHTS)}
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class _Document:
+    __slots__ = ("id", "roadmap_id", "title", "fingerprint", "frequencies", "length", "fields")
+
+    def __init__(self, row: Dict[str, Any]):
+        self.id: str = row["id"]
+        self.roadmap_id: Optional[str] = row.get("roadmap_id")
+        self.title: str = row.get("title") or ""
+        self.fingerprint = fingerprint(row)
+        # Weighted term frequencies and the weighted document length
+        self.frequencies: Dict[str, float] = {}
+        self.length = 0.0
+        # (plain text, token spans) of each snippet field
+        self.fields: List[Tuple[str, List[Span]]] = []
+
+        texts = {field: plain_text(row.get(field)) for field in FIELD_WEIGHTS}
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(texts[field]):
+                self.frequencies[term] = self.frequencies.get(term, 0.0) + weight
+                self.length += weight
+        for field in SNIPPET_FIELDS:
+            if texts[field]:
+                self.fields.append((texts[field], _spans(texts[field])))
+
+    def snippet(self, matched: Set[str]) -> Tuple[str, List[List[int]]]:
+        """A window of text around the first matched term, and its highlights."""
+        for text, spans in self.fields:
+            hits = [(start, end) for start, end, term in spans if term in matched]
+            if hits:
+                break
+        else:
+            if not self.fields:
+                return "", []
+            text, hits = self.fields[0][0], []
+
+        start = 0
+        if hits and hits[0][0] > SNIPPET_LEAD:
+            start = hits[0][0] - SNIPPET_LEAD
+            space = text.find(" ", start, hits[0][0])
+            if space != -1:
+                start = space + 1
+        end = min(len(text), start + SNIPPET_CHARS)
+        if end < len(text):
+            space = text.rfind(" ", start, end)
+            if space > (hits[0][1] if hits else start):
+                end = space
+
+        prefix = "…" if start > 0 else ""
+        suffix = "…" if end < len(text) else ""
+        shift = len(prefix) - start
+        highlights = [[s + shift, e + shift] for s, e in hits if s >= start and e <= end]
+        return prefix + text[start:end] + suffix, highlights
+
+
+class NodeSearchIndex:
+    """Inverted index over roadmap nodes, ranked with BM25.
+
+    Mutations are synchronous, so a search never sees a node half
+    indexed. Intended for use from the event loop only — no locking.
+    """
+
+    def __init__(self):
+        self._documents: Dict[str, _Document] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        # Sorted keys of _postings, for prefix expansion
+        self._terms: List[str] = []
+        self._total_length = 0.0
+        self.queries = 0
+        self.indexed = 0
+        self.removed = 0
+        self.refreshes = 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, row: Dict[str, Any]) -> bool:
+        """Index a node row, replacing its previous version.
+
+        Returns False (and does nothing) if the node is indexed unchanged.
+        """
+        current = self._documents.get(row["id"])
+        if current is not None and current.fingerprint == fingerprint(row):
+            return False
+        if current is not None:
+            self._unindex(current)
+
+        document = _Document(row)
+        self._documents[document.id] = document
+        self._total_length += document.length
+        for term, frequency in document.frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                bisect.insort(self._terms, term)
+            postings[document.id] = frequency
+        self.indexed += 1
+        return True
+
+    def remove(self, node_id: str) -> bool:
+        """Drop a node from the index. Returns True if it was indexed."""
+        document = self._documents.pop(node_id, None)
+        if document is None:
+            return False
+        self._unindex(document)
+        self.removed += 1
+        return True
+
+    def _unindex(self, document: _Document) -> None:
+        self._documents.pop(document.id, None)
+        self._total_length -= document.length
+        for term in document.frequencies:
+            postings = self._postings[term]
+            del postings[document.id]
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect.bisect_left(self._terms, term)]
+
+    def clear(self) -> None:
+        """Drop every node. Counters are kept."""
+        self._documents.clear()
+        self._postings.clear()
+        self._terms.clear()
+        self._total_length = 0.0
+
+    def _expand(self, term: str) -> Iterator[Tuple[str, float]]:
+        """Index terms matching a query term, with their score factor."""
+        if term in self._postings:
+            yield term, 1.0
+        if len(term) < MIN_PREFIX:
+            return
+        position = bisect.bisect_right(self._terms, term)
+        for candidate in self._terms[position:position + MAX_EXPANSIONS]:
+            if not candidate.startswith(term):
+                break
+            yield candidate, PREFIX_WEIGHT
+
+    def search(self, query: str, limit: int = 20, roadmap_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Best matching nodes for `query`, highest score first.
+
+        Returns:
+            Hits with id, roadmap_id, title, score, snippet and highlights
+            ([start, end) character ranges within the snippet)
+        """
+        self.queries += 1
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._documents:
+            return []
+
+        count = len(self._documents)
+        average_length = self._total_length / count
+        scores: Optional[Dict[str, float]] = None
+        matched: Set[str] = set()
+        for term in terms:
+            # Best scoring expansion per node, so one prefix matching many
+            # words in a node does not add up
+            term_scores: Dict[str, float] = {}
+            for candidate, factor in self._expand(term):
+                postings = self._postings[candidate]
+                matched.add(candidate)
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for node_id, frequency in postings.items():
+                    if scores is not None and node_id not in scores:
+                        continue
+                    norm = K1 * (1 - B + B * self._documents[node_id].length / average_length)
+                    score = factor * idf * frequency * (K1 + 1) / (frequency + norm)
+                    if score > term_scores.get(node_id, 0.0):
+                        term_scores[node_id] = score
+            if scores is not None:
+                term_scores = {node_id: score + scores[node_id] for node_id, score in term_scores.items()}
+            scores = term_scores
+            if not scores:
+                return []
+
+        if roadmap_id is not None:
+            scores = {
+                node_id: score for node_id, score in scores.items()
+                if self._documents[node_id].roadmap_id == roadmap_id
+            }
+
+        hits = []
+        for node_id, score in heapq.nlargest(limit, scores.items(), key=lambda item: item[1]):
+            document = self._documents[node_id]
+            snippet, highlights = document.snippet(matched)
+            hits.append({
+                "id": document.id,
+                "roadmap_id": document.roadmap_id,
+                "title": document.title,
+                "score": round(score, 4),
+                "snippet": snippet,
+                "highlights": highlights,
+            })
+        return hits
+
+    async def refresh(self, supabase) -> int:
+        """Re-index nodes changed in the nodes table since the last refresh.
+
+        Returns:
+            The number of nodes added, updated or removed
+        """
+        response = await execute(supabase.table("nodes").select("id, content_hash"))
+        current = {row["id"]: row.get("content_hash") for row in response.data or []}
+        # Rows without a content_hash are refetched and compared by content
+        changed = [
+            node_id for node_id, digest in current.items()
+            if not digest or node_id not in self._documents or self._documents[node_id].fingerprint != digest
+        ]
+        responses = await asyncio.gather(*(
+            execute(supabase.table("nodes").select(_COLUMNS).in_("id", changed[i:i + _FETCH_CHUNK]))
+            for i in range(0, len(changed), _FETCH_CHUNK)
+        ))
+
+        # Applied only after every fetch succeeded, without awaiting
+        updates = 0
+        for node_id in [node_id for node_id in self._documents if node_id not in current]:
+            updates += self.remove(node_id)
+        for chunk in responses:
+            for row in chunk.data or []:
+                updates += self.add(row)
+        self.refreshes += 1
+        return updates
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring."""
+        return {
+            "nodes": len(self._documents),
+            "terms": len(self._terms),
+            "queries": self.queries,
+            "indexed": self.indexed,
+            "removed": self.removed,
+            "refreshes": self.refreshes,
+        }
+
+
+node_search = NodeSearchIndex()
@@ -0,0 +1,244 @@
+"""
+Memory-mapped catalog snapshot.
+
+A snapshot file holds the pre-serialized JSON body and ETag of every public
+catalog response, built from the compiled catalog (see app/core/content.py).
+When CATALOG_SNAPSHOT_PATH is set, catalog routes answer from it without
+touching Supabase. The file is mmap'ed read-only, so worker processes on
+one host share its pages, and it is reloaded when it is replaced on disk.
+Keys missing from the snapshot fall back to Supabase.
+
+File layout:
+
+    MAGIC | header length (4 bytes, big-endian) | header JSON | bodies
+
+The header maps each key to [offset, length, etag, variants] within the
+bodies, where variants maps a Content-Encoding to the [offset, length] of
+the body precompressed at the highest level.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, List, Mapping, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.core.catalog import compute_etag, conditional_body_response
+from app.core.compression import compress_variants
+from app.core.config import settings
+from app.models.schemas import NodeResponse, NodeSummary, RoadmapResponse
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SKTLSNAP"
+SNAPSHOT_VERSION = 2
+_HEADER_LENGTH = struct.Struct(">I")
+
+
+def _file_key(key: Hashable) -> str:
+    """Header key for a catalog cache key: "roadmaps" or ("node", id) -> "node/id"."""
+    return key if isinstance(key, str) else "/".join(key)
+
+
+def _encode(payload: Any) -> bytes:
+    # Same encoding as FastAPI's JSONResponse
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def _responses(catalog: Dict[str, Any]) -> List[Tuple[Hashable, Any]]:
+    """Every catalog response payload, shaped by the route's response_model."""
+    roadmaps = [
+        RoadmapResponse.model_validate(roadmap).model_dump(mode="json")
+        for roadmap in catalog["roadmaps"]
+    ]
+    responses: List[Tuple[Hashable, Any]] = [("roadmaps", roadmaps)]
+    for roadmap, roadmap_payload in zip(catalog["roadmaps"], roadmaps):
+        nodes = [
+            NodeResponse.model_validate({**node, "roadmap_id": roadmap["id"]}).model_dump(mode="json")
+            for node in roadmap["nodes"]
+        ]
+        summaries = [NodeSummary.model_validate(node).model_dump(mode="json") for node in nodes]
+        responses.append((("roadmap", roadmap["id"]), roadmap_payload))
+        responses.append((("nodes", roadmap["id"]), nodes))
+        responses.append((("node_summaries", roadmap["id"]), summaries))
+        responses.extend((("node", node["id"]), node) for node in nodes)
+    return responses
+
+
+def build_snapshot(catalog: Dict[str, Any]) -> bytes:
+    """Serialize every catalog response of a compiled catalog into a snapshot."""
+    index: Dict[str, List[Any]] = {}
+    bodies = bytearray()
+    for key, payload in _responses(catalog):
+        body = _encode(payload)
+        variants = {}
+        for encoding, compressed in compress_variants(body, best=True).items():
+            variants[encoding] = [len(bodies), len(compressed)]
+            bodies += compressed
+        index[_file_key(key)] = [len(bodies), len(body), compute_etag(payload), variants]
+        bodies += body
+
+    header = json.dumps({
+        "version": SNAPSHOT_VERSION,
+        "source_hash": catalog["source_hash"],
+        "index": index,
+    }, separators=(",", ":")).encode("utf-8")
+    return MAGIC + _HEADER_LENGTH.pack(len(header)) + header + bytes(bodies)
+
+
+def write_snapshot(catalog: Dict[str, Any], path: Path) -> None:
+    """Write a snapshot atomically, so running workers never see a partial file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(build_snapshot(catalog))
+    tmp.replace(path)
+
+
+class _MappedVariants(Mapping):
+    """Compressed variants of a body, sliced from the map only when sent."""
+
+    def __init__(self, snapshot: "_MappedSnapshot", ranges: Dict[str, List[int]]):
+        self._snapshot = snapshot
+        self._ranges = ranges
+
+    def __getitem__(self, encoding: str) -> bytes:
+        offset, length = self._ranges[encoding]
+        return self._snapshot.slice(offset, length)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ranges)
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+
+class SnapshotBody:
+    """A pre-serialized response body, its ETag and compressed variants."""
+
+    __slots__ = ("body", "etag", "variants")
+
+    def __init__(self, body: bytes, etag: str, variants: Mapping[str, bytes]):
+        self.body = body
+        self.etag = etag
+        self.variants = variants
+
+
+class _MappedSnapshot:
+    """One opened snapshot file."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self.stat = os.fstat(f.fileno())
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a catalog snapshot")
+        (header_length,) = _HEADER_LENGTH.unpack_from(self.map, len(MAGIC))
+        header_start = len(MAGIC) + _HEADER_LENGTH.size
+        header = json.loads(self.map[header_start:header_start + header_length])
+        if header.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} is snapshot version {header.get('version')}, expected {SNAPSHOT_VERSION}")
+
+        self.source_hash: str = header["source_hash"]
+        self.index: Dict[str, List[Any]] = header["index"]
+        self.body_start = header_start + header_length
+
+    def slice(self, offset: int, length: int) -> bytes:
+        start = self.body_start + offset
+        return self.map[start:start + length]
+
+    def get(self, key: str) -> Optional[SnapshotBody]:
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        offset, length, etag, variants = entry
+        return SnapshotBody(self.slice(offset, length), etag, _MappedVariants(self, variants))
+
+
+class CatalogSnapshot:
+    """Lazily opened, hot-reloading view of the snapshot file at `path`.
+
+    The file is re-checked at most every `check_interval` seconds and
+    reopened when its inode, size or mtime changes. A snapshot that fails
+    to load is logged and the previous one (if any) is kept. An empty
+    `path` disables the snapshot. Intended for use from the event loop only.
+    """
+
+    def __init__(self, path: str, check_interval: float):
+        self.path = path
+        self.check_interval = check_interval
+        self._snapshot: Optional[_MappedSnapshot] = None
+        self._next_check = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def _signature(self, stat: os.stat_result) -> Tuple[int, int, int]:
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _refresh(self) -> None:
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            if self._snapshot is not None:
+                logger.warning("Catalog snapshot %s disappeared; falling back to Supabase", self.path)
+            self._snapshot = None
+            return
+
+        current = self._snapshot
+        if current is not None and self._signature(current.stat) == self._signature(stat):
+            return
+        try:
+            self._snapshot = _MappedSnapshot(self.path)
+        except Exception:
+            logger.exception("Failed to load catalog snapshot %s", self.path)
+            return
+        self.reloads += 1
+        logger.info(
+            "Loaded catalog snapshot %s (%d responses, source %s)",
+            self.path, len(self._snapshot.index), self._snapshot.source_hash[:12],
+        )
+
+    def get(self, key: Hashable) -> Optional[SnapshotBody]:
+        """Return the snapshot body for a catalog cache key, or None."""
+        if not self.path:
+            return None
+        self._refresh()
+        body = self._snapshot.get(_file_key(key)) if self._snapshot is not None else None
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return body
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring."""
+        return {
+            "loaded": int(self._snapshot is not None),
+            "hits": self.hits,
+            "misses": self.misses,
+            "reloads": self.reloads,
+        }
+
+
+catalog_snapshot = CatalogSnapshot(
+    settings.catalog_snapshot_path,
+    settings.catalog_snapshot_check_interval,
+)
+
+
+def snapshot_response(request: Request, key: Hashable) -> Optional[Response]:
+    """Answer a catalog read from the snapshot, or None to fall back to Supabase."""
+    entry = catalog_snapshot.get(key)
+    if entry is None:
+        return None
+    return conditional_body_response(request, entry.body, entry.etag, entry.variants)
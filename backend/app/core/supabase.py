@@ -1,6 +1,49 @@
+import logging
+import os
+import random
+import time
 from functools import lru_cache
+from typing import Any, Optional
+
+import anyio
+import httpx
+from postgrest.exceptions import APIError
 from supabase import create_client, Client
+from supabase.lib.client_options import SyncClientOptions
 from app.core.config import settings
+from app.core.metrics import supabase_query_duration_seconds, supabase_query_retries_total
+
+logger = logging.getLogger(__name__)
+
+# Upstream statuses worth retrying: gateway errors and Cloudflare's 520
+_TRANSIENT_STATUS = {"502", "503", "504", "520"}
+
+
+def _create_http_client() -> httpx.Client:
+    """HTTP client with the pool, keep-alive and timeouts from settings."""
+    http2 = settings.supabase_http2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("SUPABASE_HTTP2 is set but the h2 package is missing; using HTTP/1.1")
+            http2 = False
+
+    return httpx.Client(
+        http2=http2,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=settings.supabase_pool_max_connections,
+            max_keepalive_connections=settings.supabase_pool_max_keepalive,
+            keepalive_expiry=settings.supabase_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(
+            connect=settings.supabase_connect_timeout,
+            read=settings.supabase_read_timeout,
+            write=settings.supabase_write_timeout,
+            pool=settings.supabase_pool_timeout,
+        ),
+    )
 
 
 def _create_client() -> Client:
@@ -10,11 +53,118 @@ def _create_client() -> Client:
 
     return create_client(
         settings.supabase_url,
-        settings.supabase_service_role_key
+        settings.supabase_service_role_key,
+        options=SyncClientOptions(httpx_client=_create_http_client()),
     )
 
 
 @lru_cache()
 def get_supabase() -> Client:
-    """Get the singleton Supabase client instance."""
+    """Get this process's Supabase client instance.
+
+    The client owns the connection pool, so each process needs its own.
+    Uvicorn workers import the app after they start; for servers that
+    fork after import (gunicorn --preload), the fork hook below drops the
+    parent's client so the child never shares its sockets.
+    """
     return _create_client()
+
+
+# Bounded pool for offloaded PostgREST calls. Created lazily so it binds to
+# the running event loop rather than to whatever imported this module.
+_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+def _get_limiter() -> anyio.CapacityLimiter:
+    """Get the capacity limiter shared by all offloaded queries."""
+    global _limiter
+    if _limiter is None:
+        _limiter = anyio.CapacityLimiter(settings.supabase_max_workers)
+    return _limiter
+
+
+def _reset_after_fork() -> None:
+    global _limiter
+    get_supabase.cache_clear()
+    _limiter = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _is_idempotent_read(query: Any) -> bool:
+    """True for GET/HEAD builders, which are safe to send again."""
+    method = getattr(getattr(query, "request", None), "http_method", None)
+    return method in ("GET", "HEAD")
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Connection failures, timeouts and upstream gateway errors."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return isinstance(exc, APIError) and str(exc.code) in _TRANSIENT_STATUS
+
+
+def _backoff(attempt: int) -> float:
+    """Full-jitter exponential backoff delay before retry number `attempt`."""
+    ceiling = min(settings.supabase_retry_backoff_max, settings.supabase_retry_backoff * 2 ** attempt)
+    return random.uniform(0, ceiling)
+
+
+def _table_name(query: Any) -> str:
+    """Best-effort table name of a PostgREST builder, for metrics labels."""
+    path = getattr(getattr(query, "request", None), "path", None)
+    if path is None:
+        return "unknown"
+    return str(path).rstrip("/").rsplit("/", 1)[-1]
+
+
+async def execute(query: Any) -> Any:
+    """Execute a PostgREST query builder without blocking the event loop.
+
+    The supabase client is synchronous, so `.execute()` is run on a worker
+    thread. At most `settings.supabase_max_workers` calls run at once; the
+    rest wait on the limiter instead of piling up threads.
+
+    Idempotent reads that fail transiently are retried up to
+    `settings.supabase_read_retries` times with jittered backoff. The wait
+    happens on the event loop, not on a pool thread, so the library's own
+    blocking retry is turned off for them. Writes are never retried.
+
+    Call latency (including time queued for the pool and retries) is
+    recorded per table.
+
+    Args:
+        query: Any builder returned by `get_supabase().table(...)`
+
+    Returns:
+        The PostgREST API response
+    """
+    retries = 0
+    if _is_idempotent_read(query):
+        retries = settings.supabase_read_retries
+        if hasattr(query.request, "retry_enabled"):
+            query.request.retry_enabled = False
+
+    table = _table_name(query)
+    outcome = "error"
+    start = time.perf_counter()
+    try:
+        attempt = 0
+        while True:
+            try:
+                response = await anyio.to_thread.run_sync(query.execute, limiter=_get_limiter())
+                break
+            except Exception as exc:
+                if attempt >= retries or not _is_transient(exc):
+                    raise
+                supabase_query_retries_total.inc(table)
+                await anyio.sleep(_backoff(attempt))
+                attempt += 1
+        outcome = "ok"
+        return response
+    finally:
+        supabase_query_duration_seconds.observe(
+            time.perf_counter() - start, table, outcome
+        )
@@ -0,0 +1,283 @@
+"""
+Write-behind buffering for high-frequency upserts (note autosave).
+
+The editor autosaves the full note on every debounce tick. Rather than
+one Supabase upsert per tick, saves to a row that already exists are
+held in memory and only the latest version is written once the row has
+been quiet for `delay` seconds, or at the latest `max_delay` seconds
+after its first unflushed save. The first save of a burst is written
+through so the row (and its id) exists before anything is buffered.
+
+Durability: buffered saves live in process memory. They are flushed on
+shutdown (see main.py), but a crash loses at most `max_delay` seconds of
+edits per row. The buffer is per process, so read-your-writes holds for
+requests served by the same worker. Intended for use from the event loop
+only — no locking.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.supabase import execute, get_supabase
+
+logger = logging.getLogger(__name__)
+
+BufferKey = Tuple[str, ...]
+
+
+class WriteConflict(Exception):
+    """A versioned write's expected version is no longer current."""
+
+
+class _Pending:
+    """Latest unflushed row for one key."""
+
+    __slots__ = ("row", "first_at", "last_at", "revision")
+
+    def __init__(self, row: Dict[str, Any], now: float):
+        self.row = row
+        self.first_at = now
+        self.last_at = now
+        self.revision = 0
+
+
+class WriteBehindBuffer:
+    """Coalesce rapid upserts of the same row and flush the latest version.
+
+    Rows are keyed by the table's conflict columns. A delay of 0 disables
+    buffering: every write goes straight to the database. With a
+    `version_column`, each buffered save bumps the row's version, and
+    writes may name the version they expect to replace. A `touch_column`
+    is set to the flush time when a buffered row is written, so change
+    feeds reading by that column see the row when it reaches the database.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        conflict_columns: Tuple[str, ...],
+        delay: float,
+        max_delay: float,
+        max_pending: int,
+        version_column: Optional[str] = None,
+        touch_column: Optional[str] = None,
+    ):
+        self.table = table
+        self.conflict_columns = conflict_columns
+        self.version_column = version_column
+        self.touch_column = touch_column
+        self.delay = delay
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self._pending: Dict[BufferKey, _Pending] = {}
+        self._flusher: Optional["asyncio.Task[None]"] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self.writes = 0
+        self.written_through = 0
+        self.coalesced = 0
+        self.flushed = 0
+        self.flush_errors = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _key(self, row: Dict[str, Any]) -> BufferKey:
+        return tuple(str(row[column]) for column in self.conflict_columns)
+
+    def get(self, *key: str) -> Optional[Dict[str, Any]]:
+        """The buffered (not yet flushed) row for `key`, if any."""
+        pending = self._pending.get(key)
+        return dict(pending.row) if pending is not None else None
+
+    def pending_keys(self, *prefix: str) -> List[BufferKey]:
+        """Buffered keys starting with `prefix`, e.g. one user's notes."""
+        return [key for key in self._pending if key[:len(prefix)] == prefix]
+
+    def overlay(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Replace rows read from the database with newer buffered versions."""
+        result = []
+        for row in rows:
+            pending = self._pending.get(self._key(row))
+            result.append({**row, **pending.row} if pending is not None else row)
+        return result
+
+    async def _upsert(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        supabase = get_supabase()
+        response = await execute(
+            supabase.table(self.table)
+            .upsert(rows, on_conflict=",".join(self.conflict_columns))
+        )
+        return response.data or []
+
+    async def _update_if_version(self, row: Dict[str, Any], expected_version: int) -> List[Dict[str, Any]]:
+        supabase = get_supabase()
+        query = supabase.table(self.table).update(row)
+        for column in self.conflict_columns:
+            query = query.eq(column, row[column])
+        response = await execute(query.eq(self.version_column, expected_version))
+        return response.data or []
+
+    def version_of(self, row: Dict[str, Any]) -> int:
+        """The row's version; rows written before versioning count as 1."""
+        return row.get(self.version_column) or 1
+
+    async def write(self, row: Dict[str, Any], expected_version: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Upsert `row`, buffering it if a save for the same key is pending.
+
+        With `expected_version` (requires a version_column), the write only
+        applies if the current row has that version, else WriteConflict is
+        raised. Checked against the buffered row when there is one, and by
+        a conditional update in the database otherwise.
+
+        Returns the row as stored (from the database on write-through, or
+        the buffered row merged over the last known one), or None if the
+        write-through upsert returned nothing.
+        """
+        self.writes += 1
+        key = self._key(row)
+        now = time.monotonic()
+        pending = self._pending.get(key)
+
+        if pending is not None:
+            current_version = self.version_of(pending.row) if self.version_column else None
+            if expected_version is not None and current_version != expected_version:
+                raise WriteConflict(f"expected version {expected_version}, found {current_version}")
+            pending.row = {**pending.row, **row}
+            if self.version_column:
+                pending.row[self.version_column] = current_version + 1
+            pending.last_at = now
+            pending.revision += 1
+            self.coalesced += 1
+            return dict(pending.row)
+
+        if expected_version is not None:
+            stored = await self._update_if_version(row, expected_version)
+            if not stored:
+                raise WriteConflict(f"expected version {expected_version}")
+        else:
+            stored = await self._upsert([row])
+        self.written_through += 1
+        if not stored:
+            return None
+        if self.delay > 0 and len(self._pending) < self.max_pending:
+            # Later saves in this burst are buffered behind this one. The
+            # entry starts clean: its row is what the database holds now.
+            entry = _Pending(dict(stored[0]), now)
+            entry.revision = -1
+            self._pending[key] = entry
+            self._ensure_flusher()
+        return stored[0]
+
+    def _due_at(self, pending: _Pending) -> float:
+        return min(pending.last_at + self.delay, pending.first_at + self.max_delay)
+
+    def _ensure_flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._flusher is not None and self._flusher.get_loop() is not loop:
+            # A previous event loop went away (tests); its task never runs again
+            self._flusher = None
+            self._flush_lock = None
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Flush entries as they come due until the buffer is empty."""
+        while self._pending:
+            now = time.monotonic()
+            next_due = min(self._due_at(pending) for pending in self._pending.values())
+            if next_due > now:
+                await asyncio.sleep(next_due - now)
+                continue
+            due = [key for key, pending in self._pending.items() if self._due_at(pending) <= now]
+            if not await self._flush(due):
+                # Leave failed rows in place; retry after another window
+                await asyncio.sleep(self.delay)
+
+    async def _flush(self, keys: List[BufferKey]) -> bool:
+        """Write the latest version of `keys` in one multi-row upsert."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            batch = {key: self._pending[key] for key in keys if key in self._pending}
+            # Entries with no save since their write-through have nothing to write
+            clean = [key for key, pending in batch.items() if pending.revision < 0]
+            for key in clean:
+                del self._pending[key]
+            dirty = {key: pending for key, pending in batch.items() if pending.revision >= 0}
+            if not dirty:
+                return True
+
+            revisions = {key: pending.revision for key, pending in dirty.items()}
+            flushed_at = datetime.utcnow().isoformat()
+            rows = []
+            for pending in dirty.values():
+                row = dict(pending.row)
+                # Let the database keep its own id
+                row.pop("id", None)
+                if self.touch_column:
+                    row[self.touch_column] = flushed_at
+                rows.append(row)
+            try:
+                await self._upsert(rows)
+            except Exception:
+                self.flush_errors += 1
+                logger.exception("Failed to flush %d buffered %s rows", len(rows), self.table)
+                return False
+
+            self.flushed += len(rows)
+            for key, revision in revisions.items():
+                pending = self._pending.get(key)
+                if pending is not None and pending.revision == revision:
+                    del self._pending[key]
+            return True
+
+    async def flush(self, keys: Iterable[BufferKey]) -> bool:
+        """Write the given keys now if they are buffered.
+
+        Returns False if the upsert failed; the rows stay buffered.
+        """
+        keys = [key for key in keys if key in self._pending]
+        return await self._flush(keys) if keys else True
+
+    async def flush_all(self) -> None:
+        """Write every buffered row now (shutdown, tests)."""
+        if self._pending:
+            await self._flush(list(self._pending))
+        if self._flusher is not None and not self._pending:
+            self._flusher.cancel()
+            self._flusher = None
+
+    def clear(self) -> None:
+        """Drop every buffered row without writing it. Counters are kept."""
+        self._pending.clear()
+        if self._flusher is not None and not self._flusher.get_loop().is_closed():
+            self._flusher.cancel()
+            self._flusher = None
+        self._flush_lock = None
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring."""
+        return {
+            "pending": len(self._pending),
+            "writes": self.writes,
+            "written_through": self.written_through,
+            "coalesced": self.coalesced,
+            "flushed": self.flushed,
+            "flush_errors": self.flush_errors,
+        }
+
+
+# Autosave buffer for PUT /notes/{node_id}
+note_buffer = WriteBehindBuffer(
+    "notes",
+    ("user_id", "node_id"),
+    delay=settings.note_write_behind_delay,
+    max_delay=settings.note_write_behind_max_delay,
+    max_pending=settings.note_write_behind_max_pending,
+    version_column="version",
+    touch_column="updated_at",
+)
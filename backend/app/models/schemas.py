@@ -59,6 +59,22 @@ class NodeResponse(NodeBase):
         from_attributes = True
 
 
+class NodeSummary(BaseModel):
+    """Lightweight node projection for rendering the roadmap graph.
+
+    Omits markdown content and other detail fields; fetch those lazily
+    through GET /nodes/{node_id}.
+    """
+    id: str
+    title: str
+    order_index: int
+    svg_x: float
+    svg_y: float
+
+    class Config:
+        from_attributes = True
+
+
 # ==================
 # Progress schemas
 # ==================
@@ -83,10 +99,65 @@ class ProgressResponse(ProgressBase):
         from_attributes = True
 
 
+class ProgressBatchItem(BaseModel):
+    """A single node status change within a batch update."""
+    node_id: str = Field(..., min_length=1, max_length=200)
+    status: ProgressStatus
+
+
+class ProgressBatchUpdate(BaseModel):
+    """Schema for updating many nodes at once. Batch size is bounded."""
+    items: List[ProgressBatchItem] = Field(..., min_length=1, max_length=500)
+
+
+class ProgressBatchResult(BaseModel):
+    """Per-item outcome of a batch progress update."""
+    node_id: str
+    status: ProgressStatus
+    saved: bool
+    updated_at: Optional[datetime] = None
+
+
+class ProgressBatchResponse(BaseModel):
+    """Response schema for a batch progress update, in request order."""
+    results: List[ProgressBatchResult] = []
+
+
+class RoadmapProgressSummary(BaseModel):
+    """Node status counts for one roadmap the user has started."""
+    roadmap_id: str
+    total_count: int
+    completed_count: int
+    in_progress_count: int
+
+
+class DeletedRow(BaseModel):
+    """Tombstone for a per-user row that no longer exists."""
+    node_id: str
+    deleted_at: datetime
+
+
+class ProgressListResponse(BaseModel):
+    """A page of progress records, newest first.
+
+    With `since`, changed records oldest first instead, plus `deleted`
+    tombstones; resume with `next_since` (sooner if `has_more`).
+    """
+    items: List[ProgressResponse] = []
+    next_cursor: Optional[str] = None
+    deleted: List[DeletedRow] = []
+    next_since: Optional[str] = None
+    has_more: bool = False
+
+
 # ==================
 # Note schemas
 # ==================
 
+# Upper bound on note content length, shared by full saves and patches
+NOTE_MAX_LENGTH = 50_000
+
+
 class NoteBase(BaseModel):
     """Base schema for note."""
     content: str = ""
@@ -94,7 +165,23 @@ class NoteBase(BaseModel):
 
 class NoteUpdate(BaseModel):
     """Schema for updating a note. Content is bounded to prevent abuse."""
-    content: str = Field(..., max_length=50_000)
+    content: str = Field(..., max_length=NOTE_MAX_LENGTH)
+
+
+class NoteEdit(BaseModel):
+    """Replace content[start:end] of the base version with `text`.
+
+    Offsets are Unicode code points into the base content.
+    """
+    start: int = Field(..., ge=0)
+    end: int = Field(..., ge=0)
+    text: str = Field("", max_length=NOTE_MAX_LENGTH)
+
+
+class NotePatch(BaseModel):
+    """Schema for a delta update against a known note version."""
+    base_version: int = Field(..., ge=1)
+    edits: List[NoteEdit] = Field(..., min_length=1, max_length=500)
 
 
 class NoteResponse(NoteBase):
@@ -102,6 +189,7 @@ class NoteResponse(NoteBase):
     id: str
     user_id: str
     node_id: str
+    version: int = 1
     updated_at: Optional[datetime] = None
     node_title: Optional[str] = None
 
@@ -109,6 +197,19 @@ class NoteResponse(NoteBase):
         from_attributes = True
 
 
+class NoteListResponse(BaseModel):
+    """A page of notes, most recently updated first.
+
+    With `since`, changed notes oldest first instead, plus `deleted`
+    tombstones; resume with `next_since` (sooner if `has_more`).
+    """
+    items: List[NoteResponse] = []
+    next_cursor: Optional[str] = None
+    deleted: List[DeletedRow] = []
+    next_since: Optional[str] = None
+    has_more: bool = False
+
+
 # ==================
 # Journey schemas
 # ==================
@@ -120,6 +221,7 @@ class JourneyRoadmap(BaseModel):
     description: Optional[str] = None
     total_count: int
     completed_count: int
+    in_progress_count: int = 0
 
 
 class JourneyTopic(BaseModel):
@@ -147,6 +249,77 @@ class JourneyResponse(BaseModel):
     notes: List[JourneyNote] = []
 
 
+# ==================
+# Sync schemas
+# ==================
+
+class SyncProgressItem(BaseModel):
+    """A progress change made on the client, with its local edit time."""
+    node_id: str = Field(..., min_length=1, max_length=200)
+    status: ProgressStatus
+    updated_at: datetime
+
+
+class SyncNoteItem(BaseModel):
+    """A note saved on the client, with its local edit time."""
+    node_id: str = Field(..., min_length=1, max_length=200)
+    content: str = Field(..., max_length=NOTE_MAX_LENGTH)
+    updated_at: datetime
+
+
+class SyncRequest(BaseModel):
+    """Client change-set plus the token from the previous sync, if any."""
+    sync_token: Optional[str] = None
+    progress: List[SyncProgressItem] = Field([], max_length=1000)
+    notes: List[SyncNoteItem] = Field([], max_length=200)
+
+
+class SyncResponse(BaseModel):
+    """Server-side changes the client has not seen, and the next token.
+
+    `has_more` means more changes remain; sync again with `sync_token`.
+    """
+    progress: List[ProgressResponse] = []
+    notes: List[NoteResponse] = []
+    deleted_progress: List[DeletedRow] = []
+    deleted_notes: List[DeletedRow] = []
+    applied_progress: int = 0
+    applied_notes: int = 0
+    sync_token: str
+    has_more: bool = False
+
+
+# ==================
+# Search schemas
+# ==================
+
+class SearchHit(BaseModel):
+    """A node matching a search query.
+
+    `highlights` are [start, end) character ranges of matched words
+    within `snippet`.
+    """
+    id: str
+    roadmap_id: Optional[str] = None
+    title: str
+    score: float
+    snippet: str = ""
+    highlights: List[List[int]] = []
+
+
+class NoteSearchHit(BaseModel):
+    """A note matching a search query: a snippet, never the full content.
+
+    `highlights` are [start, end) character ranges within `snippet`.
+    """
+    node_id: str
+    node_title: Optional[str] = None
+    score: float
+    snippet: str = ""
+    highlights: List[List[int]] = []
+    updated_at: Optional[datetime] = None
+
+
 # ==================
 # Roadmap request schemas
 # ==================
@@ -166,3 +339,9 @@ class RoadmapRequestResponse(BaseModel):
     email: Optional[str] = None
     created_at: str
     status: str = "pending"
+
+
+class RoadmapRequestListResponse(BaseModel):
+    """A page of roadmap requests, newest first."""
+    items: List[RoadmapRequestResponse] = []
+    next_cursor: Optional[str] = None
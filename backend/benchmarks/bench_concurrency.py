@@ -0,0 +1,78 @@
+"""
+Benchmark: concurrency scaling of the v1 routers on a single worker.
+
+Fires batches of concurrent GET /api/v1/progress requests (uncached, mock
+auth) at the app in-process (one event loop, no uvicorn) against a fake Supabase client
+with fixed per-query latency. With `max_workers=1` queries run one at a
+time, which is what inline `.execute()` calls did to the event loop; with
+a larger pool wall time should stay close to a single round trip.
+
+Usage:
+    cd backend
+    python -m benchmarks.bench_concurrency
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from app.core import supabase as supabase_module
+from app.core.config import settings
+from benchmarks.fake_supabase import FakeSupabase
+from main import app
+
+LATENCY = 0.05
+CONCURRENCY_LEVELS = [1, 4, 16, 64]
+POOL_SIZES = [1, 16]
+USER_ID = "00000000-0000-4000-a000-000000000001"
+
+
+def install_fake_client(latency: float) -> None:
+    """Route get_supabase() to an in-memory fake with injected latency."""
+    fake = FakeSupabase(
+        tables={"user_progress": [{"user_id": USER_ID, "node_id": f"n{i}", "status": "completed"}
+                                  for i in range(20)]},
+        latency=latency,
+    )
+    supabase_module._create_client = lambda: fake
+    supabase_module.get_supabase.cache_clear()
+
+
+async def run_batch(client: httpx.AsyncClient, concurrency: int) -> float:
+    """Issue `concurrency` simultaneous requests and return wall time."""
+    start = time.perf_counter()
+    responses = await asyncio.gather(*(
+        client.get("/api/v1/progress", headers={"X-User-Id": USER_ID}) for _ in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+    assert all(r.status_code == 200 for r in responses)
+    return elapsed
+
+
+async def main() -> None:
+    install_fake_client(LATENCY)
+    # Mock auth in debug mode keeps JWT handling out of the measurement
+    settings.debug = True
+    logging.getLogger("app.core.auth").setLevel(logging.ERROR)
+    transport = httpx.ASGITransport(app=app)
+
+    print(f"Per-query latency: {LATENCY * 1000:.0f} ms")
+    print(f"{'pool':>6} {'concurrency':>12} {'wall (ms)':>10} {'req/s':>8}")
+    for pool in POOL_SIZES:
+        settings.supabase_max_workers = pool
+        supabase_module._limiter = None
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for concurrency in CONCURRENCY_LEVELS:
+                elapsed = await run_batch(client, concurrency)
+                print(f"{pool:>6} {concurrency:>12} {elapsed * 1000:>10.1f} {concurrency / elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
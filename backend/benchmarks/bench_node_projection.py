@@ -0,0 +1,80 @@
+"""
+Benchmark: full node listing vs. the graph summary projection.
+
+Loads the Git roadmap from the compiled catalog (data/catalog.json) into a fake Supabase
+client and compares payload size and latency of
+GET /api/v1/roadmaps/{id}/nodes against GET /api/v1/roadmaps/{id}/nodes/summary,
+both on a cold cache (one upstream round trip) and warm.
+
+Usage:
+    cd backend
+    python -m benchmarks.bench_node_projection
+"""
+
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.testclient import TestClient
+
+from app.core import supabase as supabase_module
+from app.core.cache import catalog_cache
+from app.core.content import find_roadmap, load_catalog
+from benchmarks.fake_supabase import FakeSupabase
+from main import app
+from scripts.seeding import catalog_node_rows
+
+LATENCY = 0.02
+WARM_ITERATIONS = 200
+
+
+def load_nodes():
+    """Load Git roadmap nodes in the shape stored in the nodes table."""
+    roadmap = find_roadmap(load_catalog(), "git-github")
+    return roadmap["id"], catalog_node_rows(roadmap)
+
+
+def measure(client: TestClient, path: str):
+    """Return (bytes, cold ms, warm median ms) for one endpoint."""
+    catalog_cache.clear()
+    start = time.perf_counter()
+    response = client.get(path)
+    cold = (time.perf_counter() - start) * 1000
+    assert response.status_code == 200
+
+    samples = []
+    for _ in range(WARM_ITERATIONS):
+        start = time.perf_counter()
+        client.get(path)
+        samples.append((time.perf_counter() - start) * 1000)
+    return len(response.content), cold, statistics.median(samples)
+
+
+def main():
+    roadmap_id, nodes = load_nodes()
+    fake = FakeSupabase(tables={"nodes": nodes}, latency=LATENCY)
+    supabase_module._create_client = lambda: fake
+    supabase_module.get_supabase.cache_clear()
+
+    client = TestClient(app)
+    print(f"Roadmap {roadmap_id}: {len(nodes)} nodes, upstream latency {LATENCY * 1000:.0f} ms")
+    print(f"{'endpoint':<12} {'bytes':>8} {'cold (ms)':>10} {'warm p50 (ms)':>14}")
+    results = {}
+    for name, path in (
+        ("full", f"/api/v1/roadmaps/{roadmap_id}/nodes"),
+        ("summary", f"/api/v1/roadmaps/{roadmap_id}/nodes/summary"),
+    ):
+        results[name] = measure(client, path)
+        size, cold, warm = results[name]
+        print(f"{name:<12} {size:>8} {cold:>10.2f} {warm:>14.3f}")
+
+    ratio = results["summary"][0] / results["full"][0]
+    print(f"Summary payload is {ratio:.1%} of the full listing")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+Minimal in-memory stand-in for the synchronous Supabase client.
+
+Each `.execute()` sleeps for a fixed latency to mimic a PostgREST round
+trip, blocking the calling thread exactly like the real client does.
+Only the builder methods used by the v1 routers are supported.
+"""
+
+import operator
+import re
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+_OPERATORS = {
+    "eq": operator.eq,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+}
+
+
+def _split_top_level(expr: str) -> List[str]:
+    """Split a PostgREST logic expression on commas outside parentheses/quotes."""
+    parts, depth, quoted, current = [], 0, False, ""
+    for char in expr:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == "(":
+            depth += 1
+        elif not quoted and char == ")":
+            depth -= 1
+        if char == "," and depth == 0 and not quoted:
+            parts.append(current)
+            current = ""
+        else:
+            current += char
+    parts.append(current)
+    return parts
+
+
+def _parse_logic(expr: str) -> Callable[[Dict[str, Any]], bool]:
+    """Compile a PostgREST `or=`/`and=` filter into a row predicate."""
+    match = re.fullmatch(r"(and|or)\((.*)\)", expr)
+    if match:
+        combine = all if match.group(1) == "and" else any
+        terms = [_parse_logic(part) for part in _split_top_level(match.group(2))]
+        return lambda row: combine(term(row) for term in terms)
+
+    column, op, value = expr.split(".", 2)
+    value = value.strip('"')
+    compare = _OPERATORS[op]
+    return lambda row: row.get(column) is not None and compare(str(row.get(column)), value)
+
+
+def _inner_embeds(spec: str) -> Callable[[Dict[str, Any]], bool]:
+    """Row predicate for the `name!inner(...)` embeds of a select spec.
+
+    Like an inner join, a row is kept only if every such embed (and its
+    own inner embeds) is present in the stored row.
+    """
+    embeds = []
+    for part in _split_top_level(spec):
+        match = re.fullmatch(r"\s*(\w+)!inner\((.*)\)\s*", part)
+        if match:
+            embeds.append((match.group(1), _inner_embeds(match.group(2))))
+    return lambda row: all(row.get(name) and nested(row[name]) for name, nested in embeds)
+
+
+class FakeQuery:
+    """Chainable query builder over a list of row dicts."""
+
+    def __init__(self, client: "FakeSupabase", table: str):
+        self._client = client
+        self._table = table
+        # Mirrors the real builder's request config (table URL and HTTP method)
+        self.request = SimpleNamespace(path=f"/rest/v1/{table}", http_method="GET")
+        self._filters: List[tuple] = []
+        self._predicates: List[Callable[[Dict[str, Any]], bool]] = []
+        self._order: List[tuple] = []
+        self._limit: Optional[int] = None
+        self._single = False
+        self._count = False
+        self._write: Optional[tuple] = None
+        self._maybe = False
+        self._columns: Optional[List[str]] = None
+
+    # --- read builders ---
+
+    def select(self, *columns: str, count: Optional[str] = None) -> "FakeQuery":
+        self._count = count is not None
+        spec = ",".join(columns)
+        # Plain column lists are projected; "*" and embedded joins return rows as stored
+        if spec and "*" not in spec and "(" not in spec:
+            self._columns = [c.strip() for c in spec.split(",")]
+        if "!inner(" in spec:
+            self._predicates.append(_inner_embeds(spec))
+        return self
+
+    def eq(self, column: str, value: Any) -> "FakeQuery":
+        self._filters.append((column, value))
+        return self
+
+    def gt(self, column: str, value: Any) -> "FakeQuery":
+        compare = _OPERATORS["gt"]
+        self._predicates.append(lambda row: row.get(column) is not None and compare(str(row.get(column)), str(value)))
+        return self
+
+    def in_(self, column: str, values: List[Any]) -> "FakeQuery":
+        allowed = set(values)
+        self._predicates.append(lambda row: row.get(column) in allowed)
+        return self
+
+    def or_(self, filters: str) -> "FakeQuery":
+        self._predicates.append(_parse_logic(f"or({filters})"))
+        return self
+
+    def order(self, column: str, desc: bool = False) -> "FakeQuery":
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, size: int) -> "FakeQuery":
+        self._limit = size
+        return self
+
+    def single(self) -> "FakeQuery":
+        self._single = True
+        return self
+
+    def maybe_single(self) -> "FakeQuery":
+        # Like the real client: execute() returns None when no row matches
+        self._single = True
+        self._maybe = True
+        return self
+
+    # --- write builders ---
+
+    def insert(self, data: Any) -> "FakeQuery":
+        self.request.http_method = "POST"
+        self._write = ("insert", data, None)
+        return self
+
+    def upsert(self, data: Any, on_conflict: str = "") -> "FakeQuery":
+        self.request.http_method = "POST"
+        self._write = ("upsert", data, on_conflict)
+        return self
+
+    def update(self, data: Dict[str, Any]) -> "FakeQuery":
+        self.request.http_method = "PATCH"
+        self._write = ("update", data, None)
+        return self
+
+    def execute(self) -> SimpleNamespace:
+        time.sleep(self._client.latency)
+        self._client.executed += 1
+        rows = self._client.tables.setdefault(self._table, [])
+
+        if self._write:
+            return SimpleNamespace(data=self._apply_write(rows), count=None)
+
+        result = [
+            r for r in rows
+            if all(r.get(c) == v for c, v in self._filters)
+            and all(p(r) for p in self._predicates)
+        ]
+        # Stable sorts applied last-key-first give a multi-column ordering
+        for column, desc in reversed(self._order):
+            result.sort(key=lambda r: (r.get(column) is None, r.get(column)), reverse=desc)
+        if self._limit is not None:
+            result = result[: self._limit]
+        if self._columns:
+            result = [{c: r.get(c) for c in self._columns} for r in result]
+        else:
+            # Copies, so handlers that reshape rows do not mutate the "table"
+            result = [dict(r) for r in result]
+        if self._single:
+            if not result and self._maybe:
+                return None
+            return SimpleNamespace(data=result[0] if result else None, count=None)
+        return SimpleNamespace(data=result, count=len(result) if self._count else None)
+
+    def _apply_write(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        kind, data, on_conflict = self._write
+        if kind == "update":
+            matched = [r for r in rows if all(r.get(c) == v for c, v in self._filters)]
+            for row in matched:
+                row.update(data)
+            return matched
+
+        items = data if isinstance(data, list) else [data]
+        keys = on_conflict.split(",") if on_conflict else ["id"]
+        written = []
+        for item in items:
+            existing = next(
+                (r for r in rows if all(r.get(k) == item.get(k) for k in keys)),
+                None,
+            )
+            if existing is not None and kind == "upsert":
+                existing.update(item)
+                written.append(existing)
+            else:
+                row = {"id": f"{self._table}-{len(rows) + 1}", **item}
+                rows.append(row)
+                written.append(row)
+        return written
+
+
+class FakeRpc:
+    """Call of a Postgres function, answered by a registered Python stand-in."""
+
+    def __init__(self, client: "FakeSupabase", name: str, params: Dict[str, Any], get: bool):
+        self._client = client
+        self._name = name
+        self._params = params
+        self.request = SimpleNamespace(path=f"/rest/v1/rpc/{name}", http_method="GET" if get else "POST")
+
+    def execute(self) -> SimpleNamespace:
+        time.sleep(self._client.latency)
+        self._client.executed += 1
+        function = self._client.functions[self._name]
+        return SimpleNamespace(data=function(self._client.tables, self._params), count=None)
+
+
+class FakeSupabase:
+    """Stand-in for `supabase.Client` holding tables as lists of dicts."""
+
+    def __init__(self, tables: Optional[Dict[str, List[Dict[str, Any]]]] = None, latency: float = 0.02):
+        self.tables = tables or {}
+        self.latency = latency
+        # Number of queries executed, for asserting round trips in tests
+        self.executed = 0
+        # Postgres functions for rpc(): name -> f(tables, params) -> rows
+        self.functions: Dict[str, Callable[[Dict[str, List[Dict[str, Any]]], Dict[str, Any]], Any]] = {}
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: Optional[Dict[str, Any]] = None, get: bool = False) -> FakeRpc:
+        return FakeRpc(self, name, params or {}, get)
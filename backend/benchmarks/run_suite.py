@@ -0,0 +1,251 @@
+"""
+Benchmark suite: representative API traffic against a local Supabase stand-in.
+
+Drives the FastAPI app from main.py in-process over ASGI, with the Supabase
+client replaced by benchmarks.fake_supabase (per-query latency injected on
+the worker thread, like a real PostgREST round trip). Each scenario reports
+throughput, p50/p95/p99 latency and peak traced allocation per request.
+
+Results can be saved as a baseline and compared on later runs so
+regressions show up in review.
+
+Usage:
+    cd backend
+    python -m benchmarks.run_suite                   # run and compare to baseline
+    python -m benchmarks.run_suite --save-baseline   # overwrite baseline.json
+    python -m benchmarks.run_suite --check           # exit 1 on regression
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from app.core import supabase as supabase_module
+from app.core.cache import catalog_cache
+from app.core.config import settings
+from app.core.content import find_roadmap, load_catalog
+from benchmarks.fake_supabase import FakeSupabase
+from main import app
+from scripts.reconcile_progress_summary import summarize_progress
+from scripts.seeding import catalog_node_rows
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+USER_ID = "00000000-0000-4000-a000-000000000001"
+
+# Search queries cycled through by the search scenario (URL-encoded)
+SEARCH_QUERIES = ("git", "merge%20conf", "rebas", "commit")
+
+# Scenario request factories: (method, path, json body) per iteration index
+Request = Tuple[str, str, Any]
+
+
+def build_tables() -> Tuple[str, Dict[str, List[Dict[str, Any]]]]:
+    """Seed tables from the Git roadmap plus a heavy learner's activity."""
+    catalog_roadmap = find_roadmap(load_catalog(), "git-github")
+    nodes = catalog_node_rows(catalog_roadmap)
+    roadmap = {key: catalog_roadmap[key] for key in ("id", "title", "description")}
+    embedded_roadmap = roadmap
+    progress = [
+        {
+            "user_id": USER_ID,
+            "node_id": node["id"],
+            "status": "completed" if i % 2 else "in_progress",
+            "updated_at": f"2026-01-01T00:00:{i:02d}+00:00",
+            "nodes": {"id": node["id"], "title": node["title"], "roadmap_id": roadmap["id"],
+                      "roadmaps": embedded_roadmap},
+        }
+        for i, node in enumerate(nodes)
+    ]
+    notes = [
+        {
+            "id": f"note-{i}",
+            "user_id": USER_ID,
+            "node_id": node["id"],
+            "content": "Remember: " + node["title"] * 20,
+            "updated_at": f"2026-01-01T00:00:{i:02d}+00:00",
+            "nodes": {"title": node["title"]},
+        }
+        for i, node in enumerate(nodes)
+    ]
+    tables = {
+        "roadmaps": [roadmap],
+        "nodes": nodes,
+        "roadmap_node_counts": [{"roadmap_id": roadmap["id"], "total_count": len(nodes)}],
+        "user_progress": progress,
+        "user_roadmap_progress": [
+            {"user_id": user_id, "roadmap_id": rid, **counts, "roadmaps": embedded_roadmap}
+            for (user_id, rid), counts in summarize_progress(
+                progress, {node["id"]: roadmap["id"] for node in nodes}
+            ).items()
+        ],
+        "notes": notes,
+    }
+    return roadmap["id"], tables
+
+
+def build_scenarios(roadmap_id: str, node_ids: List[str]) -> Dict[str, Callable[[int], Request]]:
+    """Named request generators covering the main traffic classes."""
+    def node(i: int) -> str:
+        return node_ids[i % len(node_ids)]
+
+    return {
+        "catalog: GET /roadmaps": lambda i: ("GET", "/api/v1/roadmaps", None),
+        "catalog: GET /roadmaps/{id}/nodes": lambda i: ("GET", f"/api/v1/roadmaps/{roadmap_id}/nodes", None),
+        "catalog: GET /roadmaps/{id}/nodes/summary": lambda i: ("GET", f"/api/v1/roadmaps/{roadmap_id}/nodes/summary", None),
+        "catalog: GET /nodes/{id}": lambda i: ("GET", f"/api/v1/nodes/{node(i)}", None),
+        "search: GET /search": lambda i: ("GET", f"/api/v1/search?q={SEARCH_QUERIES[i % len(SEARCH_QUERIES)]}", None),
+        "journey: GET /user/journey": lambda i: ("GET", "/api/v1/user/journey", None),
+        "progress: GET /progress": lambda i: ("GET", "/api/v1/progress", None),
+        "progress: PUT /progress/{id}": lambda i: ("PUT", f"/api/v1/progress/{node(i)}", {"status": "completed"}),
+        "progress: PUT /progress/batch": lambda i: ("PUT", "/api/v1/progress/batch", {
+            "items": [{"node_id": n, "status": "completed"} for n in node_ids[:10]],
+        }),
+        "notes: PUT /notes/{id}": lambda i: ("PUT", f"/api/v1/notes/{node(i)}", {"content": "x" * 2000}),
+    }
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    make_request: Callable[[int], Request],
+    requests: int,
+    concurrency: int,
+) -> Dict[str, float]:
+    """Run one scenario and return its summary statistics."""
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        method, path, body = make_request(i)
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            latencies.append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{method} {path} returned {response.status_code}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    wall = time.perf_counter() - start
+
+    # Allocation pass: sequential, so peaks belong to a single request
+    alloc_samples = []
+    tracemalloc.start()
+    for i in range(min(requests, 20)):
+        method, path, body = make_request(i)
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        await client.request(method, path, json=body)
+        _, peak = tracemalloc.get_traced_memory()
+        alloc_samples.append(peak - current)
+    tracemalloc.stop()
+
+    return {
+        "throughput_rps": requests / wall,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "alloc_kib_per_request": statistics.mean(alloc_samples) / 1024,
+    }
+
+
+async def run_suite(requests: int, concurrency: int, latency: float) -> Dict[str, Dict[str, float]]:
+    roadmap_id, tables = build_tables()
+    fake = FakeSupabase(tables=tables, latency=latency)
+    supabase_module._create_client = lambda: fake
+    supabase_module.get_supabase.cache_clear()
+    catalog_cache.clear()
+
+    # Mock auth keeps JWT handling constant across runs
+    settings.debug = True
+    logging.getLogger("app.core.auth").setLevel(logging.ERROR)
+
+    scenarios = build_scenarios(roadmap_id, [n["id"] for n in tables["nodes"]])
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", headers={"X-User-Id": USER_ID}
+    ) as client:
+        for name, make_request in scenarios.items():
+            results[name] = await run_scenario(client, make_request, requests, concurrency)
+    return results
+
+
+def report(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    """Print a results table and return the names of regressed scenarios."""
+    regressions = []
+    header = f"{'scenario':<44} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'KiB/req':>8} {'vs base p95':>12}"
+    print(header)
+    print("-" * len(header))
+    for name, stats in results.items():
+        delta = ""
+        base = baseline.get(name)
+        if base:
+            change = (stats["p95_ms"] - base["p95_ms"]) / base["p95_ms"]
+            delta = f"{change:+.0%}"
+            if change > threshold:
+                delta += " !"
+                regressions.append(name)
+        print(
+            f"{name:<44} {stats['throughput_rps']:>9.1f} {stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} "
+            f"{stats['p99_ms']:>8.2f} {stats['alloc_kib_per_request']:>8.1f} {delta:>12}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="in-flight requests")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="injected per-query latency")
+    parser.add_argument("--threshold", type=float, default=0.25, help="p95 regression tolerance (fraction)")
+    parser.add_argument("--save-baseline", action="store_true", help="write results to baseline.json")
+    parser.add_argument("--check", action="store_true", help="exit non-zero if any scenario regressed")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_suite(args.requests, args.concurrency, args.latency_ms / 1000))
+
+    baseline = {}
+    if BASELINE_PATH.exists() and not args.save_baseline:
+        baseline = json.loads(BASELINE_PATH.read_text())["results"]
+
+    print(f"{args.requests} requests/scenario, concurrency {args.concurrency}, "
+          f"{args.latency_ms:.1f} ms injected latency")
+    regressions = report(results, baseline, args.threshold)
+
+    if args.save_baseline:
+        BASELINE_PATH.write_text(json.dumps({
+            "config": {
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "latency_ms": args.latency_ms,
+            },
+            "results": results,
+        }, indent=2) + "\n")
+        print(f"Baseline saved to {BASELINE_PATH}")
+
+    if regressions:
+        print(f"Regressed (p95 > +{args.threshold:.0%}): {', '.join(regressions)}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
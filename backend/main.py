@@ -1,13 +1,36 @@
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
+from app.core.auth import auth_stats
+from app.core.cache import catalog_cache, read_flights
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.api.v1 import roadmaps, nodes, progress, notes, user
+from app.core.events import event_bus
+from app.core.metrics import REGISTRY, MetricsMiddleware, stats_collector
+from app.core.search import node_search
+from app.core.snapshot import catalog_snapshot
+from app.core.write_behind import note_buffer
+from app.api.v1 import roadmaps, nodes, progress, notes, sync, user, events, search
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await event_bus.start()
+    yield
+    # Close open event streams so shutdown does not wait on them
+    await event_bus.stop()
+    # Write out note autosaves still held in the write-behind buffer
+    await note_buffer.flush_all()
+    if len(note_buffer):
+        logger.error("%d buffered notes could not be flushed on shutdown", len(note_buffer))
+
+
 # Create FastAPI application
 # Docs are only exposed in debug mode to avoid information leakage in production.
 app = FastAPI(
@@ -16,6 +39,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs" if settings.debug else None,
     redoc_url="/api/redoc" if settings.debug else None,
+    lifespan=lifespan,
 )
 
 # Configure CORS — explicit methods and headers (no wildcards)
@@ -26,24 +50,50 @@ app.add_middleware(
         "http://localhost:3000",
     ],
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["Content-Type", "Authorization", "X-User-Id"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization", "X-User-Id", "If-None-Match"],
+    expose_headers=["ETag"],
 )
 
 
-# Health check endpoint
+# Negotiated gzip/br/zstd compression above a size threshold. Catalog
+# responses arrive precompressed and pass through untouched.
+app.add_middleware(CompressionMiddleware)
+
+# Per-route request metrics. Added last so it wraps CORS and sees every request.
+app.add_middleware(MetricsMiddleware)
+REGISTRY.register_collector(stats_collector("skilltrail_catalog_cache", "Catalog cache", catalog_cache.stats))
+REGISTRY.register_collector(stats_collector("skilltrail_catalog_snapshot", "Catalog snapshot", catalog_snapshot.stats))
+REGISTRY.register_collector(stats_collector("skilltrail_read_flights", "Coalesced reads", read_flights.stats))
+REGISTRY.register_collector(stats_collector("skilltrail_note_write_behind", "Note write-behind", note_buffer.stats))
+REGISTRY.register_collector(stats_collector("skilltrail_event_bus", "Event bus", event_bus.stats))
+REGISTRY.register_collector(stats_collector("skilltrail_node_search", "Node search index", node_search.stats))
+REGISTRY.register_collector(stats_collector("skilltrail_auth_claims_cache", "Auth claims cache", auth_stats))
+
+
+# Health check endpoint (liveness only; unauthenticated)
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
+    """Health check endpoint. Cache, search and other internal counters are served by /metrics."""
     return {"status": "healthy", "version": "1.0.0"}
 
 
+# Prometheus scrape endpoint
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Metrics in the Prometheus text exposition format."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
 # Mount API v1 routers
 app.include_router(roadmaps.router, prefix="/api/v1")
 app.include_router(nodes.router, prefix="/api/v1")
 app.include_router(progress.router, prefix="/api/v1")
 app.include_router(notes.router, prefix="/api/v1")
 app.include_router(user.router, prefix="/api/v1")
+app.include_router(sync.router, prefix="/api/v1")
+app.include_router(events.router, prefix="/api/v1")
+app.include_router(search.router, prefix="/api/v1")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,59 @@
+"""
+Compile Script: Roadmap Catalog
+
+Validates every roadmap under backend/content/ and writes the compiled
+catalog artifact (data/catalog.json) used by the API and seed scripts.
+Run this after editing any roadmap content.
+
+Usage:
+    cd backend
+    python -m scripts.compile_catalog           # rebuild data/catalog.json
+    python -m scripts.compile_catalog --check   # exit 1 if it is out of date
+    python -m scripts.compile_catalog --snapshot data/catalog.snapshot
+                                                # also write an API snapshot
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.content import CATALOG_PATH, ContentError, compile_catalog, dump_catalog, write_catalog
+from app.core.snapshot import write_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="fail if the artifact is out of date")
+    parser.add_argument("--snapshot", type=Path, help="also write a catalog snapshot for CATALOG_SNAPSHOT_PATH")
+    args = parser.parse_args()
+
+    try:
+        catalog = compile_catalog()
+    except ContentError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    nodes = sum(len(roadmap["nodes"]) for roadmap in catalog["roadmaps"])
+    print(f"✓ Validated {len(catalog['roadmaps'])} roadmaps, {nodes} nodes")
+
+    if args.check:
+        current = CATALOG_PATH.read_text(encoding="utf-8") if CATALOG_PATH.exists() else ""
+        if current != dump_catalog(catalog):
+            print(f"✗ {CATALOG_PATH.name} is out of date; run: python -m scripts.compile_catalog")
+            sys.exit(1)
+        print(f"✓ {CATALOG_PATH.name} is up to date")
+        return
+
+    write_catalog(catalog)
+    print(f"✓ Wrote {CATALOG_PATH} ({CATALOG_PATH.stat().st_size} bytes)")
+
+    if args.snapshot:
+        write_snapshot(catalog, args.snapshot)
+        print(f"✓ Wrote {args.snapshot} ({args.snapshot.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
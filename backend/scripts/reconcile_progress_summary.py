@@ -0,0 +1,163 @@
+"""
+Reconcile Script: User Roadmap Progress Summary
+
+Rebuilds the per-user, per-roadmap counts in user_roadmap_progress from
+user_progress and reports every row that drifted from the incrementally
+maintained values (see migrations/20261017_add_user_roadmap_progress.sql).
+With --apply, drifted rows are overwritten with the rebuilt counts.
+
+Usage:
+    cd backend
+    python -m scripts.reconcile_progress_summary           # verify only
+    python -m scripts.reconcile_progress_summary --apply   # verify and fix
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.supabase import get_supabase
+
+# Rows per page / upsert request
+PAGE_SIZE = 1000
+
+SummaryKey = Tuple[str, str]
+
+# user_progress status -> user_roadmap_progress counter column
+STATUS_COUNTERS = {"completed": "completed_count", "in_progress": "in_progress_count"}
+
+
+def summarize_progress(
+    progress_rows: Iterable[Dict[str, Any]],
+    node_roadmaps: Dict[str, str],
+) -> Dict[SummaryKey, Dict[str, int]]:
+    """Count statuses per (user_id, roadmap_id) from raw progress rows.
+
+    Rows for nodes missing from `node_roadmaps` are ignored, as the
+    trigger ignores them.
+    """
+    summary: Dict[SummaryKey, Dict[str, int]] = {}
+    for row in progress_rows:
+        roadmap_id = node_roadmaps.get(row["node_id"])
+        if roadmap_id is None:
+            continue
+        counts = summary.setdefault(
+            (row["user_id"], roadmap_id),
+            {column: 0 for column in STATUS_COUNTERS.values()},
+        )
+        column = STATUS_COUNTERS.get(row.get("status"))
+        if column:
+            counts[column] += 1
+    return summary
+
+
+def _scan(supabase, table: str, columns: str, keys: Tuple[str, str]) -> Iterator[Dict[str, Any]]:
+    """Yield every row of `table`, paged by keyset on the two `keys` columns."""
+    first, second = keys
+    last = None
+    while True:
+        query = supabase.table(table).select(columns)
+        if last is not None:
+            query = query.or_(
+                f'{first}.gt."{last[first]}",'
+                f'and({first}.eq."{last[first]}",{second}.gt."{last[second]}")'
+            )
+        rows = query.order(first).order(second).limit(PAGE_SIZE).execute().data or []
+        yield from rows
+        if len(rows) < PAGE_SIZE:
+            return
+        last = rows[-1]
+
+
+class ReconcileReport:
+    """What a reconciliation run found and fixed."""
+
+    def __init__(self):
+        self.checked = 0
+        self.drifted: List[SummaryKey] = []
+        self.fixed = 0
+
+    def __str__(self) -> str:
+        return f"{self.checked} checked, {len(self.drifted)} drifted, {self.fixed} fixed"
+
+
+def reconcile(supabase, apply: bool = False) -> ReconcileReport:
+    """Compare user_roadmap_progress against a rebuild from user_progress.
+
+    Args:
+        supabase: Supabase client (service role, to see every user)
+        apply: Overwrite drifted rows with the rebuilt counts
+
+    Returns:
+        ReconcileReport listing drifted (user_id, roadmap_id) keys
+    """
+    report = ReconcileReport()
+
+    node_roadmaps = {
+        row["id"]: row["roadmap_id"]
+        for row in _scan(supabase, "nodes", "id, roadmap_id", ("id", "roadmap_id"))
+    }
+    expected = summarize_progress(
+        _scan(supabase, "user_progress", "user_id, node_id, status", ("user_id", "node_id")),
+        node_roadmaps,
+    )
+    stored = {
+        (row["user_id"], row["roadmap_id"]): row
+        for row in _scan(
+            supabase, "user_roadmap_progress",
+            "user_id, roadmap_id, completed_count, in_progress_count", ("user_id", "roadmap_id"),
+        )
+    }
+
+    zero = {column: 0 for column in STATUS_COUNTERS.values()}
+    fixes = []
+    for key in sorted(set(expected) | set(stored)):
+        report.checked += 1
+        counts = expected.get(key, zero)
+        current = stored.get(key)
+        if current is not None and all(current.get(column) == value for column, value in counts.items()):
+            continue
+        report.drifted.append(key)
+        fixes.append({"user_id": key[0], "roadmap_id": key[1], **counts})
+
+    if apply:
+        for start in range(0, len(fixes), PAGE_SIZE):
+            chunk = fixes[start:start + PAGE_SIZE]
+            supabase.table("user_roadmap_progress").upsert(chunk, on_conflict="user_id,roadmap_id").execute()
+            report.fixed += len(chunk)
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apply", action="store_true", help="overwrite drifted rows with rebuilt counts")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("Reconciling user roadmap progress summary")
+    print("=" * 50)
+
+    try:
+        supabase = get_supabase()
+        print("✓ Connected to Supabase")
+    except Exception as e:
+        print(f"✗ Failed to connect to Supabase: {e}")
+        sys.exit(1)
+
+    report = reconcile(supabase, apply=args.apply)
+    for user_id, roadmap_id in report.drifted:
+        print(f"  drift: user {user_id}, roadmap {roadmap_id}")
+    print(f"✓ Summary rows: {report}")
+
+    if report.drifted and not args.apply:
+        print("✗ Drift found; re-run with --apply to fix")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
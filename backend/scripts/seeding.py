@@ -0,0 +1,128 @@
+"""
+Shared seeding engine for roadmap content.
+
+Diffs source nodes against the database by content hash and upserts only
+new or changed rows, in chunked multi-row requests. Re-running a seed is
+idempotent: unchanged nodes cost nothing beyond one hash lookup, and a
+seed interrupted part-way converges on the next run.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterator, List
+
+from app.core.content import DERIVED_NODE_FIELDS
+
+
+# Rows per upsert / lookup request. Keeps request bodies and URLs bounded.
+DEFAULT_CHUNK_SIZE = 100
+
+
+def content_hash(row: Dict[str, Any]) -> str:
+    """Stable hash of a node row's seeded columns.
+
+    Numbers are normalised to float so 50 and 50.0 (JSON vs. Postgres FLOAT)
+    hash the same.
+    """
+    def normalise(value: Any) -> Any:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)):
+            return float(value)
+        return value
+
+    canonical = json.dumps(
+        {key: normalise(value) for key, value in row.items() if key != "content_hash"},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def catalog_node_rows(roadmap: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Map a compiled catalog roadmap's nodes onto nodes table rows.
+
+    Derived fields are dropped. Every row gets the same keys (missing ones
+    as None) so they can be sent in one multi-row upsert.
+    """
+    columns = sorted({
+        key
+        for node in roadmap["nodes"]
+        for key in node
+        if key not in DERIVED_NODE_FIELDS
+    })
+    return [
+        {**{column: node.get(column) for column in columns}, "roadmap_id": roadmap["id"]}
+        for node in roadmap["nodes"]
+    ]
+
+
+class SeedReport:
+    """Counts of what a seed run did."""
+
+    def __init__(self):
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.requests = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.inserted} inserted, {self.updated} updated, "
+            f"{self.unchanged} unchanged ({self.requests} requests)"
+        )
+
+
+def seed_roadmap_content(
+    supabase,
+    roadmap: Dict[str, Any],
+    node_rows: List[Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> SeedReport:
+    """Upsert a roadmap and the subset of its nodes that changed.
+
+    Args:
+        supabase: Supabase client
+        roadmap: Row for the roadmaps table (id, title, description)
+        node_rows: Rows for the nodes table; all rows must share the same keys
+        chunk_size: Maximum rows per lookup / upsert request
+
+    Returns:
+        SeedReport with inserted / updated / unchanged counts
+    """
+    report = SeedReport()
+
+    supabase.table("roadmaps").upsert(roadmap, on_conflict="id").execute()
+    report.requests += 1
+
+    # Fetch stored hashes for every node id in a few chunked lookups
+    ids = [row["id"] for row in node_rows]
+    stored: Dict[str, Any] = {}
+    for chunk in _chunks(ids, chunk_size):
+        response = supabase.table("nodes").select("id, content_hash").in_("id", chunk).execute()
+        report.requests += 1
+        stored.update({row["id"]: row.get("content_hash") for row in response.data or []})
+
+    changed = []
+    for row in node_rows:
+        digest = content_hash(row)
+        if row["id"] not in stored:
+            report.inserted += 1
+        elif stored[row["id"]] != digest:
+            report.updated += 1
+        else:
+            report.unchanged += 1
+            continue
+        changed.append({**row, "content_hash": digest})
+
+    for chunk in _chunks(changed, chunk_size):
+        supabase.table("nodes").upsert(chunk, on_conflict="id").execute()
+        report.requests += 1
+
+    return report
@@ -0,0 +1,64 @@
+-- Migration: Tombstones for the per-user change feed
+-- GET /progress?since=, GET /notes?since= and POST /sync report rows
+-- deleted after the client's watermark (e.g. cascades from node removal).
+-- Recreating a row drops its tombstone. Tombstones are kept for
+-- CHANGE_FEED_RETENTION_DAYS (default 90); prune older ones on a schedule:
+--   SELECT public.prune_deleted_user_rows(INTERVAL '90 days');
+
+-- No foreign key on user_id: rows deleted by a cascade from users are
+-- tombstoned while that user row is going away
+CREATE TABLE IF NOT EXISTS deleted_user_rows (
+  user_id UUID NOT NULL,
+  table_name TEXT NOT NULL CHECK (table_name IN ('user_progress', 'notes')),
+  node_id UUID NOT NULL,
+  deleted_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  PRIMARY KEY (user_id, table_name, node_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_deleted_user_rows_since
+  ON deleted_user_rows(user_id, table_name, deleted_at, node_id);
+
+ALTER TABLE deleted_user_rows ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own tombstones" ON deleted_user_rows
+  FOR SELECT USING (auth.uid() = user_id);
+
+CREATE OR REPLACE FUNCTION public.track_user_row_deletion()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER SET search_path = public
+AS $$
+BEGIN
+  IF TG_OP = 'DELETE' THEN
+    INSERT INTO deleted_user_rows (user_id, table_name, node_id)
+    VALUES (OLD.user_id, TG_TABLE_NAME, OLD.node_id)
+    ON CONFLICT (user_id, table_name, node_id) DO UPDATE SET deleted_at = NOW();
+  ELSE
+    DELETE FROM deleted_user_rows
+    WHERE user_id = NEW.user_id AND table_name = TG_TABLE_NAME AND node_id = NEW.node_id;
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS on_user_progress_tombstone ON user_progress;
+CREATE TRIGGER on_user_progress_tombstone
+  AFTER INSERT OR DELETE ON user_progress
+  FOR EACH ROW EXECUTE FUNCTION public.track_user_row_deletion();
+
+DROP TRIGGER IF EXISTS on_notes_tombstone ON notes;
+CREATE TRIGGER on_notes_tombstone
+  AFTER INSERT OR DELETE ON notes
+  FOR EACH ROW EXECUTE FUNCTION public.track_user_row_deletion();
+
+CREATE OR REPLACE FUNCTION public.prune_deleted_user_rows(retention INTERVAL)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+  WITH pruned AS (
+    DELETE FROM deleted_user_rows WHERE deleted_at < NOW() - retention RETURNING 1
+  )
+  SELECT COUNT(*)::INTEGER FROM pruned;
+$$;
+
+COMMENT ON TABLE deleted_user_rows IS 'Tombstones of deleted user_progress/notes rows for change feeds';
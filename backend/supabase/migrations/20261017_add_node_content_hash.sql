@@ -0,0 +1,7 @@
+-- Migration: Content hash for idempotent, diff-based seeding
+-- Seed scripts compare this against the source to skip unchanged nodes.
+
+ALTER TABLE nodes
+ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+COMMENT ON COLUMN nodes.content_hash IS 'SHA-256 of the seeded columns, written by scripts/seeding.py';
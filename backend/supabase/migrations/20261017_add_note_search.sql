@@ -0,0 +1,45 @@
+-- Migration: Full-text search over a user's notes
+-- GET /notes/search calls search_notes() instead of downloading every note
+-- to filter on the client. The tsvector is an expression index, not a
+-- stored column, so `select *` on notes does not carry it. btree_gin lets
+-- one GIN index cover (user_id, document), so a search touches only the
+-- caller's notes.
+
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+
+CREATE INDEX IF NOT EXISTS idx_notes_user_search
+  ON notes USING GIN (user_id, to_tsvector('english', COALESCE(content, '')));
+
+-- Ranked hits for a to_tsquery() expression, with node titles and a
+-- snippet whose matches are wrapped in chr(2) ... chr(3). SECURITY INVOKER:
+-- callers other than the service role only ever see their own notes (RLS).
+CREATE OR REPLACE FUNCTION public.search_notes(p_user_id UUID, p_query TEXT, p_limit INTEGER DEFAULT 20)
+RETURNS TABLE (node_id UUID, node_title TEXT, rank REAL, snippet TEXT, updated_at TIMESTAMPTZ)
+LANGUAGE sql
+STABLE
+AS $$
+  WITH query AS (
+    SELECT to_tsquery('english', p_query) AS q
+  ),
+  hits AS (
+    SELECT notes.node_id, notes.content, notes.updated_at,
+           ts_rank_cd(to_tsvector('english', COALESCE(notes.content, '')), query.q, 32) AS rank
+    FROM notes, query
+    WHERE notes.user_id = p_user_id
+      AND to_tsvector('english', COALESCE(notes.content, '')) @@ query.q
+    ORDER BY rank DESC, notes.updated_at DESC
+    LIMIT p_limit
+  )
+  -- Headlines only for the returned page
+  SELECT hits.node_id, nodes.title, hits.rank,
+         ts_headline('english', hits.content, query.q,
+                     'StartSel="' || chr(2) || '", StopSel="' || chr(3) || '", '
+                     || 'MaxFragments=2, MaxWords=24, MinWords=8, FragmentDelimiter=" … "'),
+         hits.updated_at
+  FROM hits
+  CROSS JOIN query
+  LEFT JOIN nodes ON nodes.id = hits.node_id
+  ORDER BY hits.rank DESC, hits.updated_at DESC;
+$$;
+
+COMMENT ON FUNCTION public.search_notes IS 'Ranked full-text search over one user''s notes, used by GET /notes/search';
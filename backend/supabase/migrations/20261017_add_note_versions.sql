@@ -0,0 +1,27 @@
+-- Migration: Note versions for optimistic concurrency
+-- PATCH /notes/{node_id} applies edits against a base version and is
+-- rejected if the note has moved on. Every content change bumps the
+-- version; writers may set a higher one themselves (the autosave buffer
+-- does, see backend/app/core/write_behind.py).
+
+ALTER TABLE notes
+ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+
+CREATE OR REPLACE FUNCTION public.bump_note_version()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  IF NEW.content IS DISTINCT FROM OLD.content AND NEW.version <= OLD.version THEN
+    NEW.version := OLD.version + 1;
+  END IF;
+  RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS on_note_updated ON notes;
+CREATE TRIGGER on_note_updated
+  BEFORE UPDATE ON notes
+  FOR EACH ROW EXECUTE FUNCTION public.bump_note_version();
+
+COMMENT ON COLUMN notes.version IS 'Incremented on every content change; base for PATCH /notes/{node_id}';
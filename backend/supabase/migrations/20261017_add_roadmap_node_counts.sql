@@ -0,0 +1,10 @@
+-- Migration: Per-roadmap node counts for the user journey endpoint
+-- Aggregated in one query instead of one count request per roadmap.
+-- A plain view stays current when seed scripts add or remove nodes.
+
+CREATE OR REPLACE VIEW roadmap_node_counts AS
+SELECT roadmap_id, COUNT(*)::INTEGER AS total_count
+FROM nodes
+GROUP BY roadmap_id;
+
+COMMENT ON VIEW roadmap_node_counts IS 'Total number of nodes per roadmap, used by GET /user/journey';
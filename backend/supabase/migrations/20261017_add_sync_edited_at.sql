@@ -0,0 +1,17 @@
+-- Migration: Offline sync support for user_progress and notes
+-- edited_at is when the change was made on the client (or by the server
+-- for online writes) and decides last-writer-wins merges in POST /sync.
+-- updated_at stays the server write time and drives the "changes since"
+-- watermark, read in (updated_at, node_id) order per user.
+
+ALTER TABLE user_progress
+ADD COLUMN IF NOT EXISTS edited_at TIMESTAMPTZ;
+
+ALTER TABLE notes
+ADD COLUMN IF NOT EXISTS edited_at TIMESTAMPTZ;
+
+CREATE INDEX IF NOT EXISTS idx_user_progress_user_updated ON user_progress(user_id, updated_at, node_id);
+CREATE INDEX IF NOT EXISTS idx_notes_user_updated ON notes(user_id, updated_at, node_id);
+
+COMMENT ON COLUMN user_progress.edited_at IS 'Client edit time for last-writer-wins sync; NULL means updated_at';
+COMMENT ON COLUMN notes.edited_at IS 'Client edit time for last-writer-wins sync; NULL means updated_at';
@@ -0,0 +1,100 @@
+-- Migration: Per-user, per-roadmap progress summary
+-- Maintained incrementally by a trigger on user_progress, so the journey
+-- endpoint reads one row per started roadmap instead of every progress row.
+-- Verify or rebuild it with: python -m scripts.reconcile_progress_summary
+
+CREATE TABLE IF NOT EXISTS user_roadmap_progress (
+  user_id UUID REFERENCES users(id) ON DELETE CASCADE,
+  roadmap_id UUID REFERENCES roadmaps(id) ON DELETE CASCADE,
+  completed_count INTEGER NOT NULL DEFAULT 0,
+  in_progress_count INTEGER NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ DEFAULT NOW(),
+  PRIMARY KEY (user_id, roadmap_id)
+);
+
+ALTER TABLE user_roadmap_progress ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own progress summary" ON user_roadmap_progress
+  FOR SELECT USING (auth.uid() = user_id);
+
+-- Apply the status transition of one user_progress row to its roadmap's
+-- summary. A row is created on the first progress write in a roadmap.
+CREATE OR REPLACE FUNCTION public.apply_user_roadmap_progress()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER SET search_path = public
+AS $$
+DECLARE
+  row_user UUID;
+  row_node UUID;
+  old_status TEXT;
+  new_status TEXT;
+  target_roadmap UUID;
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    row_user := NEW.user_id; row_node := NEW.node_id; new_status := NEW.status;
+  ELSIF TG_OP = 'DELETE' THEN
+    row_user := OLD.user_id; row_node := OLD.node_id; old_status := OLD.status;
+  ELSE
+    IF NEW.status IS NOT DISTINCT FROM OLD.status THEN
+      RETURN NULL;
+    END IF;
+    row_user := NEW.user_id; row_node := NEW.node_id;
+    old_status := OLD.status; new_status := NEW.status;
+  END IF;
+
+  SELECT roadmap_id INTO target_roadmap FROM nodes WHERE id = row_node;
+  IF target_roadmap IS NULL THEN
+    -- The node is already gone (its progress rows are deleted by cascade),
+    -- so the roadmap is unknown: recount the user's summaries from the
+    -- progress rows whose nodes remain
+    UPDATE user_roadmap_progress AS summary SET
+      completed_count = (
+        SELECT COUNT(*) FROM user_progress p JOIN nodes n ON n.id = p.node_id
+        WHERE p.user_id = row_user AND n.roadmap_id = summary.roadmap_id AND p.status = 'completed'
+      ),
+      in_progress_count = (
+        SELECT COUNT(*) FROM user_progress p JOIN nodes n ON n.id = p.node_id
+        WHERE p.user_id = row_user AND n.roadmap_id = summary.roadmap_id AND p.status = 'in_progress'
+      ),
+      updated_at = NOW()
+    WHERE summary.user_id = row_user;
+    RETURN NULL;
+  END IF;
+
+  INSERT INTO user_roadmap_progress AS summary (user_id, roadmap_id, completed_count, in_progress_count)
+  VALUES (
+    row_user,
+    target_roadmap,
+    (CASE WHEN new_status = 'completed' THEN 1 ELSE 0 END) - (CASE WHEN old_status = 'completed' THEN 1 ELSE 0 END),
+    (CASE WHEN new_status = 'in_progress' THEN 1 ELSE 0 END) - (CASE WHEN old_status = 'in_progress' THEN 1 ELSE 0 END)
+  )
+  ON CONFLICT (user_id, roadmap_id) DO UPDATE SET
+    completed_count = summary.completed_count + EXCLUDED.completed_count,
+    in_progress_count = summary.in_progress_count + EXCLUDED.in_progress_count,
+    updated_at = NOW();
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS on_user_progress_changed ON user_progress;
+CREATE TRIGGER on_user_progress_changed
+  AFTER INSERT OR UPDATE OF status OR DELETE ON user_progress
+  FOR EACH ROW EXECUTE FUNCTION public.apply_user_roadmap_progress();
+
+-- Backfill from existing progress
+INSERT INTO user_roadmap_progress (user_id, roadmap_id, completed_count, in_progress_count)
+SELECT
+  p.user_id,
+  n.roadmap_id,
+  COUNT(*) FILTER (WHERE p.status = 'completed')::INTEGER,
+  COUNT(*) FILTER (WHERE p.status = 'in_progress')::INTEGER
+FROM user_progress p
+JOIN nodes n ON n.id = p.node_id
+GROUP BY p.user_id, n.roadmap_id
+ON CONFLICT (user_id, roadmap_id) DO UPDATE SET
+  completed_count = EXCLUDED.completed_count,
+  in_progress_count = EXCLUDED.in_progress_count,
+  updated_at = NOW();
+
+COMMENT ON TABLE user_roadmap_progress IS 'Per-user progress counts per roadmap, maintained by on_user_progress_changed';
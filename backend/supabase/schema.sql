@@ -108,6 +108,90 @@ CREATE POLICY "Users can update own notes"
     ON notes FOR UPDATE 
     USING (true);
 
+-- =====================
+-- USER ROADMAP PROGRESS SUMMARY
+-- =====================
+-- Mirrors migrations/20261017_add_user_roadmap_progress.sql for this schema
+
+-- Per-user counts per roadmap, kept current by a trigger on progress
+CREATE TABLE IF NOT EXISTS user_roadmap_progress (
+    user_id TEXT NOT NULL,
+    roadmap_id TEXT NOT NULL REFERENCES roadmaps(id) ON DELETE CASCADE,
+    completed_count INTEGER NOT NULL DEFAULT 0,
+    in_progress_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (user_id, roadmap_id)
+);
+
+ALTER TABLE user_roadmap_progress ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own progress summary" 
+    ON user_roadmap_progress FOR SELECT 
+    USING (true);  -- For now, allow all (we'll use header-based auth)
+
+-- Apply the status transition of one progress row to its roadmap's summary
+CREATE OR REPLACE FUNCTION public.apply_user_roadmap_progress()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER SET search_path = public
+AS $$
+DECLARE
+    row_user TEXT;
+    row_node TEXT;
+    old_status TEXT;
+    new_status TEXT;
+    target_roadmap TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        row_user := NEW.user_id; row_node := NEW.node_id; new_status := NEW.status;
+    ELSIF TG_OP = 'DELETE' THEN
+        row_user := OLD.user_id; row_node := OLD.node_id; old_status := OLD.status;
+    ELSE
+        IF NEW.status IS NOT DISTINCT FROM OLD.status THEN
+            RETURN NULL;
+        END IF;
+        row_user := NEW.user_id; row_node := NEW.node_id;
+        old_status := OLD.status; new_status := NEW.status;
+    END IF;
+
+    SELECT roadmap_id INTO target_roadmap FROM nodes WHERE id = row_node;
+    IF target_roadmap IS NULL THEN
+        -- The node is already gone (its progress rows are deleted by
+        -- cascade), so recount the user's summaries from what remains
+        UPDATE user_roadmap_progress AS summary SET
+            completed_count = (
+                SELECT COUNT(*) FROM progress p JOIN nodes n ON n.id = p.node_id
+                WHERE p.user_id = row_user AND n.roadmap_id = summary.roadmap_id AND p.status = 'completed'
+            ),
+            in_progress_count = (
+                SELECT COUNT(*) FROM progress p JOIN nodes n ON n.id = p.node_id
+                WHERE p.user_id = row_user AND n.roadmap_id = summary.roadmap_id AND p.status = 'in_progress'
+            ),
+            updated_at = NOW()
+        WHERE summary.user_id = row_user;
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO user_roadmap_progress AS summary (user_id, roadmap_id, completed_count, in_progress_count)
+    VALUES (
+        row_user,
+        target_roadmap,
+        (CASE WHEN new_status = 'completed' THEN 1 ELSE 0 END) - (CASE WHEN old_status = 'completed' THEN 1 ELSE 0 END),
+        (CASE WHEN new_status = 'in_progress' THEN 1 ELSE 0 END) - (CASE WHEN old_status = 'in_progress' THEN 1 ELSE 0 END)
+    )
+    ON CONFLICT (user_id, roadmap_id) DO UPDATE SET
+        completed_count = summary.completed_count + EXCLUDED.completed_count,
+        in_progress_count = summary.in_progress_count + EXCLUDED.in_progress_count,
+        updated_at = NOW();
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS on_user_progress_changed ON progress;
+CREATE TRIGGER on_user_progress_changed
+    AFTER INSERT OR UPDATE OF status OR DELETE ON progress
+    FOR EACH ROW EXECUTE FUNCTION public.apply_user_roadmap_progress();
+
 -- =====================
 -- GIT ROADMAP DATA
 -- =====================
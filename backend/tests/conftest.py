@@ -0,0 +1,41 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import supabase as supabase_module
+from app.core.cache import catalog_cache
+from app.core.config import settings
+from app.core.search import node_search
+from app.core.write_behind import note_buffer
+from benchmarks.fake_supabase import FakeSupabase
+
+# User the authenticated `client` acts as (mock auth via X-User-Id)
+USER_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch):
+    """Route get_supabase() to an empty in-memory fake with no latency."""
+    fake = FakeSupabase(latency=0)
+    monkeypatch.setattr(supabase_module, "_create_client", lambda: fake)
+    supabase_module.get_supabase.cache_clear()
+    supabase_module._limiter = None
+    catalog_cache.clear()
+    note_buffer.clear()
+    node_search.clear()
+    yield fake
+    supabase_module.get_supabase.cache_clear()
+    supabase_module._limiter = None
+    catalog_cache.clear()
+    note_buffer.clear()
+    node_search.clear()
+
+
+@pytest.fixture
+def client(fake_supabase, monkeypatch):
+    """TestClient for main.app, authenticated as USER_ID (debug mock auth).
+
+    Modules that seed tables override it and request this one.
+    """
+    from main import app
+    monkeypatch.setattr(settings, "debug", True)
+    return TestClient(app, headers={"X-User-Id": USER_ID})
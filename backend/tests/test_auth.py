@@ -0,0 +1,66 @@
+"""
+Tests for JWT verification and the verified-claims cache.
+
+Run: pytest tests/test_auth.py -v
+"""
+import asyncio
+import time
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from app.core import auth
+from app.core.config import settings
+from tests.conftest import USER_ID
+
+SECRET = "test-secret-with-enough-length-for-hs256"
+
+
+def _token(exp_offset: float = 3600, **claims) -> str:
+    payload = {"sub": USER_ID, "aud": "authenticated", "exp": int(time.time() + exp_offset), **claims}
+    return jwt.encode(payload, SECRET, algorithm="HS256")
+
+
+@pytest.fixture(autouse=True)
+def jwt_settings(monkeypatch):
+    monkeypatch.setattr(settings, "debug", False)
+    monkeypatch.setattr(settings, "supabase_jwt_secret", SECRET)
+    auth._claims_cache.clear()
+    yield
+    auth._claims_cache.clear()
+
+
+def _resolve(token: str) -> auth.AuthenticatedUser:
+    return asyncio.run(auth.get_current_user(x_user_id=None, authorization=f"Bearer {token}"))
+
+
+class TestClaimsCache:
+    """Repeated tokens skip signature verification until they expire."""
+
+    def test_second_call_skips_verification(self, monkeypatch):
+        token = _token(email="a@example.com")
+        assert _resolve(token).email == "a@example.com"
+
+        def fail_decode(*args, **kwargs):
+            raise AssertionError("token should have been served from cache")
+
+        monkeypatch.setattr(auth.pyjwt, "decode", fail_decode)
+        assert _resolve(token).id == USER_ID
+        assert auth.auth_stats()["hits"] >= 1
+
+    def test_entry_expires_with_token(self, monkeypatch):
+        token = _token(exp_offset=30)
+        _resolve(token)
+        now = time.monotonic()
+        # Move the cache clock past the token's exp; the entry must be dropped
+        monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+        before = auth.auth_stats()["verify_count"]
+        _resolve(token)
+        assert auth.auth_stats()["verify_count"] == before + 1
+
+    def test_invalid_token_not_cached(self):
+        bad = jwt.encode({"sub": USER_ID, "aud": "authenticated"}, "wrong-secret-with-enough-length!!", algorithm="HS256")
+        with pytest.raises(HTTPException):
+            _resolve(bad)
+        assert len(auth._claims_cache) == 0
@@ -0,0 +1,202 @@
+"""
+Tests for the in-process TTL/LRU catalog cache.
+
+Run: pytest tests/test_cache.py -v
+"""
+import asyncio
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import SingleFlight, TTLCache
+
+
+class _Clock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", fake)
+    return fake
+
+
+class TestTTLCache:
+    """Expiry, eviction, invalidation and counters."""
+
+    def test_hit_and_miss_counters(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entry_expires_after_ttl(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+        clock.now += 11
+        assert cache.get("a") is None
+
+    def test_lru_eviction(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate_single_key(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.invalidate("a") is True
+        assert cache.invalidate("a") is False
+        assert cache.get("b") == 2
+
+
+class TestGetOrLoad:
+    """Loader calls and stale-on-error behaviour."""
+
+    def test_loader_called_once(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return "value"
+
+        assert asyncio.run(cache.get_or_load("k", loader)) == "value"
+        assert asyncio.run(cache.get_or_load("k", loader)) == "value"
+        assert len(calls) == 1
+
+    def test_stale_served_on_error(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10, stale_ttl=100)
+        cache.set("k", "old")
+        clock.now += 50
+
+        async def failing():
+            raise RuntimeError("upstream down")
+
+        assert asyncio.run(cache.get_or_load("k", failing)) == "old"
+        assert cache.stats()["stale_hits"] == 1
+
+    def test_error_raised_when_too_stale(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10, stale_ttl=100)
+        cache.set("k", "old")
+        clock.now += 200
+
+        async def failing():
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(cache.get_or_load("k", failing))
+
+
+class TestSingleFlight:
+    """Concurrent identical reads share one upstream call."""
+
+    def test_concurrent_calls_coalesced(self):
+        flights = SingleFlight()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def main():
+            return await asyncio.gather(*(flights.do("k", loader) for _ in range(50)))
+
+        assert asyncio.run(main()) == ["value"] * 50
+        assert len(calls) == 1
+        assert flights.stats() == {"in_flight": 0, "calls": 1, "coalesced": 49}
+
+    def test_errors_shared_then_released(self):
+        flights = SingleFlight()
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        async def main():
+            return await asyncio.gather(*(flights.do("k", failing) for _ in range(3)), return_exceptions=True)
+
+        results = asyncio.run(main())
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(calls) == 1
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(flights.do("k", failing))
+        assert len(calls) == 2
+
+    def test_cancelled_waiter_does_not_cancel_fetch(self):
+        flights = SingleFlight()
+
+        async def loader():
+            await asyncio.sleep(0.02)
+            return "value"
+
+        async def main():
+            first = asyncio.ensure_future(flights.do("k", loader))
+            second = asyncio.ensure_future(flights.do("k", loader))
+            await asyncio.sleep(0.005)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(main()) == "value"
+
+    # The clock fixture also freezes the event loop's clock, so these tests
+    # hold the loader on an Event rather than asyncio.sleep()
+
+    def test_cache_misses_coalesced(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+        calls = []
+
+        async def main():
+            release = asyncio.Event()
+
+            async def loader():
+                calls.append(1)
+                await release.wait()
+                return "value"
+
+            pending = asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(20)))
+            await asyncio.sleep(0)
+            release.set()
+            return await pending
+
+        assert asyncio.run(main()) == ["value"] * 20
+        assert len(calls) == 1
+        assert cache.stats()["coalesced"] == 19
+        assert cache.get("k") == "value"
+
+    def test_invalidation_during_fetch_not_stored(self, clock):
+        cache = TTLCache(maxsize=4, ttl=10)
+
+        async def main():
+            release = asyncio.Event()
+
+            async def loader():
+                await release.wait()
+                return "outdated"
+
+            pending = asyncio.ensure_future(cache.get_or_load("k", loader))
+            await asyncio.sleep(0)
+            cache.invalidate("k")
+            release.set()
+            return await pending
+
+        assert asyncio.run(main()) == "outdated"
+        assert cache.get("k") is None
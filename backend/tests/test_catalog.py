@@ -0,0 +1,116 @@
+"""
+Tests for catalog HTTP caching (ETag / If-None-Match).
+
+Run: pytest tests/test_catalog.py -v
+"""
+import json
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter, ValidationError
+
+from app.core.catalog import CatalogEntry, _etag_matches, compute_etag
+from app.models.schemas import NodeResponse
+
+
+NODE = {
+    "id": "git-1",
+    "roadmap_id": "git-github",
+    "title": "What is Git?",
+    "order_index": 1,
+    "svg_x": 50,
+    "svg_y": 100,
+    "content": "## What is Git?",
+}
+
+
+# ===========================
+# ETag computation
+# ===========================
+
+class TestComputeEtag:
+    """ETags should be strong, stable and content-derived."""
+
+    def test_etag_is_quoted(self):
+        etag = compute_etag({"a": 1})
+        assert etag.startswith('"') and etag.endswith('"')
+
+    def test_key_order_does_not_matter(self):
+        assert compute_etag({"a": 1, "b": 2}) == compute_etag({"b": 2, "a": 1})
+
+    def test_content_change_changes_etag(self):
+        assert compute_etag([NODE]) != compute_etag([{**NODE, "content": "edited"}])
+
+    def test_entry_precomputes_etag(self):
+        entry = CatalogEntry([NODE])
+        assert entry.etag == compute_etag([NODE])
+
+    def test_entry_with_adapter_preserializes_body(self):
+        entry = CatalogEntry([NODE], TypeAdapter(List[NodeResponse]))
+        body = json.loads(entry.body)
+        assert body[0]["id"] == "git-1"
+        assert body[0]["svg_x"] == 50.0 and body[0]["blog_links"] == []
+
+    def test_entry_validates_at_fill_time(self):
+        with pytest.raises(ValidationError):
+            CatalogEntry([{"id": "broken"}], TypeAdapter(List[NodeResponse]))
+
+    def test_missing_row_has_no_body(self):
+        assert CatalogEntry(None, TypeAdapter(NodeResponse)).body is None
+
+    def test_if_none_match_lists_and_weak_tags(self):
+        etag = compute_etag([NODE])
+        assert _etag_matches(f'"other", {etag}', etag)
+        assert _etag_matches(f"W/{etag}", etag)
+        assert _etag_matches("*", etag)
+        assert not _etag_matches('"other"', etag)
+
+
+# ===========================
+# Endpoints
+# ===========================
+
+class TestConditionalRequests:
+    """Catalog endpoints return 304 when the client's ETag is current."""
+
+    @pytest.fixture
+    def client(self, fake_supabase):
+        from main import app
+        fake_supabase.tables["nodes"] = [dict(NODE)]
+        return TestClient(app)
+
+    def test_etag_and_cache_control_sent(self, client):
+        response = client.get("/api/v1/roadmaps/git-github/nodes")
+        assert response.status_code == 200
+        assert response.headers["etag"]
+        assert "max-age" in response.headers["cache-control"]
+
+    def test_matching_etag_returns_304(self, client):
+        etag = client.get("/api/v1/nodes/git-1").headers["etag"]
+        response = client.get("/api/v1/nodes/git-1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_returns_full_body(self, client):
+        response = client.get("/api/v1/roadmaps/git-github/nodes", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.json()[0]["id"] == "git-1"
+
+
+# ===========================
+# Node summary projection
+# ===========================
+
+class TestNodeSummary:
+    """The summary listing returns only graph-rendering fields."""
+
+    def test_summary_omits_content(self, fake_supabase):
+        from main import app
+        fake_supabase.tables["nodes"] = [dict(NODE)]
+        response = TestClient(app).get("/api/v1/roadmaps/git-github/nodes/summary")
+        assert response.status_code == 200
+        assert response.json() == [
+            {"id": "git-1", "title": "What is Git?", "order_index": 1, "svg_x": 50.0, "svg_y": 100.0}
+        ]
@@ -0,0 +1,110 @@
+"""
+Tests for the "changes since" feed on GET /progress and GET /notes.
+
+Run: pytest tests/test_change_feed.py -v
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from postgrest import SyncPostgrestClient
+
+from app.core.changes import next_watermark
+from app.core.config import settings
+from app.core.pagination import apply_since, encode_cursor
+from tests.conftest import USER_ID
+
+
+def _at(minutes):
+    return f"2026-03-01T10:{minutes:02d}:00+00:00"
+
+
+@pytest.fixture
+def client(client, fake_supabase, monkeypatch):
+    monkeypatch.setattr(settings, "sync_watermark_lag", 0)
+    fake_supabase.tables["user_progress"] = [
+        {"user_id": USER_ID, "node_id": f"git-{i}", "status": "completed", "updated_at": _at(i)}
+        for i in range(1, 6)
+    ]
+    fake_supabase.tables["notes"] = [
+        {"id": "notes-1", "user_id": USER_ID, "node_id": "git-1", "content": "a", "updated_at": _at(1),
+         "nodes": {"title": "What is Git?"}},
+    ]
+    fake_supabase.tables["deleted_user_rows"] = []
+    return client
+
+
+def _drain(client, path, since=""):
+    """Follow next_since until the feed is caught up."""
+    items, deleted = [], []
+    for _ in range(20):
+        body = client.get(path, params={"since": since, "limit": 2}).json()
+        items += body["items"]
+        deleted += body["deleted"]
+        since = body["next_since"]
+        if not body["has_more"]:
+            return items, deleted, since
+    raise AssertionError("feed did not catch up")
+
+
+class TestChangeFeed:
+    """Incremental reads return only changed rows and tombstones."""
+
+    def test_full_read_then_incremental(self, client, fake_supabase):
+        items, deleted, since = _drain(client, "/api/v1/progress")
+        assert [row["node_id"] for row in items] == [f"git-{i}" for i in range(1, 6)]
+        assert deleted == []
+
+        assert _drain(client, "/api/v1/progress", since)[:2] == ([], [])
+
+        client.put("/api/v1/progress/git-2", json={"status": "in_progress"})
+        fake_supabase.tables["user_progress"] = [
+            row for row in fake_supabase.tables["user_progress"] if row["node_id"] != "git-5"
+        ]
+        fake_supabase.tables["deleted_user_rows"].append({
+            "user_id": USER_ID, "table_name": "user_progress", "node_id": "git-5",
+            "deleted_at": datetime.now(timezone.utc).isoformat(),
+        })
+
+        items, deleted, _ = _drain(client, "/api/v1/progress", since)
+        assert [(row["node_id"], row["status"]) for row in items] == [("git-2", "in_progress")]
+        assert [row["node_id"] for row in deleted] == ["git-5"]
+
+    def test_notes_feed_keeps_node_titles(self, client):
+        items, _, _ = _drain(client, "/api/v1/notes")
+        assert items[0]["node_title"] == "What is Git?"
+
+    def test_recent_rows_resent_until_past_lag(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "sync_watermark_lag", 3600)
+        client.put("/api/v1/progress/git-9", json={"status": "completed"})
+        _, _, since = _drain(client, "/api/v1/progress")
+        # The fresh write is inside the lag window, so it is read again
+        items, _, _ = _drain(client, "/api/v1/progress", since)
+        assert [row["node_id"] for row in items] == ["git-9"]
+
+    def test_expired_and_invalid_tokens(self, client):
+        old = (datetime.now(timezone.utc) - timedelta(days=settings.change_feed_retention_days + 1)).isoformat()
+        expired = "." + encode_cursor(old, "")
+        assert client.get("/api/v1/progress", params={"since": expired}).status_code == 410
+        assert client.get("/api/v1/notes", params={"since": "not-a-token"}).status_code == 400
+
+
+class TestSinceFilters:
+    """Filters apply_since() sends to PostgREST."""
+
+    def _params(self, watermark):
+        query = SyncPostgrestClient("http://localhost/rest/v1").from_("deleted_user_rows").select("node_id")
+        return apply_since(query, "deleted_at", "node_id", watermark, 10).request.params
+
+    def test_row_watermark_seeks_past_tiebreak(self):
+        params = self._params(encode_cursor(_at(1), "550e8400-e29b-41d4-a716-446655440001"))
+        assert params["or"] == (
+            f'(deleted_at.gt."{_at(1)}",'
+            f'and(deleted_at.eq."{_at(1)}",node_id.gt."550e8400-e29b-41d4-a716-446655440001"))'
+        )
+
+    def test_idle_watermark_seeks_by_time_only(self):
+        # An empty tiebreak must never reach the uuid node_id column
+        limit_time = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+        params = self._params(next_watermark([], False, None, limit_time, "deleted_at", advance_idle=True))
+        assert "or" not in params
+        assert params["deleted_at"] == f"gt.{limit_time.isoformat()}"
@@ -0,0 +1,116 @@
+"""
+Tests for negotiated response compression.
+
+Run: pytest tests/test_compression.py -v
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, available_encodings, compress_variants, negotiate
+
+NODE = {
+    "id": "git-1",
+    "roadmap_id": "git-github",
+    "title": "What is Git?",
+    "order_index": 1,
+    "svg_x": 50,
+    "svg_y": 100,
+    "content": "## What is Git?\n\n" + "- Go back to any previous version\n" * 100,
+}
+
+
+class TestNegotiate:
+    """Accept-Encoding parsing honours q-values and server preference."""
+
+    def test_prefers_server_order_on_ties(self):
+        assert negotiate("gzip, br", ["br", "gzip"]) == "br"
+
+    def test_q_values(self):
+        assert negotiate("br;q=0.5, gzip", ["br", "gzip"]) == "gzip"
+        assert negotiate("gzip;q=0", ["gzip"]) is None
+
+    def test_wildcard_and_identity(self):
+        assert negotiate("*", ["gzip"]) == "gzip"
+        assert negotiate("identity", ["gzip"]) is None
+        assert negotiate(None, ["gzip"]) is None
+
+    def test_small_bodies_get_no_variants(self):
+        assert compress_variants(b"[]") == {}
+        assert "gzip" in compress_variants(b'{"a":"' + b"x" * 4000 + b'"}')
+
+
+class TestMiddleware:
+    """Dynamic responses are compressed above the threshold only."""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+        @app.get("/big")
+        async def big():
+            return JSONResponse({"text": "markdown " * 100}, headers={"ETag": '"v1"'})
+
+        @app.get("/small")
+        async def small():
+            return {"ok": True}
+
+        @app.get("/plain")
+        async def plain():
+            return PlainTextResponse("x" * 1000, media_type="application/octet-stream")
+
+        return TestClient(app)
+
+    def test_large_json_compressed(self, client):
+        response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert response.json() == {"text": "markdown " * 100}
+
+    def test_small_and_binary_untouched(self, client):
+        assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+        assert "content-encoding" not in client.get("/plain", headers={"Accept-Encoding": "gzip"}).headers
+
+    def test_no_accept_encoding(self, client):
+        response = client.get("/big", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] == '"v1"'
+
+
+class TestPrecompressedCatalog:
+    """Catalog bodies are compressed once per cache fill and served as-is."""
+
+    @pytest.fixture
+    def client(self, fake_supabase):
+        from main import app
+        fake_supabase.tables["nodes"] = [dict(NODE)]
+        return TestClient(app)
+
+    def test_variant_served_with_weak_etag(self, client, monkeypatch):
+        from app.core import compression
+
+        calls = []
+        original = compression.compress
+        monkeypatch.setattr(compression, "compress", lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs))
+
+        path = "/api/v1/roadmaps/git-github/nodes"
+        first = client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert first.headers["content-encoding"] == "gzip"
+        assert first.headers["etag"].startswith('W/"')
+        assert first.json()[0]["content"] == NODE["content"]
+        compressed_at_fill = len(calls)
+
+        client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert len(calls) == compressed_at_fill == len(available_encodings())
+
+        revalidated = client.get(path, headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+        assert revalidated.status_code == 304
+
+    def test_identity_body_when_not_accepted(self, client):
+        response = client.get("/api/v1/nodes/git-1", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert not response.headers["etag"].startswith("W/")
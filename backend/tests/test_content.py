@@ -0,0 +1,95 @@
+"""
+Tests for the roadmap content compiler and catalog artifact.
+
+Run: pytest tests/test_content.py -v
+"""
+import json
+
+import pytest
+
+from app.core.content import (
+    CATALOG_PATH,
+    ContentError,
+    compile_catalog,
+    dump_catalog,
+    load_catalog,
+    read_minutes,
+    word_count,
+    write_catalog,
+)
+from scripts.seeding import catalog_node_rows
+
+
+def _write_roadmap(root, nodes, markdown=None, roadmap_id="demo"):
+    roadmap_dir = root / roadmap_id
+    (roadmap_dir / "nodes").mkdir(parents=True)
+    (roadmap_dir / "roadmap.json").write_text(json.dumps({
+        "id": roadmap_id, "title": "Demo", "description": "A demo roadmap", "nodes": nodes,
+    }))
+    for node_id, body in (markdown or {}).items():
+        (roadmap_dir / "nodes" / f"{node_id}.md").write_text(body)
+
+
+def _node(node_id, order_index, **extra):
+    return {"id": node_id, "title": node_id.title(), "order_index": order_index,
+            "svg_x": 50, "svg_y": 100 * order_index, **extra}
+
+
+class TestDerivedFields:
+    """Word counts ignore markdown link targets."""
+
+    def test_word_count_skips_urls(self):
+        assert word_count("Read [the docs](https://example.com/a-b-c) first.") == 4
+
+    def test_read_minutes_rounds_up(self):
+        assert read_minutes(0) == 1
+        assert read_minutes(201) == 2
+
+
+class TestCompileCatalog:
+    """Sources are validated and merged into one artifact."""
+
+    def test_markdown_merged_and_measured(self, tmp_path):
+        _write_roadmap(tmp_path, [_node("b", 2), _node("a", 1)], {"a": "\n## A\n\nOne two three.\n"})
+        catalog = compile_catalog(tmp_path)
+        nodes = catalog["roadmaps"][0]["nodes"]
+        assert [node["id"] for node in nodes] == ["a", "b"]
+        assert nodes[0]["content"] == "## A\n\nOne two three."
+        assert (nodes[0]["word_count"], nodes[0]["read_minutes"]) == (4, 1)
+        assert "content" not in nodes[1]
+
+    def test_all_errors_reported(self, tmp_path):
+        bad = _node("a", 1, colour="red")
+        del bad["svg_x"]
+        _write_roadmap(tmp_path, [bad, _node("b", 1)], {"orphan": "text"})
+        with pytest.raises(ContentError) as exc:
+            compile_catalog(tmp_path)
+        messages = "\n".join(exc.value.errors)
+        assert "unknown keys ['colour']" in messages
+        assert "svg_x" in messages
+        assert "order_index 1 already used" in messages
+        assert "orphan.md" in messages
+
+    def test_duplicate_node_ids_across_roadmaps(self, tmp_path):
+        _write_roadmap(tmp_path, [_node("a", 1)], roadmap_id="one")
+        _write_roadmap(tmp_path, [_node("a", 1)], roadmap_id="two")
+        with pytest.raises(ContentError, match="also used in one"):
+            compile_catalog(tmp_path)
+
+    def test_round_trip(self, tmp_path):
+        _write_roadmap(tmp_path, [_node("a", 1)])
+        catalog = compile_catalog(tmp_path)
+        path = tmp_path / "catalog.json"
+        write_catalog(catalog, path)
+        assert load_catalog(path) == catalog
+
+    def test_seed_rows_drop_derived_fields(self, tmp_path):
+        _write_roadmap(tmp_path, [_node("a", 1)], {"a": "Hello"})
+        rows = catalog_node_rows(compile_catalog(tmp_path)["roadmaps"][0])
+        assert rows[0]["roadmap_id"] == "demo"
+        assert "word_count" not in rows[0] and "read_minutes" not in rows[0]
+
+
+def test_committed_catalog_is_up_to_date():
+    """data/catalog.json must be rebuilt whenever content/ changes."""
+    assert CATALOG_PATH.read_text(encoding="utf-8") == dump_catalog(compile_catalog())
@@ -0,0 +1,152 @@
+"""
+Tests for the per-user event bus and the SSE event stream.
+
+Run: pytest tests/test_events.py -v
+"""
+import asyncio
+import json
+
+from app.api.v1.events import _event_stream
+from app.core.events import EventBus, event_bus
+from tests.conftest import USER_ID
+
+
+class _RelayBackend:
+    """Backend standing in for a cross-worker transport."""
+
+    def __init__(self):
+        self.sent = []
+        self.deliver = None
+
+    async def start(self, deliver):
+        self.deliver = deliver
+
+    async def stop(self):
+        pass
+
+    async def publish(self, user_id, payload):
+        self.sent.append((user_id, payload))
+
+
+class TestEventBus:
+    """Per-user delivery, stream limits and slow consumers."""
+
+    def test_delivers_to_own_user_only(self):
+        async def main():
+            bus = EventBus()
+            mine, theirs = bus.subscribe("u1"), bus.subscribe("u2")
+            await bus.publish("u1", "progress", {"node_id": "git-1"})
+            assert theirs.queue.empty()
+            return json.loads(await mine.next(1))
+
+        assert asyncio.run(main()) == {"type": "progress", "data": {"node_id": "git-1"}}
+
+    def test_stream_limit_per_user(self):
+        bus = EventBus(max_streams_per_user=1)
+        first = bus.subscribe("u1")
+        assert bus.subscribe("u1") is None
+        bus.unsubscribe(first)
+        assert bus.subscribe("u1") is not None
+
+    def test_slow_subscriber_closed(self):
+        async def main():
+            bus = EventBus(queue_size=1)
+            slow = bus.subscribe("u1")
+            await bus.publish("u1", "note", {"n": 1})
+            await bus.publish("u1", "note", {"n": 2})
+            assert bus.stats()["dropped"] == 1 and bus.stats()["streams"] == 0
+            # Close replaces the backlog with the end marker
+            return await slow.next(1)
+
+        assert asyncio.run(main()) is None
+
+    def test_backend_fans_out_and_receives(self):
+        async def main():
+            backend = _RelayBackend()
+            bus = EventBus(backend)
+            await bus.start()
+            subscription = bus.subscribe("u1")
+            await bus.publish("u1", "progress", {"node_id": "git-1"})
+            # An event published on another worker arrives through the backend
+            backend.deliver("u1", '{"type":"note","data":{}}')
+            return backend, [await subscription.next(1), await subscription.next(1)]
+
+        backend, received = asyncio.run(main())
+        assert [user_id for user_id, _ in backend.sent] == ["u1"]
+        assert [json.loads(payload)["type"] for payload in received] == ["progress", "note"]
+
+
+class TestEventStream:
+    """SSE framing and the endpoint."""
+
+    def test_sse_framing_and_keepalive(self):
+        async def main():
+            bus = EventBus()
+            subscription = bus.subscribe("u1")
+            stream = _event_stream(subscription, keepalive=0.01)
+            chunks = [await stream.__anext__(), await stream.__anext__()]
+            await bus.publish("u1", "progress", {"node_id": "git-1"})
+            chunks.append(await stream.__anext__())
+            subscription.close()
+            chunks += [chunk async for chunk in stream]
+            return chunks
+
+        chunks = asyncio.run(main())
+        assert chunks[0].startswith("retry: ")
+        assert chunks[1] == ": keepalive\n\n"
+        assert chunks[2] == 'data: {"type":"progress","data":{"node_id":"git-1"}}\n\n'
+        assert len(chunks) == 3
+
+    def test_writes_publish_events(self, client):
+        subscription = event_bus.subscribe(USER_ID)
+        try:
+            client.put("/api/v1/progress/git-1", json={"status": "completed"})
+            client.put("/api/v1/notes/git-1", json={"content": "hello"})
+            events = [json.loads(subscription.queue.get_nowait()) for _ in range(2)]
+        finally:
+            event_bus.unsubscribe(subscription)
+        assert [(event["type"], event["data"]["node_id"]) for event in events] == [
+            ("progress", "git-1"), ("note", "git-1"),
+        ]
+        assert events[1]["data"]["content"] == "hello"
+
+    def test_dropped_streams_are_released(self, client, monkeypatch):
+        from main import app
+        monkeypatch.setattr(event_bus, "max_streams_per_user", 2)
+        scope = {
+            "type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}, "http_version": "1.1",
+            "method": "GET", "scheme": "http", "path": "/api/v1/events", "raw_path": b"/api/v1/events",
+            "root_path": "", "query_string": b"", "server": ("test", 80), "client": ("test", 1),
+            "headers": [(b"host", b"test"), (b"x-user-id", USER_ID.encode())],
+        }
+
+        async def open_and_drop(disconnect_at: int):
+            sent = []
+
+            async def receive():
+                return {"type": "http.disconnect"}
+
+            async def send(message):
+                # The client goes away before the stream body starts
+                if len(sent) == disconnect_at:
+                    raise OSError("client disconnected")
+                sent.append(message)
+
+            try:
+                await app(scope, receive, send)
+            except Exception:
+                pass
+            return sent[0]["status"] if sent else None
+
+        async def main():
+            for _ in range(3):
+                await open_and_drop(0)
+                await open_and_drop(1)
+            return await open_and_drop(1)
+
+        assert asyncio.run(main()) == 200
+        assert event_bus.stats()["streams"] == 0
+
+    def test_too_many_streams(self, client, monkeypatch):
+        monkeypatch.setattr(event_bus, "max_streams_per_user", 0)
+        assert client.get("/api/v1/events").status_code == 429
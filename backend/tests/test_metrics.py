@@ -0,0 +1,75 @@
+"""
+Tests for the Prometheus metrics subsystem.
+
+Run: pytest tests/test_metrics.py -v
+"""
+from fastapi.testclient import TestClient
+
+from app.core import metrics
+from app.core.metrics import Counter, Histogram
+
+
+class TestMetricTypes:
+    """Text exposition output for counters and histograms."""
+
+    def test_counter_render(self):
+        counter = Counter("test_total", "Test counter.", ("route",))
+        counter.inc("/a")
+        counter.inc("/a", amount=2)
+        assert 'test_total{route="/a"} 3' in counter.render()
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("test_seconds", "Test histogram.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+        lines = histogram.render()
+        assert 'test_seconds_bucket{le="0.1"} 2' in lines
+        assert 'test_seconds_bucket{le="1.0"} 3' in lines
+        assert 'test_seconds_bucket{le="+Inf"} 4' in lines
+        assert "test_seconds_count 4" in lines
+
+    def test_label_values_escaped(self):
+        counter = Counter("test_total", "Test counter.", ("route",))
+        counter.inc('a"b')
+        assert 'test_total{route="a\\"b"} 1' in counter.render()
+
+
+class TestMetricsEndpoint:
+    """Middleware and /metrics integration."""
+
+    def test_route_template_label(self, fake_supabase):
+        from main import app
+        fake_supabase.tables["nodes"] = [{"id": "n1", "roadmap_id": "r1", "title": "N",
+                                          "order_index": 1, "svg_x": 0, "svg_y": 0}]
+        client = TestClient(app)
+        before = metrics.http_requests_total.value("GET", "/api/v1/nodes/{node_id}", "200")
+        client.get("/api/v1/nodes/n1")
+        after = metrics.http_requests_total.value("GET", "/api/v1/nodes/{node_id}", "200")
+        assert after == before + 1
+
+    def test_route_label_ignores_parameter_values(self, fake_supabase):
+        from main import app
+        fake_supabase.tables["nodes"] = [{"id": "nodes", "roadmap_id": "r1", "title": "N",
+                                          "order_index": 1, "svg_x": 0, "svg_y": 0}]
+        before = metrics.http_requests_total.value("GET", "/api/v1/nodes/{node_id}", "200")
+        TestClient(app).get("/api/v1/nodes/nodes")
+        assert metrics.http_requests_total.value("GET", "/api/v1/nodes/{node_id}", "200") == before + 1
+
+    def test_supabase_calls_timed_per_table(self, fake_supabase):
+        from main import app
+        before = metrics.supabase_query_duration_seconds.count("roadmaps", "ok")
+        TestClient(app).get("/api/v1/roadmaps")
+        assert metrics.supabase_query_duration_seconds.count("roadmaps", "ok") == before + 1
+
+    def test_metrics_endpoint_format(self, fake_supabase):
+        from main import app
+        response = TestClient(app).get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE skilltrail_http_request_duration_seconds histogram" in response.text
+        assert "skilltrail_catalog_cache_hits" in response.text
+
+    def test_health_is_liveness_only(self, fake_supabase):
+        from main import app
+        # Internal counters are only served by /metrics
+        assert TestClient(app).get("/health").json() == {"status": "healthy", "version": "1.0.0"}
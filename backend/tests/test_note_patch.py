@@ -0,0 +1,90 @@
+"""
+Tests for delta (PATCH) note updates with optimistic concurrency.
+
+Run: pytest tests/test_note_patch.py -v
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.v1.notes import _apply_edits
+from app.core.write_behind import note_buffer
+from app.models.schemas import NoteEdit
+from tests.conftest import USER_ID
+
+PATH = "/api/v1/notes/git-1"
+CONTENT = "# Git\n\n" + "Commits record snapshots.\n" * 1500
+
+
+@pytest.fixture
+def client(client, fake_supabase, monkeypatch):
+    monkeypatch.setattr(note_buffer, "delay", 0)
+    fake_supabase.tables["notes"] = [
+        {"id": "notes-1", "user_id": USER_ID, "node_id": "git-1", "content": CONTENT, "version": 3},
+    ]
+    return client
+
+
+class TestApplyEdits:
+    """Range edits are applied against the base content in one pass."""
+
+    def test_edits_in_any_order(self):
+        edits = [NoteEdit(start=6, end=11, text="there"), NoteEdit(start=0, end=5, text="Hi")]
+        assert _apply_edits("hello world", edits) == "Hi there"
+
+    def test_insert_and_delete(self):
+        assert _apply_edits("abc", [NoteEdit(start=3, end=3, text="d"), NoteEdit(start=0, end=1)]) == "bcd"
+
+    def test_rejects_out_of_range_and_overlap(self):
+        with pytest.raises(ValueError):
+            _apply_edits("abc", [NoteEdit(start=2, end=9)])
+        with pytest.raises(ValueError):
+            _apply_edits("abcdef", [NoteEdit(start=0, end=3), NoteEdit(start=2, end=4)])
+
+
+class TestPatchEndpoint:
+    """PATCH /notes/{node_id} applies deltas and rejects stale bases."""
+
+    def test_patch_applies_and_bumps_version(self, client, fake_supabase):
+        response = client.patch(PATH, json={"base_version": 3, "edits": [{"start": 2, "end": 5, "text": "GIT"}]})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["version"] == 4
+        assert body["content"] == "# GIT\n\n" + CONTENT[7:]
+        assert fake_supabase.tables["notes"][0]["content"] == body["content"]
+
+    def test_stale_base_rejected(self, client, fake_supabase):
+        response = client.patch(PATH, json={"base_version": 2, "edits": [{"start": 0, "end": 1, "text": "x"}]})
+        assert response.status_code == 409
+        assert fake_supabase.tables["notes"][0]["content"] == CONTENT
+
+    def test_concurrent_write_detected(self, client, fake_supabase, monkeypatch):
+        # The note moves on between the read and the conditional update
+        original = note_buffer._update_if_version
+
+        async def racing(row, expected_version):
+            fake_supabase.tables["notes"][0]["version"] = 4
+            return await original(row, expected_version)
+
+        monkeypatch.setattr(note_buffer, "_update_if_version", racing)
+        response = client.patch(PATH, json={"base_version": 3, "edits": [{"start": 0, "end": 1, "text": "x"}]})
+        assert response.status_code == 409
+
+    def test_bad_edits_and_missing_note(self, client):
+        response = client.patch(PATH, json={"base_version": 3, "edits": [{"start": 0, "end": 10 ** 6, "text": ""}]})
+        assert response.status_code == 422
+        response = client.patch("/api/v1/notes/git-2", json={"base_version": 1, "edits": [{"start": 0, "end": 0}]})
+        assert response.status_code == 404
+
+    def test_patches_on_buffered_note(self, client, fake_supabase, monkeypatch):
+        monkeypatch.setattr(note_buffer, "delay", 60.0)
+        with TestClient(client.app, headers={"X-User-Id": USER_ID}) as buffered:
+            first = buffered.patch(PATH, json={"base_version": 3, "edits": [{"start": 0, "end": 1, "text": "%"}]})
+            second = buffered.patch(PATH, json={"base_version": 4, "edits": [{"start": 0, "end": 1, "text": "!"}]})
+            stale = buffered.patch(PATH, json={"base_version": 4, "edits": [{"start": 0, "end": 1, "text": "?"}]})
+            assert [first.status_code, second.status_code, stale.status_code] == [200, 200, 409]
+            assert second.json()["version"] == 5
+            assert buffered.get(PATH).json()["content"].startswith("! Git")
+
+        stored = fake_supabase.tables["notes"][0]
+        assert stored["version"] == 5
+        assert stored["content"].startswith("! Git")
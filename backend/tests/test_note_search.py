@@ -0,0 +1,95 @@
+"""
+Tests for GET /notes/search.
+
+search_notes() runs in Postgres; the fake stands in for it with a
+prefix match over the caller's notes that marks matches like
+ts_headline() does.
+
+Run: pytest tests/test_note_search.py -v
+"""
+import re
+
+import pytest
+
+from app.core.search import HIGHLIGHT_START, HIGHLIGHT_STOP, prefix_tsquery, split_highlights
+from app.core.write_behind import note_buffer
+from tests.conftest import USER_ID
+
+OTHER_USER_ID = "660e8400-e29b-41d4-a716-446655440000"
+
+
+def _search_notes(tables, params):
+    terms = [term.removesuffix(":*") for term in params["p_query"].split(" & ")]
+    titles = {node["id"]: node["title"] for node in tables.get("nodes", [])}
+    rows = []
+    for note in tables.get("notes", []):
+        if note["user_id"] != params["p_user_id"]:
+            continue
+        words = re.findall(r"\w+", (note.get("content") or "").lower())
+        if not all(any(word.startswith(term) for word in words) for term in terms):
+            continue
+        pattern = r"\b(" + "|".join(terms) + r")(\w*)"
+        snippet = re.sub(pattern, HIGHLIGHT_START + r"\1\2" + HIGHLIGHT_STOP, note["content"], flags=re.I)
+        rows.append({
+            "node_id": note["node_id"],
+            "node_title": titles.get(note["node_id"]),
+            "rank": 0.5,
+            "snippet": snippet,
+            "updated_at": note.get("updated_at"),
+        })
+    return rows[: params["p_limit"]]
+
+
+class TestHelpers:
+    """Query building and highlight parsing."""
+
+    def test_prefix_tsquery_drops_operators(self):
+        assert prefix_tsquery("merge & !conflict:*") == "merge:* & conflict:*"
+        assert prefix_tsquery("  ?!  ") == ""
+
+    def test_split_highlights(self):
+        marked = f"a {HIGHLIGHT_START}merge{HIGHLIGHT_STOP} and {HIGHLIGHT_START}rebase{HIGHLIGHT_STOP}"
+        assert split_highlights(marked) == ("a merge and rebase", [[2, 7], [12, 18]])
+
+
+class TestNoteSearchEndpoint:
+    """Ranked hits with snippets, scoped to the caller."""
+
+    @pytest.fixture
+    def client(self, client, fake_supabase):
+        fake_supabase.functions["search_notes"] = _search_notes
+        fake_supabase.tables["nodes"] = [{"id": "git-1", "title": "Merging Branches"}]
+        fake_supabase.tables["notes"] = [
+            {"user_id": USER_ID, "node_id": "git-1", "content": "Resolve merge conflicts by hand",
+             "updated_at": "2026-10-01T00:00:00+00:00"},
+            {"user_id": OTHER_USER_ID, "node_id": "git-1", "content": "merge is scary",
+             "updated_at": "2026-10-01T00:00:00+00:00"},
+        ]
+        return client
+
+    def test_search_returns_snippets_not_bodies(self, client):
+        response = client.get("/api/v1/notes/search", params={"q": "merg conflict"})
+        assert response.status_code == 200
+        hits = response.json()
+        assert len(hits) == 1
+        hit = hits[0]
+        assert hit["node_title"] == "Merging Branches"
+        assert "content" not in hit
+        assert [hit["snippet"][start:end] for start, end in hit["highlights"]] == ["merge", "conflicts"]
+
+    def test_only_own_notes(self, client):
+        assert client.get("/api/v1/notes/search", params={"q": "scary"}).json() == []
+
+    def test_buffered_autosave_is_searchable(self, client, monkeypatch):
+        monkeypatch.setattr(note_buffer, "delay", 60.0)
+        client.put("/api/v1/notes/git-2", json={"content": "first draft"})
+        client.put("/api/v1/notes/git-2", json={"content": "cherry-pick notes"})
+        assert note_buffer.pending_keys(USER_ID)
+        hits = client.get("/api/v1/notes/search", params={"q": "cherry"}).json()
+        assert [hit["node_id"] for hit in hits] == ["git-2"]
+        assert not note_buffer.pending_keys(USER_ID)
+
+    def test_query_without_words(self, client, fake_supabase):
+        executed = fake_supabase.executed
+        assert client.get("/api/v1/notes/search", params={"q": "!!"}).json() == []
+        assert fake_supabase.executed == executed
@@ -0,0 +1,76 @@
+"""
+Tests for keyset (cursor) pagination on per-user and admin listings.
+
+Run: pytest tests/test_pagination.py -v
+"""
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor, paginate
+from tests.conftest import USER_ID
+
+
+# ===========================
+# Cursor encoding
+# ===========================
+
+class TestCursor:
+    """Cursors are opaque and reject tampering."""
+
+    def test_round_trip(self):
+        cursor = encode_cursor("2026-01-01T00:00:00+00:00", "abc")
+        assert decode_cursor(cursor) == ("2026-01-01T00:00:00+00:00", "abc")
+
+    def test_garbage_rejected(self):
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor("not-a-cursor")
+        assert exc_info.value.status_code == 400
+
+    def test_filter_injection_rejected(self):
+        with pytest.raises(HTTPException):
+            decode_cursor(encode_cursor('x",id.gt."', "abc"))
+
+    def test_paginate_sets_cursor_only_when_more_rows(self):
+        rows = [{"updated_at": f"2026-01-0{i}", "id": str(i)} for i in (3, 2, 1)]
+        page, cursor = paginate(rows, 2, "updated_at", "id")
+        assert [r["id"] for r in page] == ["3", "2"]
+        assert decode_cursor(cursor) == ("2026-01-02", "2")
+        assert paginate(rows, 3, "updated_at", "id")[1] is None
+
+
+# ===========================
+# Endpoints
+# ===========================
+
+class TestNotesPagination:
+    """GET /notes walks every note exactly once across pages."""
+
+    @pytest.fixture
+    def client(self, client, fake_supabase):
+        # Two notes share a timestamp to exercise the id tiebreaker
+        fake_supabase.tables["notes"] = [
+            {"id": f"note-{i}", "user_id": USER_ID, "node_id": f"n{i}", "content": "",
+             "updated_at": f"2026-01-0{min(i, 4)}T00:00:00+00:00"}
+            for i in range(1, 6)
+        ]
+        return client
+
+    def test_pages_cover_all_rows(self, client):
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+            body = client.get("/api/v1/notes", params=params).json()
+            seen.extend(item["id"] for item in body["items"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == ["note-5", "note-4", "note-3", "note-2", "note-1"]
+
+    def test_invalid_cursor_is_400(self, client):
+        response = client.get("/api/v1/notes", params={"cursor": "bogus"})
+        assert response.status_code == 400
+
+    def test_limit_is_bounded(self, client):
+        response = client.get("/api/v1/notes", params={"limit": settings.page_size_max + 1})
+        assert response.status_code == 422
@@ -0,0 +1,52 @@
+"""
+Tests for progress write endpoints.
+
+Run: pytest tests/test_progress.py -v
+"""
+import pytest
+from pydantic import ValidationError
+
+from app.models.schemas import ProgressBatchUpdate
+
+
+# ===========================
+# Batch updates
+# ===========================
+
+class TestProgressBatch:
+    """PUT /progress/batch upserts many nodes in one request."""
+
+    def test_schema_bounds(self):
+        with pytest.raises(ValidationError):
+            ProgressBatchUpdate(items=[])
+        with pytest.raises(ValidationError):
+            ProgressBatchUpdate(items=[{"node_id": "n1", "status": "done"}])
+        with pytest.raises(ValidationError):
+            ProgressBatchUpdate(items=[{"node_id": f"n{i}", "status": "completed"} for i in range(501)])
+
+    def test_single_upsert_for_batch(self, client, fake_supabase):
+        calls = []
+        original = fake_supabase.table
+
+        def counting_table(name):
+            calls.append(name)
+            return original(name)
+
+        fake_supabase.table = counting_table
+        response = client.put("/api/v1/progress/batch", json={"items": [
+            {"node_id": "n1", "status": "completed"},
+            {"node_id": "n2", "status": "in_progress"},
+        ]})
+        assert response.status_code == 200
+        assert calls == ["user_progress"]
+        assert [r["saved"] for r in response.json()["results"]] == [True, True]
+        assert len(fake_supabase.tables["user_progress"]) == 2
+
+    def test_duplicate_node_last_wins(self, client, fake_supabase):
+        response = client.put("/api/v1/progress/batch", json={"items": [
+            {"node_id": "n1", "status": "in_progress"},
+            {"node_id": "n1", "status": "completed"},
+        ]})
+        results = response.json()["results"]
+        assert [r["saved"] for r in results] == [False, True]
+        assert fake_supabase.tables["user_progress"][0]["status"] == "completed"
@@ -0,0 +1,105 @@
+"""
+Tests for the per-user roadmap progress summary and its reconciliation.
+
+Run: pytest tests/test_progress_summary.py -v
+"""
+import pytest
+
+from scripts import reconcile_progress_summary
+from scripts.reconcile_progress_summary import reconcile, summarize_progress
+from tests.conftest import USER_ID
+
+ROADMAP = {"id": "git-github", "title": "Git & GitHub", "description": "Version control"}
+
+
+def _tables():
+    nodes = [{"id": f"git-{i}", "roadmap_id": "git-github", "title": f"Step {i}"} for i in range(1, 5)]
+    progress = [
+        {"user_id": USER_ID, "node_id": "git-1", "status": "completed", "updated_at": "2026-01-01T00:00:01+00:00"},
+        {"user_id": USER_ID, "node_id": "git-2", "status": "completed", "updated_at": "2026-01-01T00:00:02+00:00"},
+        {"user_id": USER_ID, "node_id": "git-3", "status": "in_progress", "updated_at": "2026-01-01T00:00:03+00:00"},
+        {"user_id": "other", "node_id": "git-1", "status": "not_started", "updated_at": "2026-01-01T00:00:04+00:00"},
+    ]
+    return {
+        "roadmaps": [ROADMAP],
+        "nodes": nodes,
+        "user_progress": progress,
+        "roadmap_node_counts": [{"roadmap_id": "git-github", "total_count": len(nodes)}],
+        "user_roadmap_progress": [
+            {"user_id": USER_ID, "roadmap_id": "git-github", "completed_count": 2,
+             "in_progress_count": 1, "roadmaps": ROADMAP},
+        ],
+    }
+
+
+@pytest.fixture
+def client(client, fake_supabase):
+    fake_supabase.tables.update(_tables())
+    return client
+
+
+class TestSummaryReads:
+    """Journey and /progress/summary read the maintained summary rows."""
+
+    def test_progress_summary(self, client):
+        response = client.get("/api/v1/progress/summary")
+        assert response.status_code == 200
+        assert response.json() == [
+            {"roadmap_id": "git-github", "total_count": 4, "completed_count": 2, "in_progress_count": 1}
+        ]
+
+    def test_journey_uses_summary(self, client, fake_supabase):
+        # Counts come from the summary row, not from scanning user_progress
+        fake_supabase.tables["user_roadmap_progress"][0]["completed_count"] = 3
+        roadmaps = client.get("/api/v1/user/journey").json()["roadmaps"]
+        assert roadmaps == [{
+            "id": "git-github", "title": "Git & GitHub", "description": "Version control",
+            "total_count": 4, "completed_count": 3, "in_progress_count": 1,
+        }]
+
+    def test_journey_lists_recently_touched_roadmaps_first(self, client, fake_supabase):
+        prompting = {"id": "genai-prompting", "title": "Prompting", "description": "Prompts"}
+        summaries = fake_supabase.tables["user_roadmap_progress"]
+        summaries[0]["updated_at"] = "2026-01-01T00:00:03+00:00"
+        summaries.insert(0, {"user_id": USER_ID, "roadmap_id": "genai-prompting", "completed_count": 1,
+                             "in_progress_count": 0, "updated_at": "2026-01-01T00:00:01+00:00",
+                             "roadmaps": prompting})
+        roadmaps = client.get("/api/v1/user/journey").json()["roadmaps"]
+        assert [roadmap["id"] for roadmap in roadmaps] == ["git-github", "genai-prompting"]
+
+    def test_journey_recent_topics_skip_missing_nodes_before_limit(self, client, fake_supabase):
+        node = {"id": "git-1", "title": "Step 1", "roadmap_id": "git-github", "roadmaps": ROADMAP}
+        fake_supabase.tables["user_progress"] = [
+            {"user_id": USER_ID, "node_id": f"git-{i}", "status": "completed",
+             "updated_at": f"2026-01-01T00:00:{i:02d}+00:00", "nodes": node if i < 20 else None}
+            for i in range(1, 25)
+        ]
+        topics = client.get("/api/v1/user/journey").json()["recent_topics"]
+        assert len(topics) == 10
+        assert topics[0]["updated_at"] == "2026-01-01T00:00:19Z"
+
+
+class TestReconcile:
+    """The reconciliation job rebuilds counts from user_progress."""
+
+    def test_summarize_counts_statuses(self):
+        tables = _tables()
+        summary = summarize_progress(tables["user_progress"], {"git-1": "git-github", "git-2": "git-github",
+                                                                "git-3": "git-github"})
+        assert summary[(USER_ID, "git-github")] == {"completed_count": 2, "in_progress_count": 1}
+        assert summary[("other", "git-github")] == {"completed_count": 0, "in_progress_count": 0}
+
+    def test_detects_and_fixes_drift(self, fake_supabase, monkeypatch):
+        monkeypatch.setattr(reconcile_progress_summary, "PAGE_SIZE", 2)
+        fake_supabase.tables.update(_tables())
+        fake_supabase.tables["user_roadmap_progress"][0]["completed_count"] = 7
+
+        report = reconcile(fake_supabase)
+        assert report.drifted == [(USER_ID, "git-github"), ("other", "git-github")]
+        assert report.fixed == 0
+
+        report = reconcile(fake_supabase, apply=True)
+        assert report.fixed == 2
+        assert reconcile(fake_supabase).drifted == []
+        stored = {row["user_id"]: row["completed_count"] for row in fake_supabase.tables["user_roadmap_progress"]}
+        assert stored == {USER_ID: 2, "other": 0}
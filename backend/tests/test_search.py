@@ -0,0 +1,130 @@
+"""
+Tests for the node full-text search index and GET /search.
+
+Run: pytest tests/test_search.py -v
+"""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.search import NodeSearchIndex, plain_text
+
+
+def _node(node_id, title, content="", roadmap_id="git-github", **fields):
+    return {"id": node_id, "roadmap_id": roadmap_id, "title": title, "content": content, **fields}
+
+
+NODES = [
+    _node("rebase", "Rebasing", "Rebase replays your commits on top of another branch."),
+    _node("merge", "Merging Branches", "A merge combines branches. Resolve a merge conflict by editing the file."),
+    _node("commit", "Committing Changes", "Each commit records a snapshot.", tldr="Commit early, commit often."),
+    _node("prompt", "Prompt Basics", "Write clear prompts.", roadmap_id="genai-prompting"),
+]
+
+
+@pytest.fixture
+def index():
+    index = NodeSearchIndex()
+    for node in NODES:
+        index.add(node)
+    return index
+
+
+class TestRanking:
+    """BM25 ranking, prefixes and multi-term queries."""
+
+    def test_title_match_ranks_first(self, index):
+        hits = index.search("branch")
+        assert [hit["id"] for hit in hits] == ["merge", "rebase"]
+
+    def test_prefix_matches(self, index):
+        assert [hit["id"] for hit in index.search("rebas")] == ["rebase"]
+        # Single letters are not expanded
+        assert index.search("r") == []
+
+    def test_every_term_must_match(self, index):
+        assert [hit["id"] for hit in index.search("merge confl")] == ["merge"]
+        assert index.search("merge prompt") == []
+
+    def test_roadmap_filter_and_limit(self, index):
+        assert [hit["id"] for hit in index.search("prompt", roadmap_id="git-github")] == []
+        assert len(index.search("commit", limit=1)) == 1
+
+    def test_markdown_is_not_indexed(self):
+        assert plain_text("See [the **docs**](https://git-scm.com/rebase)") == "See the docs"
+
+
+class TestSnippets:
+    """Snippet windows and highlight ranges."""
+
+    def test_highlights_index_into_snippet(self, index):
+        hit = index.search("conflict")[0]
+        assert [hit["snippet"][start:end] for start, end in hit["highlights"]] == ["conflict"]
+
+    def test_long_content_is_clipped_around_match(self):
+        index = NodeSearchIndex()
+        index.add(_node("long", "Long", " ".join(["filler"] * 100) + " needle " + " ".join(["tail"] * 100)))
+        hit = index.search("needle")[0]
+        assert hit["snippet"].startswith("…") and hit["snippet"].endswith("…")
+        assert len(hit["snippet"]) <= 162
+        start, end = hit["highlights"][0]
+        assert hit["snippet"][start:end] == "needle"
+
+    def test_title_only_match_uses_content_start(self, index):
+        hit = index.search("rebasing")[0]
+        assert hit["snippet"].startswith("Rebase replays")
+        assert hit["highlights"] == []
+
+
+class TestIncrementalRefresh:
+    """refresh() re-indexes only nodes whose content_hash changed."""
+
+    def test_refresh_fetches_only_changed_nodes(self, fake_supabase):
+        fake_supabase.tables["nodes"] = [dict(node, content_hash=node["id"] + "-v1") for node in NODES]
+        index = NodeSearchIndex()
+
+        assert asyncio.run(index.refresh(fake_supabase)) == len(NODES)
+        executed = fake_supabase.executed
+        assert asyncio.run(index.refresh(fake_supabase)) == 0
+        assert fake_supabase.executed == executed + 1  # listing only
+
+        rows = fake_supabase.tables["nodes"]
+        rows[0].update(content="Interactive rebase squashes commits.", content_hash="rebase-v2")
+        del rows[1]
+        assert asyncio.run(index.refresh(fake_supabase)) == 2
+        assert index.search("merge") == []
+        assert [hit["id"] for hit in index.search("squash")] == ["rebase"]
+
+    def test_rows_without_hash_compared_by_content(self, fake_supabase):
+        fake_supabase.tables["nodes"] = [dict(NODES[0])]
+        index = NodeSearchIndex()
+        asyncio.run(index.refresh(fake_supabase))
+        assert asyncio.run(index.refresh(fake_supabase)) == 0
+
+
+class TestSearchEndpoint:
+    """GET /api/v1/search."""
+
+    @pytest.fixture
+    def client(self, fake_supabase):
+        from main import app
+        fake_supabase.tables["nodes"] = [dict(node) for node in NODES]
+        return TestClient(app)
+
+    def test_search(self, client):
+        response = client.get("/api/v1/search", params={"q": "merge conflict"})
+        assert response.status_code == 200
+        hits = response.json()
+        assert [hit["id"] for hit in hits] == ["merge"]
+        assert hits[0]["title"] == "Merging Branches"
+
+    def test_refresh_cached(self, client, fake_supabase):
+        client.get("/api/v1/search", params={"q": "git"})
+        executed = fake_supabase.executed
+        client.get("/api/v1/search", params={"q": "rebase"})
+        assert fake_supabase.executed == executed
+
+    def test_query_required(self, client):
+        assert client.get("/api/v1/search").status_code == 422
+        assert client.get("/api/v1/search", params={"q": "git", "limit": 500}).status_code == 422
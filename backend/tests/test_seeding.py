@@ -0,0 +1,57 @@
+"""
+Tests for the shared diff-based seeding engine.
+
+Run: pytest tests/test_seeding.py -v
+"""
+from benchmarks.fake_supabase import FakeSupabase
+from scripts.seeding import content_hash, seed_roadmap_content
+
+ROADMAP = {"id": "git-github", "title": "Git & GitHub", "description": "Version control"}
+
+
+def _nodes(count: int):
+    return [
+        {"id": f"git-{i}", "roadmap_id": "git-github", "title": f"Step {i}",
+         "order_index": i, "svg_x": 50, "content": f"## Step {i}"}
+        for i in range(1, count + 1)
+    ]
+
+
+class TestContentHash:
+    """Hashes ignore representation differences between JSON and Postgres."""
+
+    def test_int_and_float_hash_equal(self):
+        assert content_hash({"svg_x": 50}) == content_hash({"svg_x": 50.0})
+
+    def test_stored_hash_column_ignored(self):
+        row = {"id": "a", "title": "A"}
+        assert content_hash(row) == content_hash({**row, "content_hash": "old"})
+
+
+class TestSeedRoadmapContent:
+    """Only new or changed nodes are written, in chunked upserts."""
+
+    def test_first_run_inserts_in_chunks(self):
+        fake = FakeSupabase(latency=0)
+        report = seed_roadmap_content(fake, ROADMAP, _nodes(5), chunk_size=2)
+        assert (report.inserted, report.updated, report.unchanged) == (5, 0, 0)
+        # 1 roadmap upsert + 3 hash lookups + 3 node upserts
+        assert report.requests == 7
+        assert len(fake.tables["nodes"]) == 5
+
+    def test_rerun_is_noop(self):
+        fake = FakeSupabase(latency=0)
+        seed_roadmap_content(fake, ROADMAP, _nodes(5))
+        report = seed_roadmap_content(fake, ROADMAP, _nodes(5))
+        assert (report.inserted, report.updated, report.unchanged) == (0, 0, 5)
+        assert report.requests == 2
+
+    def test_changed_node_updated(self):
+        fake = FakeSupabase(latency=0)
+        seed_roadmap_content(fake, ROADMAP, _nodes(3))
+        nodes = _nodes(3)
+        nodes[1]["content"] = "## Rewritten"
+        report = seed_roadmap_content(fake, ROADMAP, nodes)
+        assert (report.inserted, report.updated, report.unchanged) == (0, 1, 2)
+        stored = next(r for r in fake.tables["nodes"] if r["id"] == "git-2")
+        assert stored["content"] == "## Rewritten"
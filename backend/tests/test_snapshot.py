@@ -0,0 +1,103 @@
+"""
+Tests for serving catalog reads from a memory-mapped snapshot.
+
+Run: pytest tests/test_snapshot.py -v
+"""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import snapshot as snapshot_module
+from app.core.content import compile_catalog
+from app.core.snapshot import CatalogSnapshot, write_snapshot
+
+
+def _catalog(tmp_path, title="What is Git?", content="## What is Git?"):
+    roadmap_dir = tmp_path / "content" / "git-github"
+    (roadmap_dir / "nodes").mkdir(parents=True, exist_ok=True)
+    (roadmap_dir / "roadmap.json").write_text(json.dumps({
+        "id": "git-github", "title": "Git & GitHub", "description": "Version control",
+        "nodes": [{"id": "git-1", "title": title, "order_index": 1, "svg_x": 50, "svg_y": 100}],
+    }))
+    (roadmap_dir / "nodes" / "git-1.md").write_text(content)
+    return compile_catalog(tmp_path / "content")
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, fake_supabase, monkeypatch):
+    """A snapshot of a one-node catalog, installed with no reload delay."""
+    path = tmp_path / "catalog.snapshot"
+    write_snapshot(_catalog(tmp_path), path)
+    monkeypatch.setattr(snapshot_module, "catalog_snapshot", CatalogSnapshot(str(path), 0.0))
+    return path
+
+
+@pytest.fixture
+def client(snapshot_path):
+    from main import app
+    return TestClient(app)
+
+
+class TestSnapshotServing:
+    """Catalog routes answer from the snapshot without calling Supabase."""
+
+    def test_node_matches_response_model(self, client, fake_supabase):
+        response = client.get("/api/v1/nodes/git-1")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        node = response.json()
+        assert (node["id"], node["roadmap_id"], node["content"]) == ("git-1", "git-github", "## What is Git?")
+        assert "word_count" not in node
+        assert fake_supabase.executed == 0
+
+    def test_all_catalog_routes_served(self, client, fake_supabase):
+        for path in ("/api/v1/roadmaps", "/api/v1/roadmaps/git-github",
+                     "/api/v1/roadmaps/git-github/nodes", "/api/v1/roadmaps/git-github/nodes/summary"):
+            assert client.get(path).status_code == 200
+        assert fake_supabase.executed == 0
+
+    def test_matching_etag_returns_304(self, client):
+        etag = client.get("/api/v1/roadmaps").headers["etag"]
+        response = client.get("/api/v1/roadmaps", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_unknown_key_falls_back_to_supabase(self, client, fake_supabase):
+        fake_supabase.tables["nodes"] = [{"id": "new-1", "roadmap_id": "new", "title": "New",
+                                          "order_index": 1, "svg_x": 0, "svg_y": 0}]
+        response = client.get("/api/v1/nodes/new-1")
+        assert response.status_code == 200
+        assert fake_supabase.executed == 1
+
+    def test_replaced_file_is_reloaded(self, client, snapshot_path, tmp_path):
+        assert client.get("/api/v1/nodes/git-1").json()["title"] == "What is Git?"
+        write_snapshot(_catalog(tmp_path, title="Git, explained"), snapshot_path)
+        assert client.get("/api/v1/nodes/git-1").json()["title"] == "Git, explained"
+        assert snapshot_module.catalog_snapshot.reloads == 2
+
+
+    def test_precompressed_variant_served(self, client, snapshot_path, tmp_path):
+        content = "## What is Git?\n\n" + "- See exactly what changed and when\n" * 100
+        write_snapshot(_catalog(tmp_path, content=content), snapshot_path)
+        response = client.get("/api/v1/nodes/git-1", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"].startswith('W/"')
+        assert response.json()["content"] == content.strip()
+
+
+class TestSnapshotFile:
+    """Bad or missing files never break requests."""
+
+    def test_missing_file_disables_snapshot(self, tmp_path):
+        snapshot = CatalogSnapshot(str(tmp_path / "missing.snapshot"), 0.0)
+        assert snapshot.get("roadmaps") is None
+        assert snapshot.stats()["loaded"] == 0
+
+    def test_corrupt_replacement_keeps_previous(self, tmp_path):
+        path = tmp_path / "catalog.snapshot"
+        write_snapshot(_catalog(tmp_path), path)
+        snapshot = CatalogSnapshot(str(path), 0.0)
+        assert snapshot.get("roadmaps") is not None
+        path.write_bytes(b"not a snapshot at all")
+        assert snapshot.get("roadmaps") is not None
@@ -0,0 +1,136 @@
+"""
+Tests for the non-blocking Supabase query layer.
+
+Run: pytest tests/test_supabase.py -v
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from postgrest.exceptions import APIError
+
+from app.core import supabase as supabase_module
+from app.core.config import settings
+
+
+class _SlowQuery:
+    """Query stub whose execute() blocks the calling thread."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def execute(self):
+        time.sleep(self.delay)
+        return "ok"
+
+
+class TestExecute:
+    """execute() should run queries off the event loop within the pool bound."""
+
+    def setup_method(self):
+        supabase_module._limiter = None
+
+    def teardown_method(self):
+        supabase_module._limiter = None
+
+    def test_returns_query_result(self):
+        result = asyncio.run(supabase_module.execute(_SlowQuery(0)))
+        assert result == "ok"
+
+    def test_concurrent_queries_overlap(self):
+        async def run():
+            start = time.perf_counter()
+            await asyncio.gather(*(supabase_module.execute(_SlowQuery(0.1)) for _ in range(5)))
+            return time.perf_counter() - start
+
+        assert asyncio.run(run()) < 0.3
+
+    def test_pool_size_bounds_concurrency(self, monkeypatch):
+        monkeypatch.setattr(settings, "supabase_max_workers", 1)
+
+        async def run():
+            start = time.perf_counter()
+            await asyncio.gather(*(supabase_module.execute(_SlowQuery(0.05)) for _ in range(4)))
+            return time.perf_counter() - start
+
+        assert asyncio.run(run()) >= 0.2
+
+
+class _FlakyQuery:
+    """Query stub failing with `error` for its first `failures` calls."""
+
+    def __init__(self, error: Exception, failures: int, method: str = "GET"):
+        self.request = SimpleNamespace(path="/rest/v1/nodes", http_method=method, retry_enabled=True)
+        self.error = error
+        self.failures = failures
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "ok"
+
+
+class TestRetries:
+    """Idempotent reads are retried on transient errors; writes never are."""
+
+    @pytest.fixture(autouse=True)
+    def fast_backoff(self, monkeypatch):
+        supabase_module._limiter = None
+        monkeypatch.setattr(settings, "supabase_read_retries", 2)
+        monkeypatch.setattr(settings, "supabase_retry_backoff", 0.001)
+        yield
+        supabase_module._limiter = None
+
+    def test_read_retried_after_timeout(self):
+        query = _FlakyQuery(httpx.ReadTimeout("slow"), failures=2)
+        assert asyncio.run(supabase_module.execute(query)) == "ok"
+        assert query.calls == 3
+        # The library's own blocking retry is disabled in favour of ours
+        assert query.request.retry_enabled is False
+
+    def test_gives_up_after_limit(self):
+        query = _FlakyQuery(httpx.ConnectError("down"), failures=5)
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(supabase_module.execute(query))
+        assert query.calls == 3
+
+    def test_gateway_error_retried(self):
+        query = _FlakyQuery(APIError({"message": "bad gateway", "code": 503}), failures=1)
+        assert asyncio.run(supabase_module.execute(query)) == "ok"
+
+    def test_writes_and_client_errors_not_retried(self):
+        write = _FlakyQuery(httpx.ReadTimeout("slow"), failures=1, method="POST")
+        with pytest.raises(httpx.ReadTimeout):
+            asyncio.run(supabase_module.execute(write))
+        assert write.calls == 1
+
+        invalid = _FlakyQuery(APIError({"message": "bad filter", "code": "PGRST100"}), failures=1)
+        with pytest.raises(APIError):
+            asyncio.run(supabase_module.execute(invalid))
+        assert invalid.calls == 1
+
+
+class TestClientTransport:
+    """The client is built on a pooled, tuned HTTP transport."""
+
+    def test_http_client_uses_settings(self, monkeypatch):
+        monkeypatch.setattr(settings, "supabase_connect_timeout", 1.5)
+        monkeypatch.setattr(settings, "supabase_write_timeout", 30.0)
+        monkeypatch.setattr(settings, "supabase_pool_max_connections", 7)
+        client = supabase_module._create_http_client()
+        assert client.timeout.connect == 1.5
+        assert client.timeout.write == 30.0
+        assert client._transport._pool._max_connections == 7
+        client.close()
+
+    def test_fork_drops_inherited_client(self, monkeypatch):
+        monkeypatch.setattr(supabase_module, "_create_client", lambda: object())
+        supabase_module.get_supabase.cache_clear()
+        parent = supabase_module.get_supabase()
+        supabase_module._reset_after_fork()
+        assert supabase_module.get_supabase() is not parent
+        supabase_module.get_supabase.cache_clear()
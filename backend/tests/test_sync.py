@@ -0,0 +1,137 @@
+"""
+Tests for the bulk offline sync endpoint.
+
+Run: pytest tests/test_sync.py -v
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.config import settings
+from benchmarks.fake_supabase import FakeQuery
+from tests.conftest import USER_ID
+
+PATH = "/api/v1/sync"
+
+
+def _progress(node_id, status, at):
+    return {"user_id": USER_ID, "node_id": node_id, "status": status, "updated_at": at}
+
+
+@pytest.fixture
+def client(client, fake_supabase, monkeypatch):
+    monkeypatch.setattr(settings, "sync_watermark_lag", 0)
+    fake_supabase.tables["user_progress"] = [
+        _progress("git-1", "in_progress", "2026-03-01T10:00:00+00:00"),
+        _progress("git-2", "completed", "2026-03-01T10:00:00+00:00"),
+        {**_progress("git-9", "completed", "2026-03-02T10:00:00+00:00"), "user_id": "someone-else"},
+    ]
+    fake_supabase.tables["notes"] = [
+        {"id": "notes-1", "user_id": USER_ID, "node_id": "git-1", "content": "server",
+         "version": 2, "updated_at": "2026-03-01T10:00:00+00:00"},
+    ]
+    return client
+
+
+class TestSync:
+    """Last-writer-wins merge and changes since the sync token."""
+
+    def test_merges_last_writer_wins(self, client, fake_supabase):
+        response = client.post(PATH, json={
+            "progress": [
+                {"node_id": "git-1", "status": "completed", "updated_at": "2026-03-01T11:00:00Z"},
+                {"node_id": "git-2", "status": "not_started", "updated_at": "2026-03-01T09:00:00Z"},
+                {"node_id": "git-3", "status": "in_progress", "updated_at": "2026-03-01T09:00:00Z"},
+            ],
+            "notes": [
+                {"node_id": "git-1", "content": "offline", "updated_at": "2026-03-01T09:30:00Z"},
+                {"node_id": "git-3", "content": "new note", "updated_at": "2026-03-01T09:30:00Z"},
+            ],
+        })
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["applied_progress"], body["applied_notes"]) == (2, 1)
+
+        stored = {row["node_id"]: row["status"] for row in fake_supabase.tables["user_progress"]
+                  if row["user_id"] == USER_ID}
+        assert stored == {"git-1": "completed", "git-2": "completed", "git-3": "in_progress"}
+
+        # Every row of this user is new to a client without a token
+        assert {row["node_id"]: row["status"] for row in body["progress"]} == stored
+        assert {row["node_id"]: row["content"] for row in body["notes"]} == {"git-1": "server", "git-3": "new note"}
+        assert body["sync_token"] and not body["has_more"]
+
+    def test_token_returns_only_new_changes(self, client, fake_supabase):
+        token = client.post(PATH, json={}).json()["sync_token"]
+
+        quiet = client.post(PATH, json={"sync_token": token}).json()
+        assert quiet["progress"] == [] and quiet["notes"] == []
+
+        # Another device writes; only that row comes back, plus a stale
+        # client item's winning server row
+        client.put("/api/v1/progress/git-4", json={"status": "completed"})
+        body = client.post(PATH, json={
+            "sync_token": token,
+            "progress": [{"node_id": "git-1", "status": "completed", "updated_at": "2026-01-01T00:00:00Z"}],
+        }).json()
+        assert sorted(row["node_id"] for row in body["progress"]) == ["git-1", "git-4"]
+        assert body["applied_progress"] == 0
+
+    def test_pages_through_large_backlog(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "sync_page_size", 1)
+        seen = []
+        token = None
+        for _ in range(5):
+            body = client.post(PATH, json={"sync_token": token}).json()
+            seen += [row["node_id"] for row in body["progress"]]
+            token = body["sync_token"]
+            if not body["has_more"]:
+                break
+        assert sorted(seen) == ["git-1", "git-2"]
+
+    def test_client_clock_clamped(self, client, fake_supabase):
+        client.post(PATH, json={
+            "progress": [{"node_id": "git-1", "status": "completed", "updated_at": "2099-01-01T00:00:00Z"}],
+        })
+        row = next(r for r in fake_supabase.tables["user_progress"] if r["node_id"] == "git-1")
+        assert datetime.fromisoformat(row["edited_at"]) <= datetime.now(timezone.utc)
+
+    def test_invalid_token(self, client):
+        assert client.post(PATH, json={"sync_token": "nope"}).status_code == 400
+        assert client.post(PATH, json={"sync_token": "bogus.x"}).status_code == 400
+
+    def test_reports_deletions(self, client, fake_supabase):
+        token = client.post(PATH, json={}).json()["sync_token"]
+        fake_supabase.tables["deleted_user_rows"] = [{
+            "user_id": USER_ID, "table_name": "notes", "node_id": "git-7",
+            "deleted_at": datetime.now(timezone.utc).isoformat(),
+        }]
+        body = client.post(PATH, json={"sync_token": token}).json()
+        assert [row["node_id"] for row in body["deleted_notes"]] == ["git-7"]
+        assert body["deleted_progress"] == []
+
+    def test_idle_tombstone_token_resyncs(self, client, monkeypatch):
+        filters = []
+        gt, or_ = FakeQuery.gt, FakeQuery.or_
+
+        def record_gt(query, column, value):
+            filters.append(f"{column}=gt.{value}")
+            return gt(query, column, value)
+
+        def record_or(query, expr):
+            filters.append(f"or=({expr})")
+            return or_(query, expr)
+
+        monkeypatch.setattr(FakeQuery, "gt", record_gt)
+        monkeypatch.setattr(FakeQuery, "or_", record_or)
+
+        # No deletions: the tombstone watermarks advance to the sync time
+        token = client.post(PATH, json={}).json()["sync_token"]
+        filters.clear()
+        response = client.post(PATH, json={"sync_token": token})
+        assert response.status_code == 200
+
+        tombstone_filters = [f for f in filters if "deleted_at" in f]
+        assert len(tombstone_filters) == 2
+        assert all(f.startswith("deleted_at=gt.") for f in tombstone_filters)
+        assert not any("node_id.gt.\"\"" in f for f in filters)
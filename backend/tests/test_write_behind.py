@@ -0,0 +1,111 @@
+"""
+Tests for the note autosave write-behind buffer.
+
+Run: pytest tests/test_write_behind.py -v
+"""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.write_behind import WriteBehindBuffer, note_buffer
+from tests.conftest import USER_ID
+
+
+def _buffer(delay=60.0, max_delay=600.0, max_pending=100):
+    return WriteBehindBuffer("notes", ("user_id", "node_id"), delay, max_delay, max_pending)
+
+
+def _save(content, node_id="git-1", at="2026-01-01T00:00:00"):
+    return {"user_id": USER_ID, "node_id": node_id, "content": content, "updated_at": at}
+
+
+class TestWriteBehindBuffer:
+    """Bursts of saves become one write-through plus one flush."""
+
+    def test_burst_coalesced(self, fake_supabase):
+        buffer = _buffer()
+
+        async def main():
+            first = await buffer.write(_save("v0"))
+            for version in range(1, 5):
+                latest = await buffer.write(_save(f"v{version}"))
+            return first, latest
+
+        first, latest = asyncio.run(main())
+        assert first["content"] == "v0" and latest["content"] == "v4"
+        assert latest["id"] == first["id"]
+        assert fake_supabase.executed == 1
+        assert fake_supabase.tables["notes"][0]["content"] == "v0"
+        # Read-your-writes before the flush
+        assert buffer.get(USER_ID, "git-1")["content"] == "v4"
+        assert buffer.overlay(fake_supabase.tables["notes"])[0]["content"] == "v4"
+
+        asyncio.run(buffer.flush_all())
+        assert fake_supabase.executed == 2
+        assert fake_supabase.tables["notes"][0]["content"] == "v4"
+        assert len(buffer) == 0
+        assert buffer.stats()["coalesced"] == 4
+
+    def test_flushed_after_quiet_window(self, fake_supabase):
+        buffer = _buffer(delay=0.01, max_delay=1.0)
+
+        async def main():
+            await buffer.write(_save("v0"))
+            await buffer.write(_save("v1"))
+            await asyncio.sleep(0.05)
+
+        asyncio.run(main())
+        assert fake_supabase.tables["notes"][0]["content"] == "v1"
+        assert len(buffer) == 0
+
+    def test_zero_delay_writes_through(self, fake_supabase):
+        buffer = _buffer(delay=0)
+
+        async def main():
+            for version in range(3):
+                await buffer.write(_save(f"v{version}"))
+
+        asyncio.run(main())
+        assert fake_supabase.executed == 3
+        assert len(buffer) == 0
+
+    def test_failed_flush_keeps_latest(self, fake_supabase, monkeypatch):
+        buffer = _buffer()
+
+        async def main():
+            await buffer.write(_save("v0"))
+            await buffer.write(_save("v1"))
+
+        asyncio.run(main())
+
+        async def down(rows):
+            raise RuntimeError("upstream down")
+
+        monkeypatch.setattr(buffer, "_upsert", down)
+        asyncio.run(buffer.flush_all())
+        assert buffer.get(USER_ID, "git-1")["content"] == "v1"
+        assert buffer.stats()["flush_errors"] == 1
+
+
+class TestNotesEndpoint:
+    """PUT /notes buffers, GET reads the buffer, shutdown flushes."""
+
+    @pytest.fixture(autouse=True)
+    def long_window(self, monkeypatch):
+        monkeypatch.setattr(settings, "debug", True)
+        monkeypatch.setattr(note_buffer, "delay", 60.0)
+
+    def test_read_your_writes_and_shutdown_flush(self, fake_supabase):
+        from main import app
+
+        with TestClient(app, headers={"X-User-Id": USER_ID}) as client:
+            for content in ("draft", "draft two", "final"):
+                assert client.put("/api/v1/notes/git-1", json={"content": content}).status_code == 200
+            assert fake_supabase.tables["notes"][0]["content"] == "draft"
+            assert client.get("/api/v1/notes/git-1").json()["content"] == "final"
+            assert client.get("/api/v1/notes").json()["items"][0]["content"] == "final"
+
+        assert fake_supabase.tables["notes"][0]["content"] == "final"
+        assert len(note_buffer) == 0
@@ -146,12 +146,32 @@ class ApiClient {
         }
     }
 
+    // Search - ranked node hits: [{ id, roadmap_id, title, snippet, highlights }]
+    // highlights are [start, end) ranges within snippet. Returns [] when the
+    // backend is unreachable.
+    async searchNodes(query, { roadmapId = null, limit = 20 } = {}) {
+        try {
+            const params = new URLSearchParams({ q: query, limit: String(limit) })
+            if (roadmapId) params.set('roadmap_id', roadmapId)
+            return await this.request(`/api/v1/search?${params}`)
+        } catch {
+            return []
+        }
+    }
+
     // Progress - silent fail, uses localStorage in frontend
-    async getProgress() {
+    // Returns the first page ({ items, next_cursor }); pass next_cursor to continue.
+    // With since (a previous next_since, or '' to start), returns the change
+    // feed instead: { items, deleted, next_since, has_more }
+    async getProgress(cursor = null, since = null) {
         try {
-            return await this.request('/api/v1/progress')
+            const params = new URLSearchParams()
+            if (cursor) params.set('cursor', cursor)
+            if (since !== null) params.set('since', since)
+            const query = params.toString() ? `?${params}` : ''
+            return await this.request(`/api/v1/progress${query}`)
         } catch {
-            return {}
+            return { items: [], next_cursor: null }
         }
     }
 
@@ -176,9 +196,27 @@ class ApiClient {
     }
 
     // Notes - silent fail, uses localStorage in frontend
-    async getNotes() {
+    // Returns the first page ({ items, next_cursor }); pass next_cursor to continue.
+    // With since (a previous next_since, or '' to start), returns the change
+    // feed instead: { items, deleted, next_since, has_more }
+    async getNotes(cursor = null, since = null) {
+        try {
+            const params = new URLSearchParams()
+            if (cursor) params.set('cursor', cursor)
+            if (since !== null) params.set('since', since)
+            const query = params.toString() ? `?${params}` : ''
+            return await this.request(`/api/v1/notes${query}`)
+        } catch {
+            return { items: [], next_cursor: null }
+        }
+    }
+
+    // Ranked note hits: [{ node_id, node_title, snippet, highlights }]; the
+    // full note is fetched with getNote() when opened
+    async searchNotes(query, limit = 20) {
         try {
-            return await this.request('/api/v1/notes')
+            const params = new URLSearchParams({ q: query, limit: String(limit) })
+            return await this.request(`/api/v1/notes/search?${params}`)
         } catch {
             return []
         }
@@ -204,6 +242,80 @@ class ApiClient {
         }
     }
 
+    // Offline sync - one request reconciles local progress/notes with the server.
+    // progress: [{ node_id, status, updated_at }], notes: [{ node_id, content, updated_at }]
+    // Returns server changes and deletions since syncToken and the next
+    // sync_token; call again while has_more is true. Returns null when the
+    // backend is unreachable.
+    async sync({ syncToken = null, progress = [], notes = [] } = {}) {
+        try {
+            return await this.request('/api/v1/sync', {
+                method: 'POST',
+                body: JSON.stringify({ sync_token: syncToken, progress, notes })
+            })
+        } catch {
+            return null
+        }
+    }
+
+    // Live updates - calls onEvent({ type: 'progress' | 'note', data }) for
+    // changes made on other devices. Uses fetch rather than EventSource,
+    // which cannot send the auth headers. Reconnects after the delay the
+    // server announces; after a reconnect, catch up with getProgress(null, since)
+    // and getNotes(null, since). Returns a function that closes the stream.
+    subscribeEvents(onEvent) {
+        const controller = new AbortController()
+        let retryMs = 3000
+
+        const handle = (block) => {
+            const data = []
+            for (const line of block.split('\n')) {
+                if (line.startsWith('retry:')) retryMs = parseInt(line.slice(6), 10) || retryMs
+                else if (line.startsWith('data:')) data.push(line.slice(5).trimStart())
+            }
+            if (data.length) {
+                try {
+                    onEvent(JSON.parse(data.join('\n')))
+                } catch {
+                    // Ignore malformed events
+                }
+            }
+        }
+
+        const connect = async () => {
+            while (!controller.signal.aborted) {
+                try {
+                    const response = await fetch(`${this.baseUrl}/api/v1/events`, {
+                        headers: { ...this.getHeaders(), Accept: 'text/event-stream' },
+                        signal: controller.signal
+                    })
+                    if (response.ok && response.body) {
+                        const reader = response.body.getReader()
+                        const decoder = new TextDecoder()
+                        let buffer = ''
+                        for (;;) {
+                            const { done, value } = await reader.read()
+                            if (done) break
+                            buffer += decoder.decode(value, { stream: true })
+                            let end
+                            while ((end = buffer.indexOf('\n\n')) !== -1) {
+                                handle(buffer.slice(0, end))
+                                buffer = buffer.slice(end + 2)
+                            }
+                        }
+                    }
+                } catch {
+                    // Network error or aborted; retried below unless closed
+                }
+                if (controller.signal.aborted) break
+                await new Promise((resolve) => setTimeout(resolve, retryMs))
+            }
+        }
+
+        connect()
+        return () => controller.abort()
+    }
+
     // User Journey
     async getJourney() {
         try {
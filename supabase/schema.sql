@@ -37,6 +37,7 @@ CREATE TABLE IF NOT EXISTS nodes (
   tldr TEXT,
   why_matters TEXT,
   common_mistakes TEXT,
+  content_hash TEXT,  -- SHA-256 of seeded columns, see backend/scripts/seeding.py
   created_at TIMESTAMPTZ DEFAULT NOW()
 );
 
@@ -46,6 +47,7 @@ CREATE TABLE IF NOT EXISTS user_progress (
   node_id UUID REFERENCES nodes(id) ON DELETE CASCADE,
   status TEXT CHECK (status IN ('not_started', 'in_progress', 'completed')) DEFAULT 'not_started',
   updated_at TIMESTAMPTZ DEFAULT NOW(),
+  edited_at TIMESTAMPTZ,  -- client edit time for last-writer-wins sync
   PRIMARY KEY (user_id, node_id)
 );
 
@@ -55,7 +57,9 @@ CREATE TABLE IF NOT EXISTS notes (
   user_id UUID REFERENCES users(id) ON DELETE CASCADE,
   node_id UUID REFERENCES nodes(id) ON DELETE CASCADE,
   content TEXT,
+  version INTEGER NOT NULL DEFAULT 1,  -- bumped on content change, see bump_note_version()
   updated_at TIMESTAMPTZ DEFAULT NOW(),
+  edited_at TIMESTAMPTZ,  -- client edit time for last-writer-wins sync
   UNIQUE (user_id, node_id)
 );
 
@@ -66,6 +70,8 @@ CREATE INDEX IF NOT EXISTS idx_user_progress_user_id ON user_progress(user_id);
 CREATE INDEX IF NOT EXISTS idx_user_progress_node_id ON user_progress(node_id);
 CREATE INDEX IF NOT EXISTS idx_notes_user_id ON notes(user_id);
 CREATE INDEX IF NOT EXISTS idx_notes_node_id ON notes(node_id);
+CREATE INDEX IF NOT EXISTS idx_user_progress_user_updated ON user_progress(user_id, updated_at, node_id);
+CREATE INDEX IF NOT EXISTS idx_notes_user_updated ON notes(user_id, updated_at, node_id);
 
 -- Row Level Security policies
 ALTER TABLE users ENABLE ROW LEVEL SECURITY;
@@ -294,3 +300,213 @@ CREATE POLICY "Anyone can submit roadmap requests" ON roadmap_requests
 CREATE POLICY "Roadmap requests are viewable" ON roadmap_requests 
   FOR SELECT USING (true);
 
+
+-- ============================================
+-- ROADMAP NODE COUNTS VIEW
+-- ============================================
+
+-- Total nodes per roadmap, read in a single query by the journey endpoint
+CREATE OR REPLACE VIEW roadmap_node_counts AS
+SELECT roadmap_id, COUNT(*)::INTEGER AS total_count
+FROM nodes
+GROUP BY roadmap_id;
+
+
+-- ============================================
+-- USER ROADMAP PROGRESS SUMMARY
+-- ============================================
+
+-- Per-user counts per roadmap, kept current by a trigger on user_progress.
+-- Read by the journey endpoint; verified by scripts/reconcile_progress_summary.py
+CREATE TABLE IF NOT EXISTS user_roadmap_progress (
+  user_id UUID REFERENCES users(id) ON DELETE CASCADE,
+  roadmap_id UUID REFERENCES roadmaps(id) ON DELETE CASCADE,
+  completed_count INTEGER NOT NULL DEFAULT 0,
+  in_progress_count INTEGER NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ DEFAULT NOW(),
+  PRIMARY KEY (user_id, roadmap_id)
+);
+
+ALTER TABLE user_roadmap_progress ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own progress summary" ON user_roadmap_progress
+  FOR SELECT USING (auth.uid() = user_id);
+
+-- Apply the status transition of one user_progress row to its roadmap's
+-- summary. A row is created on the first progress write in a roadmap.
+CREATE OR REPLACE FUNCTION public.apply_user_roadmap_progress()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER SET search_path = public
+AS $$
+DECLARE
+  row_user UUID;
+  row_node UUID;
+  old_status TEXT;
+  new_status TEXT;
+  target_roadmap UUID;
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    row_user := NEW.user_id; row_node := NEW.node_id; new_status := NEW.status;
+  ELSIF TG_OP = 'DELETE' THEN
+    row_user := OLD.user_id; row_node := OLD.node_id; old_status := OLD.status;
+  ELSE
+    IF NEW.status IS NOT DISTINCT FROM OLD.status THEN
+      RETURN NULL;
+    END IF;
+    row_user := NEW.user_id; row_node := NEW.node_id;
+    old_status := OLD.status; new_status := NEW.status;
+  END IF;
+
+  SELECT roadmap_id INTO target_roadmap FROM nodes WHERE id = row_node;
+  IF target_roadmap IS NULL THEN
+    -- The node is already gone (its progress rows are deleted by cascade),
+    -- so the roadmap is unknown: recount the user's summaries from the
+    -- progress rows whose nodes remain
+    UPDATE user_roadmap_progress AS summary SET
+      completed_count = (
+        SELECT COUNT(*) FROM user_progress p JOIN nodes n ON n.id = p.node_id
+        WHERE p.user_id = row_user AND n.roadmap_id = summary.roadmap_id AND p.status = 'completed'
+      ),
+      in_progress_count = (
+        SELECT COUNT(*) FROM user_progress p JOIN nodes n ON n.id = p.node_id
+        WHERE p.user_id = row_user AND n.roadmap_id = summary.roadmap_id AND p.status = 'in_progress'
+      ),
+      updated_at = NOW()
+    WHERE summary.user_id = row_user;
+    RETURN NULL;
+  END IF;
+
+  INSERT INTO user_roadmap_progress AS summary (user_id, roadmap_id, completed_count, in_progress_count)
+  VALUES (
+    row_user,
+    target_roadmap,
+    (CASE WHEN new_status = 'completed' THEN 1 ELSE 0 END) - (CASE WHEN old_status = 'completed' THEN 1 ELSE 0 END),
+    (CASE WHEN new_status = 'in_progress' THEN 1 ELSE 0 END) - (CASE WHEN old_status = 'in_progress' THEN 1 ELSE 0 END)
+  )
+  ON CONFLICT (user_id, roadmap_id) DO UPDATE SET
+    completed_count = summary.completed_count + EXCLUDED.completed_count,
+    in_progress_count = summary.in_progress_count + EXCLUDED.in_progress_count,
+    updated_at = NOW();
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS on_user_progress_changed ON user_progress;
+CREATE TRIGGER on_user_progress_changed
+  AFTER INSERT OR UPDATE OF status OR DELETE ON user_progress
+  FOR EACH ROW EXECUTE FUNCTION public.apply_user_roadmap_progress();
+
+-- Note versions for optimistic concurrency on PATCH /notes/{node_id}
+CREATE OR REPLACE FUNCTION public.bump_note_version()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  IF NEW.content IS DISTINCT FROM OLD.content AND NEW.version <= OLD.version THEN
+    NEW.version := OLD.version + 1;
+  END IF;
+  RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS on_note_updated ON notes;
+CREATE TRIGGER on_note_updated
+  BEFORE UPDATE ON notes
+  FOR EACH ROW EXECUTE FUNCTION public.bump_note_version();
+
+-- Tombstones for the per-user change feed (GET /progress?since=, /notes?since=, /sync)
+-- No foreign key on user_id: rows deleted by a cascade from users are
+-- tombstoned while that user row is going away
+CREATE TABLE IF NOT EXISTS deleted_user_rows (
+  user_id UUID NOT NULL,
+  table_name TEXT NOT NULL CHECK (table_name IN ('user_progress', 'notes')),
+  node_id UUID NOT NULL,
+  deleted_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  PRIMARY KEY (user_id, table_name, node_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_deleted_user_rows_since
+  ON deleted_user_rows(user_id, table_name, deleted_at, node_id);
+
+ALTER TABLE deleted_user_rows ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view own tombstones" ON deleted_user_rows
+  FOR SELECT USING (auth.uid() = user_id);
+
+CREATE OR REPLACE FUNCTION public.track_user_row_deletion()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER SET search_path = public
+AS $$
+BEGIN
+  IF TG_OP = 'DELETE' THEN
+    INSERT INTO deleted_user_rows (user_id, table_name, node_id)
+    VALUES (OLD.user_id, TG_TABLE_NAME, OLD.node_id)
+    ON CONFLICT (user_id, table_name, node_id) DO UPDATE SET deleted_at = NOW();
+  ELSE
+    DELETE FROM deleted_user_rows
+    WHERE user_id = NEW.user_id AND table_name = TG_TABLE_NAME AND node_id = NEW.node_id;
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS on_user_progress_tombstone ON user_progress;
+CREATE TRIGGER on_user_progress_tombstone
+  AFTER INSERT OR DELETE ON user_progress
+  FOR EACH ROW EXECUTE FUNCTION public.track_user_row_deletion();
+
+DROP TRIGGER IF EXISTS on_notes_tombstone ON notes;
+CREATE TRIGGER on_notes_tombstone
+  AFTER INSERT OR DELETE ON notes
+  FOR EACH ROW EXECUTE FUNCTION public.track_user_row_deletion();
+
+CREATE OR REPLACE FUNCTION public.prune_deleted_user_rows(retention INTERVAL)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+  WITH pruned AS (
+    DELETE FROM deleted_user_rows WHERE deleted_at < NOW() - retention RETURNING 1
+  )
+  SELECT COUNT(*)::INTEGER FROM pruned;
+$$;
+
+-- Full-text search over a user's notes (GET /notes/search). Expression
+-- index rather than a stored tsvector column, so `select *` stays lean
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+
+CREATE INDEX IF NOT EXISTS idx_notes_user_search
+  ON notes USING GIN (user_id, to_tsvector('english', COALESCE(content, '')));
+
+-- Ranked hits for a to_tsquery() expression, with node titles and a
+-- snippet whose matches are wrapped in chr(2) ... chr(3). SECURITY INVOKER:
+-- callers other than the service role only ever see their own notes (RLS).
+CREATE OR REPLACE FUNCTION public.search_notes(p_user_id UUID, p_query TEXT, p_limit INTEGER DEFAULT 20)
+RETURNS TABLE (node_id UUID, node_title TEXT, rank REAL, snippet TEXT, updated_at TIMESTAMPTZ)
+LANGUAGE sql
+STABLE
+AS $$
+  WITH query AS (
+    SELECT to_tsquery('english', p_query) AS q
+  ),
+  hits AS (
+    SELECT notes.node_id, notes.content, notes.updated_at,
+           ts_rank_cd(to_tsvector('english', COALESCE(notes.content, '')), query.q, 32) AS rank
+    FROM notes, query
+    WHERE notes.user_id = p_user_id
+      AND to_tsvector('english', COALESCE(notes.content, '')) @@ query.q
+    ORDER BY rank DESC, notes.updated_at DESC
+    LIMIT p_limit
+  )
+  -- Headlines only for the returned page
+  SELECT hits.node_id, nodes.title, hits.rank,
+         ts_headline('english', hits.content, query.q,
+                     'StartSel="' || chr(2) || '", StopSel="' || chr(3) || '", '
+                     || 'MaxFragments=2, MaxWords=24, MinWords=8, FragmentDelimiter=" … "'),
+         hits.updated_at
+  FROM hits
+  CROSS JOIN query
+  LEFT JOIN nodes ON nodes.id = hits.node_id
+  ORDER BY hits.rank DESC, hits.updated_at DESC;
+$$;